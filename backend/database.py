@@ -1,9 +1,10 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import StaticPool
 import os
-from typing import Generator
+from typing import Generator, List, Tuple
 import redis
+import redis.asyncio
 from models.base import Base
 import logging
 
@@ -27,6 +28,9 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 # Redis 클라이언트 생성
 redis_client = redis.Redis.from_url(REDIS_URL, decode_responses=True)
 
+# Pub/Sub 등 비동기 작업용 Redis 클라이언트 (지연 생성)
+async_redis_client = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -40,6 +44,98 @@ def create_tables():
         raise
 
 
+# 기존 데이터베이스에 모델 변경 반영 (create_all은 이미 있는 테이블을 바꾸지 않음)
+# 각 항목은 (설명, SQL 목록)이고 모든 SQL은 여러 번 실행해도 결과가 같아야 함
+SCHEMA_MIGRATIONS: List[Tuple[str, List[str]]] = [
+    ("user_items 아이템별 한 행", [
+        # 중복 행의 수량을 가장 먼저 만든 행으로 합친 뒤 나머지 삭제
+        """
+        UPDATE user_items AS keep SET quantity = dup.total
+        FROM (
+            SELECT MIN(id) AS keep_id, SUM(COALESCE(quantity, 0)) AS total
+            FROM user_items GROUP BY user_id, item_id HAVING COUNT(*) > 1
+        ) AS dup
+        WHERE keep.id = dup.keep_id
+        """,
+        """
+        DELETE FROM user_items AS dup USING user_items AS keep
+        WHERE dup.user_id = keep.user_id AND dup.item_id = keep.item_id AND dup.id > keep.id
+        """,
+        # ON CONFLICT (user_id, item_id) 대상 (새 DB는 모델의 유니크 제약이 같은 이름으로 생성)
+        "CREATE UNIQUE INDEX IF NOT EXISTS uq_user_items_user_item ON user_items (user_id, item_id)",
+    ]),
+    ("game_sessions Redis 방 ID 및 리더보드 반영 표시", [
+        # room_id: game_rooms UUID 외래 키 → Redis 방 ID 문자열
+        """
+        DO $$
+        DECLARE fk record;
+        BEGIN
+            IF EXISTS (
+                SELECT 1 FROM information_schema.columns
+                WHERE table_name = 'game_sessions' AND column_name = 'room_id' AND data_type = 'uuid'
+            ) THEN
+                FOR fk IN
+                    SELECT conname FROM pg_constraint
+                    WHERE conrelid = 'game_sessions'::regclass AND contype = 'f'
+                      AND confrelid = 'game_rooms'::regclass
+                LOOP
+                    EXECUTE format('ALTER TABLE game_sessions DROP CONSTRAINT IF EXISTS %I', fk.conname);
+                END LOOP;
+                ALTER TABLE game_sessions ALTER COLUMN room_id TYPE VARCHAR(64) USING room_id::text;
+                ALTER TABLE game_sessions ALTER COLUMN room_id DROP NOT NULL;
+            END IF;
+        END $$
+        """,
+        # 컬럼이 새로 생길 때 기존 게임은 이미 반영된 것으로 두고 (재처리 대상 아님), 이후 기본값은 false
+        "ALTER TABLE game_sessions ADD COLUMN IF NOT EXISTS leaderboard_applied BOOLEAN NOT NULL DEFAULT TRUE",
+        "ALTER TABLE game_sessions ALTER COLUMN leaderboard_applied SET DEFAULT FALSE",
+        "CREATE INDEX IF NOT EXISTS idx_game_sessions_leaderboard_pending ON game_sessions (ended_at) WHERE NOT leaderboard_applied",
+    ]),
+    ("korean_dictionary 힌트 커버링 인덱스 및 syllable_stats 구체화 뷰", [
+        """
+        CREATE INDEX IF NOT EXISTS idx_korean_dictionary_first_char_freq
+            ON korean_dictionary (first_char, frequency_score DESC) INCLUDE (word)
+        """,
+        # 글자별 시작/끝 단어 수 (사전 변경 알림 때 WordValidator가 CONCURRENTLY로 갱신)
+        """
+        CREATE MATERIALIZED VIEW IF NOT EXISTS syllable_stats AS
+        WITH starts AS (
+            SELECT first_char AS syllable, COUNT(*) AS start_count
+            FROM korean_dictionary
+            GROUP BY first_char
+        ),
+        ends AS (
+            SELECT last_char AS syllable, COUNT(*) AS end_count
+            FROM korean_dictionary
+            GROUP BY last_char
+        )
+        SELECT
+            COALESCE(s.syllable, e.syllable) AS syllable,
+            COALESCE(s.start_count, 0) AS start_count,
+            COALESCE(e.end_count, 0) AS end_count,
+            COALESCE(s.start_count, 0) = 0 AS dead_end
+        FROM starts s
+        FULL OUTER JOIN ends e ON s.syllable = e.syllable
+        """,
+        # CONCURRENTLY 갱신에 필요한 고유 인덱스
+        "CREATE UNIQUE INDEX IF NOT EXISTS idx_syllable_stats_syllable ON syllable_stats (syllable)",
+    ]),
+]
+
+# 여러 프로세스가 동시에 시작해도 마이그레이션은 하나씩 실행
+MIGRATION_LOCK_KEY = "kkua:schema_migration"
+
+
+def migrate_schema():
+    """기존 테이블에 스키마 변경 적용 (항목별 트랜잭션)"""
+    for description, statements in SCHEMA_MIGRATIONS:
+        with engine.begin() as conn:
+            conn.execute(text("SELECT pg_advisory_xact_lock(hashtext(:key))"), {"key": MIGRATION_LOCK_KEY})
+            for statement in statements:
+                conn.execute(text(statement))
+        logger.debug(f"스키마 마이그레이션 확인: {description}")
+
+
 def get_db() -> Generator[Session, None, None]:
     """데이터베이스 세션 의존성"""
     db = SessionLocal()
@@ -58,12 +154,19 @@ def get_redis() -> redis.Redis:
     return redis_client
 
 
+def get_async_redis() -> redis.asyncio.Redis:
+    """비동기 Redis 클라이언트 반환"""
+    global async_redis_client
+    if async_redis_client is None:
+        async_redis_client = redis.asyncio.Redis.from_url(REDIS_URL, decode_responses=True)
+    return async_redis_client
+
+
 async def test_connections():
     """데이터베이스와 Redis 연결 테스트"""
     try:
         # PostgreSQL 연결 테스트
         db = SessionLocal()
-        from sqlalchemy import text
         db.execute(text("SELECT 1"))
         db.close()
         logger.info("PostgreSQL 연결 성공")
@@ -84,6 +187,9 @@ def init_database():
         # 테이블 생성
         create_tables()
         
+        # 기존 테이블에 모델 변경 반영
+        migrate_schema()
+        
         # 기본 데이터 삽입 (아이템, 한국어 단어 등)
         from scripts.init_data import main as insert_initial_data
         insert_initial_data()
@@ -27,7 +27,7 @@ CREATE TABLE IF NOT EXISTS game_rooms (
 -- 게임 세션 테이블
 CREATE TABLE IF NOT EXISTS game_sessions (
     id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
-    room_id UUID REFERENCES game_rooms(id),
+    room_id VARCHAR(64), -- Redis 게임방 ID
     started_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     ended_at TIMESTAMP,
     winner_id INTEGER REFERENCES users(id),
@@ -35,7 +35,8 @@ CREATE TABLE IF NOT EXISTS game_sessions (
     total_words INTEGER DEFAULT 0,
     duration_ms BIGINT,
     game_data JSONB, -- 게임 상세 데이터
-    final_scores JSONB -- 최종 점수 정보
+    final_scores JSONB, -- 최종 점수 정보
+    leaderboard_applied BOOLEAN NOT NULL DEFAULT FALSE -- 리더보드/캐시/드롭 알림 반영 여부
 );
 
 -- 한국어 사전 테이블
@@ -52,6 +53,13 @@ CREATE TABLE IF NOT EXISTS korean_dictionary (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+-- 금지어 테이블 (단어 어디에든 포함되면 거절, 변경 후 publish_blocklist_update로 금지어 버전 갱신 시 재적재)
+CREATE TABLE IF NOT EXISTS forbidden_words (
+    id SERIAL PRIMARY KEY,
+    word VARCHAR(100) UNIQUE NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
 -- 아이템 정의 테이블
 CREATE TABLE IF NOT EXISTS items (
     id SERIAL PRIMARY KEY,
@@ -71,25 +79,33 @@ CREATE TABLE IF NOT EXISTS user_items (
     user_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
     item_id INTEGER REFERENCES items(id),
     quantity INTEGER DEFAULT 1,
-    acquired_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    acquired_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE (user_id, item_id) -- 아이템별 한 행 (수량으로 관리)
 );
 
 -- 게임 로그 테이블
+-- timestamp 기준 월별 범위 파티션 (game_logs_YYYYMM, 서버 시작 시 PartitionManager가 미리 생성하고
+-- AUDIT_LOG_RETENTION_DAYS가 지난 파티션은 통째로 삭제)
 CREATE TABLE IF NOT EXISTS game_logs (
-    id SERIAL PRIMARY KEY,
-    session_id UUID REFERENCES game_sessions(id) ON DELETE CASCADE,
-    user_id INTEGER REFERENCES users(id),
+    id SERIAL,
+    session_id UUID NOT NULL, -- 배치 기록 (세션/사용자 외래 키 없음)
+    user_id INTEGER,
     action_type VARCHAR(30) NOT NULL, -- word_submit, item_use, game_start 등
     action_data JSONB,
-    timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    round_number INTEGER
-);
+    timestamp TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    round_number INTEGER,
+    PRIMARY KEY (id, timestamp) -- 파티션 키는 기본 키에 포함
+) PARTITION BY RANGE (timestamp);
+
+-- 월별 파티션이 아직 없는 달의 행을 받는 기본 파티션 (월별 파티션을 만들 때 해당 달 행을 옮김)
+CREATE TABLE IF NOT EXISTS game_logs_default PARTITION OF game_logs DEFAULT;
 
 -- 단어 제출 기록
+-- submitted_at 기준 월별 범위 파티션 (word_submissions_YYYYMM, game_logs와 같은 방식으로 관리)
 CREATE TABLE IF NOT EXISTS word_submissions (
-    id SERIAL PRIMARY KEY,
-    session_id UUID REFERENCES game_sessions(id) ON DELETE CASCADE,
-    user_id INTEGER REFERENCES users(id),
+    id SERIAL,
+    session_id UUID NOT NULL, -- 배치 기록 (세션/사용자 외래 키 없음)
+    user_id INTEGER NOT NULL,
     word VARCHAR(100) NOT NULL,
     is_valid BOOLEAN NOT NULL,
     validation_reason VARCHAR(100), -- 검증 실패 이유
@@ -97,8 +113,11 @@ CREATE TABLE IF NOT EXISTS word_submissions (
     score_earned INTEGER DEFAULT 0,
     round_number INTEGER,
     turn_order INTEGER,
-    submitted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-);
+    submitted_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id, submitted_at)
+) PARTITION BY RANGE (submitted_at);
+
+CREATE TABLE IF NOT EXISTS word_submissions_default PARTITION OF word_submissions DEFAULT;
 
 -- 게임 참가자 테이블
 CREATE TABLE IF NOT EXISTS game_participants (
@@ -124,11 +143,13 @@ CREATE INDEX IF NOT EXISTS idx_game_rooms_created_by ON game_rooms(created_by);
 
 CREATE INDEX IF NOT EXISTS idx_game_sessions_room_id ON game_sessions(room_id);
 CREATE INDEX IF NOT EXISTS idx_game_sessions_started_at ON game_sessions(started_at);
+CREATE INDEX IF NOT EXISTS idx_game_sessions_leaderboard_pending ON game_sessions(ended_at) WHERE NOT leaderboard_applied;
 
 CREATE INDEX IF NOT EXISTS idx_korean_dictionary_word ON korean_dictionary(word);
 CREATE INDEX IF NOT EXISTS idx_korean_dictionary_first_char ON korean_dictionary(first_char);
 CREATE INDEX IF NOT EXISTS idx_korean_dictionary_last_char ON korean_dictionary(last_char);
 CREATE INDEX IF NOT EXISTS idx_korean_dictionary_difficulty ON korean_dictionary(difficulty_level);
+CREATE INDEX IF NOT EXISTS idx_korean_dictionary_first_char_freq ON korean_dictionary(first_char, frequency_score DESC) INCLUDE (word);
 
 CREATE INDEX IF NOT EXISTS idx_items_rarity ON items(rarity);
 CREATE INDEX IF NOT EXISTS idx_items_effect_type ON items(effect_type);
@@ -243,4 +264,26 @@ INSERT INTO korean_dictionary (word, definition, difficulty_level, frequency_sco
 ('모든', '전부의', 1, 85, '관형사', '모', '든', 2),
 ('든든', '믿음직한', 2, 60, '형용사', '든', '든', 2)
 
-ON CONFLICT (word) DO NOTHING;
\ No newline at end of file
+ON CONFLICT (word) DO NOTHING;
+
+-- 글자별 시작/끝 단어 수 (사전 변경 시 REFRESH MATERIALIZED VIEW CONCURRENTLY syllable_stats)
+CREATE MATERIALIZED VIEW IF NOT EXISTS syllable_stats AS
+WITH starts AS (
+    SELECT first_char AS syllable, COUNT(*) AS start_count
+    FROM korean_dictionary
+    GROUP BY first_char
+),
+ends AS (
+    SELECT last_char AS syllable, COUNT(*) AS end_count
+    FROM korean_dictionary
+    GROUP BY last_char
+)
+SELECT
+    COALESCE(s.syllable, e.syllable) AS syllable,
+    COALESCE(s.start_count, 0) AS start_count,
+    COALESCE(e.end_count, 0) AS end_count,
+    COALESCE(s.start_count, 0) = 0 AS dead_end -- 두음법칙 미반영
+FROM starts s
+FULL OUTER JOIN ends e ON s.syllable = e.syllable;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_syllable_stats_syllable ON syllable_stats(syllable);
@@ -0,0 +1,137 @@
+"""
+끄아(KKUA) V2 - 게임 엔진 프로세스
+WebSocket 연결 없이 담당 룸의 게임 로직, 단어 검증, 점수 계산, 타이머만 처리
+게이트웨이(KKUA_ROLE=gateway)가 전달한 게임 액션을 Redis 워커 채널로 수신
+파티션/리더보드 동기화/게임 기록 재처리 같은 단일 유지보수 작업은 0번 프로세스만 실행
+
+실행 예:
+    KKUA_ROLE=gateway uvicorn main:app --workers 2
+    python engine_main.py --workers 4
+"""
+
+import os
+import signal
+import asyncio
+import logging
+import argparse
+import multiprocessing
+from dotenv import load_dotenv
+
+# 환경 변수 로드
+load_dotenv()
+
+# 로깅 설정
+logging.basicConfig(
+    level=getattr(logging, os.getenv("LOG_LEVEL", "INFO")),
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+async def run_engine(maintenance: bool = True):
+    """엔진 워커 실행 (종료 신호까지 대기), maintenance가 아니면 프로세스별 작업만 실행"""
+    # 이벤트 루프가 필요한 모듈은 루프 안에서 임포트
+    from database import test_connections
+    from websocket.connection_manager import websocket_manager
+    from websocket.message_router import MessageRouter
+    from websocket.game_handler import get_game_handler
+    from websocket.room_affinity import get_room_affinity
+
+    if not await test_connections():
+        logger.error("데이터베이스/Redis 연결 실패")
+        return
+
+    from services.cache_service import get_cache_service
+    from services.word_validator import get_word_validator
+    from services.partition_manager import get_partition_manager
+    from services.audit_log_writer import get_audit_log_writer
+    from services.leaderboard_service import get_leaderboard_service
+    from services.game_finalizer import get_game_finalizer
+    cache_service = get_cache_service()
+    word_validator = get_word_validator()
+    partition_manager = get_partition_manager()
+    audit_log = get_audit_log_writer()
+    leaderboard = get_leaderboard_service()
+    game_finalizer = get_game_finalizer()
+    # L1 캐시 무효화 수신 (프로세스마다)
+    await cache_service.start()
+    # 사전 인덱스 적재 및 변경 신호 수신 (단어 검증은 프로세스마다 인덱스 필요)
+    if maintenance:
+        await cache_service.warmup_game_data()
+    else:
+        await word_validator.reload_dictionary()
+    await word_validator.start_watching()
+    # 이 프로세스의 감사 로그 배치 기록
+    await audit_log.start()
+    # 단일 유지보수: 파티션 관리, 리더보드 적재/동기화, 게임 기록 재시도/재처리
+    if maintenance:
+        await partition_manager.start()
+        await leaderboard.start()
+        await game_finalizer.start()
+
+    # 메시지 라우터 생성 시 전달 액션 핸들러가 등록됨
+    MessageRouter(websocket_manager)
+    affinity = get_room_affinity(websocket_manager)
+    await affinity.start()
+    await get_game_handler(websocket_manager).recover_turn_timers(room_filter=affinity.is_owner)
+
+    logger.info(f"게임 엔진 시작: node_id={affinity.node_id}, maintenance={maintenance}")
+
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop_event.set)
+    await stop_event.wait()
+
+    logger.info(f"게임 엔진 종료 중: node_id={affinity.node_id}")
+    await affinity.stop()
+    await websocket_manager.close_all_connections()
+    await word_validator.stop_watching()
+    await audit_log.stop()
+    await partition_manager.stop()
+    await game_finalizer.stop()
+    await leaderboard.stop()
+    if maintenance:
+        await cache_service.save_warm_snapshot()
+    await cache_service.stop()
+
+
+def _engine_process(index: int):
+    """엔진 프로세스 진입점"""
+    os.environ["KKUA_ROLE"] = "engine"
+    base_node_id = os.getenv("NODE_ID")
+    if base_node_id:
+        os.environ["NODE_ID"] = f"{base_node_id}-{index}"
+    asyncio.run(run_engine(maintenance=index == 0))
+
+
+def main():
+    """엔진 프로세스 실행 (코어 수만큼 병렬 실행 가능)"""
+    parser = argparse.ArgumentParser(description="끄아 게임 엔진 프로세스")
+    parser.add_argument(
+        "--workers", type=int,
+        default=int(os.getenv("ENGINE_WORKERS", "1")),
+        help="실행할 엔진 프로세스 수 (기본값: 1)"
+    )
+    args = parser.parse_args()
+
+    if args.workers <= 1:
+        _engine_process(0)
+        return
+
+    context = multiprocessing.get_context("spawn")
+    processes = [context.Process(target=_engine_process, args=(i,)) for i in range(args.workers)]
+    for process in processes:
+        process.start()
+
+    # 자식 프로세스는 각자 SIGTERM/SIGINT를 받아 정리
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        for process in processes:
+            process.join()
+
+
+if __name__ == "__main__":
+    main()
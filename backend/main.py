@@ -4,6 +4,7 @@ Pure WebSocket 아키텍처 기반 실시간 멀티플레이어 한국어 끝말
 """
 
 import os
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Depends
@@ -25,6 +26,35 @@ logger = logging.getLogger(__name__)
 from database import init_database, test_connections
 
 
+async def start_room_affinity():
+    """워커 하트비트 등록 및 전달 액션 수신 시작"""
+    from websocket.connection_manager import websocket_manager
+    from websocket.websocket_endpoint import websocket_protocol
+    from websocket.room_affinity import get_room_affinity
+    
+    # 전달된 액션을 처리할 메시지 라우터가 첫 연결 전에도 필요
+    if websocket_protocol.websocket_manager is None:
+        websocket_protocol.initialize(websocket_manager)
+    await get_room_affinity(websocket_manager).start()
+
+
+async def recover_turn_timers():
+    """Redis에 저장된 턴 타이머를 제한 시간 안에 복구 (이 워커가 담당하는 룸만)"""
+    from websocket.connection_manager import websocket_manager
+    from websocket.game_handler import get_game_handler
+    from websocket.room_affinity import get_room_affinity
+    
+    timeout = float(os.getenv("TIMER_RECOVERY_TIMEOUT", "10"))
+    try:
+        handler = get_game_handler(websocket_manager)
+        room_filter = get_room_affinity(websocket_manager).is_owner
+        await asyncio.wait_for(handler.recover_turn_timers(room_filter=room_filter), timeout=timeout)
+    except asyncio.TimeoutError:
+        logger.warning(f"턴 타이머 복구가 {timeout}초 안에 끝나지 않았습니다")
+    except Exception as e:
+        logger.error(f"턴 타이머 복구 중 오류: {e}")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """애플리케이션 생명주기 관리"""
@@ -42,6 +72,40 @@ async def lifespan(app: FastAPI):
         if os.getenv("INIT_DB", "true").lower() == "true":
             init_database()
         
+        # 노드 간 L1 캐시 무효화 수신
+        from services.cache_service import get_cache_service
+        await get_cache_service().start()
+        
+        # 사전 인덱스(블룸 필터, 자주 쓰는 단어, 힌트) 적재 및 인기 캐시 복원
+        await get_cache_service().warmup_game_data()
+        
+        # 사전 변경 신호 수신 (새 인덱스를 백그라운드에서 만든 뒤 교체)
+        from services.word_validator import get_word_validator
+        await get_word_validator().start_watching()
+        
+        # 감사 로그 월별 파티션 준비 및 보존 기간 정리 시작
+        from services.partition_manager import get_partition_manager
+        await get_partition_manager().start()
+        
+        # 단어 제출/아이템 사용 감사 로그 배치 기록 시작
+        from services.audit_log_writer import get_audit_log_writer
+        await get_audit_log_writer().start()
+        
+        # 리더보드 초기 적재 및 users 테이블 주기적 동기화 시작
+        from services.leaderboard_service import get_leaderboard_service
+        await get_leaderboard_service().start()
+        
+        # 종료된 게임 기록 재시도 처리 시작
+        from services.game_finalizer import get_game_finalizer
+        await get_game_finalizer().start()
+        
+        # 룸 담당 워커 라우팅 시작
+        await start_room_affinity()
+        
+        # 재시작 이전에 진행 중이던 턴 타이머 복구
+        if os.getenv("TIMER_RECOVERY", "true").lower() == "true":
+            await recover_turn_timers()
+        
         logger.info("끄아(KKUA) V2 서버 시작 완료")
         
         yield
@@ -52,6 +116,35 @@ async def lifespan(app: FastAPI):
     
     # 종료 시
     logger.info("끄아(KKUA) V2 서버 종료 중...")
+    
+    # 드레인을 거치지 않은 종료라도 재접속 토큰을 전달하고 룸 담당을 넘김
+    from websocket.connection_manager import websocket_manager
+    from websocket.drain import get_drain_coordinator
+    coordinator = get_drain_coordinator(websocket_manager)
+    coordinator.start()
+    await coordinator.wait()
+    
+    from services.word_validator import get_word_validator
+    await get_word_validator().stop_watching()
+    
+    # 남은 감사 로그 기록 (실패 시 디스크에 임시 저장)
+    from services.audit_log_writer import get_audit_log_writer
+    await get_audit_log_writer().stop()
+    
+    from services.partition_manager import get_partition_manager
+    await get_partition_manager().stop()
+    
+    # 진행 중인 게임 기록 마무리 (시간 안에 못 끝나면 재시도 목록으로)
+    from services.game_finalizer import get_game_finalizer
+    await get_game_finalizer().stop()
+    
+    from services.leaderboard_service import get_leaderboard_service
+    await get_leaderboard_service().stop()
+    
+    from services.cache_service import get_cache_service
+    cache_service = get_cache_service()
+    await cache_service.save_warm_snapshot()
+    await cache_service.stop()
 
 
 # FastAPI 앱 생성
@@ -125,8 +218,21 @@ async def health_check():
 @app.get("/api/status")
 async def api_status():
     """API 상태 정보"""
+    from websocket.connection_manager import websocket_manager
+    from websocket.drain import get_drain_coordinator
+    from services.audit_log_writer import get_audit_log_writer
+    from services.partition_manager import get_partition_manager
+    from services.leaderboard_service import get_leaderboard_service
+    from services.game_finalizer import get_game_finalizer
+    
     return {
         "api_version": "2.0.0",
+        "node_id": websocket_manager.pubsub_bridge.node_id,
+        "drain": get_drain_coordinator(websocket_manager).get_status(),
+        "audit_log": get_audit_log_writer().get_stats(),
+        "partitions": get_partition_manager().get_stats(),
+        "leaderboard": get_leaderboard_service().get_stats(),
+        "game_finalizer": get_game_finalizer().get_stats(),
         "phase": "Phase 2 - WebSocket 인프라 완료",
         "implemented_features": [
             "데이터베이스 스키마",
@@ -524,6 +630,52 @@ async def get_user_inventory(user_id: int):
             detail="인벤토리 조회 중 오류가 발생했습니다"
         )
 
+# 리더보드 API
+@app.get("/leaderboard/{board}")
+async def get_leaderboard(board: str, limit: int = 10):
+    """리더보드 상위 N명 조회 (all, daily, weekly)"""
+    from services.leaderboard_service import BOARDS, get_leaderboard_service
+    if board not in BOARDS:
+        raise HTTPException(status_code=404, detail="존재하지 않는 리더보드입니다")
+    
+    try:
+        entries = await get_leaderboard_service().get_top(board, min(max(limit, 1), 100))
+        return {
+            "success": True,
+            "board": board,
+            "entries": entries
+        }
+        
+    except Exception as e:
+        logger.error(f"리더보드 조회 실패: board={board}, error={e}")
+        raise HTTPException(
+            status_code=500,
+            detail="리더보드 조회 중 오류가 발생했습니다"
+        )
+
+@app.get("/leaderboard/{board}/users/{user_id}")
+async def get_user_ranking(board: str, user_id: int, radius: int = 5):
+    """내 순위와 주변 순위 조회"""
+    from services.leaderboard_service import BOARDS, get_leaderboard_service
+    if board not in BOARDS:
+        raise HTTPException(status_code=404, detail="존재하지 않는 리더보드입니다")
+    
+    try:
+        leaderboard_service = get_leaderboard_service()
+        return {
+            "success": True,
+            "board": board,
+            "me": await leaderboard_service.get_rank(board, user_id),
+            "around": await leaderboard_service.get_around(board, user_id, min(max(radius, 0), 50))
+        }
+        
+    except Exception as e:
+        logger.error(f"순위 조회 실패: board={board}, user_id={user_id}, error={e}")
+        raise HTTPException(
+            status_code=500,
+            detail="순위 조회 중 오류가 발생했습니다"
+        )
+
 @app.get("/items/list")
 async def list_available_items():
     """사용 가능한 아이템 목록 조회"""
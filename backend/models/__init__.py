@@ -1,7 +1,7 @@
 from .base import Base
 from .user_models import User, UserItem
 from .game_models import GameRoom, GameSession, GameParticipant
-from .dictionary_models import KoreanDictionary
+from .dictionary_models import KoreanDictionary, ForbiddenWord
 from .item_models import Item
 from .log_models import GameLog, WordSubmission
 
@@ -13,6 +13,7 @@ __all__ = [
     "GameSession",
     "GameParticipant",
     "KoreanDictionary",
+    "ForbiddenWord",
     "Item",
     "GameLog",
     "WordSubmission"
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text
+from sqlalchemy import Column, Integer, String, DateTime, Text, Index
 from sqlalchemy.sql import func
 from .base import Base
 
@@ -18,6 +18,15 @@ class KoreanDictionary(Base):
     word_length = Column(Integer, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
+    __table_args__ = (
+        # 첫 글자별 빈도순 힌트 조회용 커버링 인덱스 (정렬 없이 인덱스만 스캔)
+        Index(
+            "idx_korean_dictionary_first_char_freq",
+            first_char, frequency_score.desc(),
+            postgresql_include=["word"]
+        ),
+    )
+    
     def __repr__(self):
         return f"<KoreanDictionary(word='{self.word}', difficulty={self.difficulty_level})>"
     
@@ -51,4 +60,16 @@ class KoreanDictionary(Base):
         elif frequency_score >= 50:
             return 30
         else:
-            return 50  # 희귀한 단어일수록 높은 보너스
\ No newline at end of file
+            return 50  # 희귀한 단어일수록 높은 보너스
+
+
+class ForbiddenWord(Base):
+    """금지어 모델 (단어 어디에든 포함되면 거절)"""
+    __tablename__ = "forbidden_words"
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    word = Column(String(100), unique=True, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    
+    def __repr__(self):
+        return f"<ForbiddenWord(word='{self.word}')>"
@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, Integer, String, DateTime, BigInteger, ForeignKey, JSON, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, BigInteger, ForeignKey, JSON, Boolean, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -22,7 +22,6 @@ class GameRoom(Base):
     
     # 관계
     creator = relationship("User", back_populates="created_rooms")
-    game_sessions = relationship("GameSession", back_populates="room")
     
     def __repr__(self):
         return f"<GameRoom(id={self.id}, name='{self.name}', status='{self.status}')>"
@@ -49,7 +48,7 @@ class GameSession(Base):
     __tablename__ = "game_sessions"
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    room_id = Column(UUID(as_uuid=True), ForeignKey("game_rooms.id"), nullable=False, index=True)
+    room_id = Column(String(64), index=True)  # Redis 게임방 ID (방은 Redis에만 존재)
     started_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
     ended_at = Column(DateTime(timezone=True))
     winner_id = Column(Integer, ForeignKey("users.id"))
@@ -58,13 +57,18 @@ class GameSession(Base):
     duration_ms = Column(BigInteger)
     game_data = Column(JSON)  # 게임 상세 데이터
     final_scores = Column(JSON)  # 최종 점수 정보
+    # 리더보드/인벤토리 캐시/드롭 알림 반영 여부 (기록과 같은 트랜잭션에서 false로 저장, 반영 후 true)
+    leaderboard_applied = Column(Boolean, nullable=False, default=False, server_default=text("false"))
+    
+    __table_args__ = (
+        Index("idx_game_sessions_leaderboard_pending", "ended_at", postgresql_where=text("NOT leaderboard_applied")),
+    )
     
     # 관계
-    room = relationship("GameRoom", back_populates="game_sessions")
     winner = relationship("User", back_populates="won_sessions")
     participants = relationship("GameParticipant", back_populates="session")
-    game_logs = relationship("GameLog", back_populates="session")
-    word_submissions = relationship("WordSubmission", back_populates="session")
+    game_logs = relationship("GameLog", back_populates="session", primaryjoin="GameSession.id == foreign(GameLog.session_id)")
+    word_submissions = relationship("WordSubmission", back_populates="session", primaryjoin="GameSession.id == foreign(WordSubmission.session_id)")
     
     def __repr__(self):
         return f"<GameSession(id={self.id}, room_id={self.room_id}, status={'finished' if self.ended_at else 'playing'})>"
@@ -72,7 +76,7 @@ class GameSession(Base):
     def to_dict(self):
         return {
             "id": str(self.id),
-            "room_id": str(self.room_id),
+            "room_id": self.room_id,
             "started_at": self.started_at.isoformat() if self.started_at else None,
             "ended_at": self.ended_at.isoformat() if self.ended_at else None,
             "winner_id": self.winner_id,
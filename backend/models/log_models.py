@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, JSON
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -8,18 +8,21 @@ from .base import Base
 class GameLog(Base):
     """게임 로그 모델"""
     __tablename__ = "game_logs"
+    # timestamp 기준 월별 범위 파티션 (파티션은 PartitionManager가 생성/삭제)
+    __table_args__ = {"postgresql_partition_by": "RANGE (timestamp)"}
     
     id = Column(Integer, primary_key=True, autoincrement=True)
-    session_id = Column(UUID(as_uuid=True), ForeignKey("game_sessions.id", ondelete="CASCADE"), nullable=False, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), index=True)
+    # 감사 로그는 배치로 먼저 기록되므로 세션/사용자 행에 대한 외래 키 없이 저장
+    session_id = Column(UUID(as_uuid=True), nullable=False, index=True)
+    user_id = Column(Integer, index=True)
     action_type = Column(String(30), nullable=False, index=True)  # word_submit, item_use, game_start 등
     action_data = Column(JSON)
-    timestamp = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+    timestamp = Column(DateTime(timezone=True), primary_key=True, server_default=func.now(), index=True)  # 파티션 키는 기본 키에 포함
     round_number = Column(Integer)
     
     # 관계
-    session = relationship("GameSession", back_populates="game_logs")
-    user = relationship("User", back_populates="game_logs")
+    session = relationship("GameSession", back_populates="game_logs", primaryjoin="foreign(GameLog.session_id) == GameSession.id")
+    user = relationship("User", back_populates="game_logs", primaryjoin="foreign(GameLog.user_id) == User.id")
     
     def __repr__(self):
         return f"<GameLog(action_type='{self.action_type}', session_id={self.session_id}, user_id={self.user_id})>"
@@ -39,10 +42,12 @@ class GameLog(Base):
 class WordSubmission(Base):
     """단어 제출 기록 모델"""
     __tablename__ = "word_submissions"
+    # submitted_at 기준 월별 범위 파티션 (파티션은 PartitionManager가 생성/삭제)
+    __table_args__ = {"postgresql_partition_by": "RANGE (submitted_at)"}
     
     id = Column(Integer, primary_key=True, autoincrement=True)
-    session_id = Column(UUID(as_uuid=True), ForeignKey("game_sessions.id", ondelete="CASCADE"), nullable=False, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    session_id = Column(UUID(as_uuid=True), nullable=False, index=True)
+    user_id = Column(Integer, nullable=False, index=True)
     word = Column(String(100), nullable=False, index=True)
     is_valid = Column(Boolean, nullable=False)
     validation_reason = Column(String(100))  # 검증 실패 이유
@@ -50,11 +55,11 @@ class WordSubmission(Base):
     score_earned = Column(Integer, default=0)
     round_number = Column(Integer)
     turn_order = Column(Integer)
-    submitted_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+    submitted_at = Column(DateTime(timezone=True), primary_key=True, server_default=func.now(), index=True)  # 파티션 키는 기본 키에 포함
     
     # 관계
-    session = relationship("GameSession", back_populates="word_submissions")
-    user = relationship("User", back_populates="word_submissions")
+    session = relationship("GameSession", back_populates="word_submissions", primaryjoin="foreign(WordSubmission.session_id) == GameSession.id")
+    user = relationship("User", back_populates="word_submissions", primaryjoin="foreign(WordSubmission.user_id) == User.id")
     
     def __repr__(self):
         return f"<WordSubmission(word='{self.word}', is_valid={self.is_valid}, user_id={self.user_id})>"
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, BigInteger, ForeignKey
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, BigInteger, ForeignKey, UniqueConstraint
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from .base import Base
@@ -22,8 +22,8 @@ class User(Base):
     user_items = relationship("UserItem", back_populates="user", cascade="all, delete-orphan")
     created_rooms = relationship("GameRoom", back_populates="creator")
     game_participants = relationship("GameParticipant", back_populates="user")
-    game_logs = relationship("GameLog", back_populates="user")
-    word_submissions = relationship("WordSubmission", back_populates="user")
+    game_logs = relationship("GameLog", back_populates="user", primaryjoin="User.id == foreign(GameLog.user_id)")
+    word_submissions = relationship("WordSubmission", back_populates="user", primaryjoin="User.id == foreign(WordSubmission.user_id)")
     won_sessions = relationship("GameSession", back_populates="winner")
     
     def __repr__(self):
@@ -46,6 +46,7 @@ class User(Base):
 class UserItem(Base):
     """사용자 아이템 인벤토리 모델"""
     __tablename__ = "user_items"
+    __table_args__ = (UniqueConstraint("user_id", "item_id", name="uq_user_items_user_item"),)  # 아이템별 한 행 (수량으로 관리)
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
@@ -6,7 +6,7 @@ Redis 데이터 구조 및 모델 정의
 import json
 import redis
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timezone, timedelta
 from dataclasses import dataclass, asdict
 from enum import Enum
@@ -82,6 +82,11 @@ class GameTimer:
         expires = datetime.fromisoformat(self.expires_at.replace('Z', '+00:00'))
         return now >= expires
 
+    def get_expires_at_ms(self) -> int:
+        """만료 시각 (epoch ms)"""
+        expires = datetime.fromisoformat(self.expires_at.replace('Z', '+00:00'))
+        return int(expires.timestamp() * 1000)
+
 
 @dataclass
 class WordChainState:
@@ -159,6 +164,7 @@ class GameState:
     created_at: str = None
     started_at: Optional[str] = None
     ended_at: Optional[str] = None
+    session_id: Optional[str] = None  # 게임 한 판 식별자 (감사 로그/게임 기록용)
     
     def __post_init__(self):
         if self.players is None:
@@ -286,6 +292,7 @@ class GameState:
         self.status = GameStatus.WAITING.value
         self.started_at = None
         self.ended_at = None
+        self.session_id = None
         self.phase = "waiting"
         
         # 플레이어들 초기화
@@ -365,7 +372,8 @@ class GameState:
             "game_settings": self.game_settings,
             "created_at": self.created_at,
             "started_at": self.started_at,
-            "ended_at": self.ended_at
+            "ended_at": self.ended_at,
+            "session_id": self.session_id
         }
 
     @classmethod
@@ -393,7 +401,8 @@ class GameState:
             game_settings=data.get("game_settings", {}),
             created_at=data.get("created_at"),
             started_at=data.get("started_at"),
-            ended_at=data.get("ended_at")
+            ended_at=data.get("ended_at"),
+            session_id=data.get("session_id")
         )
 
 
@@ -404,6 +413,7 @@ class RedisGameManager:
         self.redis = redis_client
         self.GAME_KEY_PREFIX = "game:room:"
         self.TIMER_KEY_PREFIX = "timer:"
+        self.TIMER_INDEX_KEY = "timer_index:deadlines"  # room_id -> 만료 시각(epoch ms)
         self.SESSION_KEY_PREFIX = "session:"
         self.WORD_CACHE_PREFIX = "word:cache:"
         self.DEFAULT_TTL = 24 * 60 * 60  # 24시간
@@ -454,7 +464,10 @@ class RedisGameManager:
             timer_key = self._get_timer_key(room_id)
             
             # 게임 상태와 타이머 모두 삭제
-            result = self.redis.delete(key, timer_key)
+            pipe = self.redis.pipeline()
+            pipe.delete(key, timer_key)
+            pipe.zrem(self.TIMER_INDEX_KEY, room_id)
+            result = pipe.execute()[0]
             
             logger = logging.getLogger(__name__)
             logger.info(f"방 삭제 완료: room_id={room_id}, 삭제된 키: {result}개")
@@ -471,7 +484,11 @@ class RedisGameManager:
             data = json.dumps(timer.to_dict(), ensure_ascii=False)
             # 타이머는 만료 시간보다 약간 더 길게 TTL 설정
             ttl = max(timer.remaining_ms // 1000 + 10, 60)
-            self.redis.setex(key, ttl, data)
+            # 타이머 본문과 만료 인덱스를 함께 기록 (재시작 시 복구용)
+            pipe = self.redis.pipeline()
+            pipe.setex(key, ttl, data)
+            pipe.zadd(self.TIMER_INDEX_KEY, {room_id: timer.get_expires_at_ms()})
+            pipe.execute()
             logger.info(f"타이머 Redis 저장: room_id={room_id}, ttl={ttl}초, expires_at={timer.expires_at}")
             return True
         except Exception as e:
@@ -494,6 +511,54 @@ class RedisGameManager:
             logger.error(f"타이머 조회 실패: {e}")
             return None
 
+    async def delete_timers(self, room_ids: List[str]) -> int:
+        """타이머 및 만료 인덱스 항목 삭제"""
+        if not room_ids:
+            return 0
+        try:
+            pipe = self.redis.pipeline()
+            pipe.delete(*[self._get_timer_key(room_id) for room_id in room_ids])
+            pipe.zrem(self.TIMER_INDEX_KEY, *room_ids)
+            return pipe.execute()[0]
+        except Exception as e:
+            logger.error(f"타이머 삭제 실패: {e}")
+            return 0
+
+    async def scan_timer_index(self, cursor: int = 0, count: int = 500) -> Tuple[int, List[Tuple[str, int]]]:
+        """만료 인덱스를 커서 단위로 조회 (room_id, 만료 시각 ms)"""
+        try:
+            next_cursor, entries = self.redis.zscan(self.TIMER_INDEX_KEY, cursor=cursor, count=count)
+            return next_cursor, [(room_id, int(score)) for room_id, score in entries]
+        except Exception as e:
+            logger.error(f"타이머 인덱스 조회 실패: {e}")
+            return 0, []
+
+    async def get_timers_with_states(
+        self, room_ids: List[str]
+    ) -> List[Tuple[str, Optional[GameTimer], Optional[GameState]]]:
+        """여러 방의 타이머와 게임 상태를 한 번의 왕복으로 조회"""
+        if not room_ids:
+            return []
+        try:
+            pipe = self.redis.pipeline()
+            pipe.mget([self._get_timer_key(room_id) for room_id in room_ids])
+            pipe.mget([self._get_game_key(room_id) for room_id in room_ids])
+            timer_values, state_values = pipe.execute()
+        except Exception as e:
+            logger.error(f"타이머 일괄 조회 실패: {e}")
+            return []
+
+        results = []
+        for room_id, timer_data, state_data in zip(room_ids, timer_values, state_values):
+            try:
+                timer = GameTimer.from_dict(json.loads(timer_data)) if timer_data else None
+                game_state = GameState.from_dict(json.loads(state_data)) if state_data else None
+            except Exception as e:
+                logger.error(f"타이머 데이터 파싱 실패: room_id={room_id}, {e}")
+                timer, game_state = None, None
+            results.append((room_id, timer, game_state))
+        return results
+
     async def cache_word_validation(self, word: str, is_valid: bool, word_info: Dict[str, Any] = None):
         """단어 검증 결과 캐시"""
         try:
@@ -0,0 +1,82 @@
+"""
+콜드 스타트 벤치마크 스크립트
+기존 워밍업(DB 조회 + 단어별 SETEX)과 웜 스타트 스냅샷 재생성/로드 시간 비교
+
+실행: python -m scripts.benchmark_cold_start           (Postgres/Redis 필요)
+      python -m scripts.benchmark_cold_start --synthetic 200000   (스냅샷 파일 로드만 측정)
+"""
+
+import os
+import time
+import random
+import asyncio
+import argparse
+import tempfile
+
+from services.warm_start import WarmStartSnapshot
+
+# 단어 생성용 음절
+SYLLABLES = "가나다라마바사아자차카타파하고노도로모보소오조초코토포호구누두루무부수우주추"
+
+
+def measure(label: str, func):
+    """실행 시간 측정 후 출력"""
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {elapsed:>8.3f}s")
+    return result
+
+
+def run_synthetic(word_count: int):
+    """임의 단어로 만든 스냅샷의 저장/로드 시간"""
+    rng = random.Random(42)
+    words = [
+        ["".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))), "뜻풀이 " * 5, rng.randint(1, 3), rng.randint(0, 100)]
+        for _ in range(word_count)
+    ]
+    hints = {syllable: [w[0] for w in words[:10]] for syllable in SYLLABLES}
+    signature = {"count": word_count, "max_id": word_count}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        snapshot = WarmStartSnapshot(os.path.join(tmp, "warm_start.json.gz"))
+        measure("snapshot save", lambda: snapshot.save(signature, words, hints, []))
+        print(f"{'snapshot size':<28} {os.path.getsize(snapshot.path) / 1024:>8.0f}KB")
+        data = measure("snapshot load", lambda: snapshot.load(signature))
+        print(f"단어 {len(data['words'])}개, 힌트 글자 {len(data['hints'])}개")
+
+
+async def run_live():
+    """실제 DB/Redis로 기존 워밍업과 스냅샷 재생성/로드 비교"""
+    from services.word_validator import get_word_validator
+
+    word_validator = get_word_validator()
+
+    start = time.perf_counter()
+    await word_validator.preload_common_words(1000)
+    print(f"{'legacy preload (1000 SETEX)':<28} {time.perf_counter() - start:>8.3f}s")
+
+    for path in (word_validator.warm_start.path, word_validator.word_filter_path):
+        if os.path.exists(path):
+            os.remove(path)
+    index = measure("rebuild from postgres", word_validator.build_index)
+    assert index.source == "database"
+    index = measure("load from snapshot", word_validator.build_index)
+    assert index.source == "snapshot"
+    print(f"적재 단어 {len(index.words)}개, 힌트 글자 {len(index.hints)}개")
+
+
+def main():
+    """벤치마크 실행"""
+    parser = argparse.ArgumentParser(description="콜드 스타트 벤치마크")
+    parser.add_argument("--synthetic", type=int, default=0, help="DB 없이 임의 단어 N개로 스냅샷 로드만 측정")
+    args = parser.parse_args()
+
+    if args.synthetic:
+        run_synthetic(args.synthetic)
+    else:
+        asyncio.run(run_live())
+
+
+if __name__ == "__main__":
+    main()
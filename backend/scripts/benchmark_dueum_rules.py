@@ -0,0 +1,123 @@
+"""
+두음법칙 규칙 조회 벤치마크 스크립트
+기존 구현(손으로 작성한 매핑 + 호출마다 list(set(...)))과 음절 인덱스 배열 조회 비교
+
+실행: python -m scripts.benchmark_dueum_rules [--iterations 200000]
+"""
+
+import time
+import random
+import argparse
+from typing import Dict, List, Set, Tuple
+
+from utils.dueum_rules import DueumRules, HANGUL_BASE, HANGUL_COUNT
+
+
+class LegacyDueumRules:
+    """기존 구현 (비교용, 핵심 조회 경로만 유지)"""
+
+    def __init__(self):
+        self.dueum_mappings: Dict[str, List[str]] = {
+            '나': ['라'], '낙': ['락'], '난': ['란'], '날': ['랄'], '남': ['람'],
+            '납': ['랍'], '낭': ['랑'], '내': ['래'], '냉': ['랭'], '녹': ['록'],
+            '논': ['론'], '농': ['롱'], '뇌': ['뢰'], '누': ['루'], '능': ['릉'],
+            '님': ['림'], '닙': ['립'], '노': ['로'], '뇽': ['룡'],
+            '약': ['략'], '양': ['량'], '여': ['려', '녀'], '역': ['력', '녁'],
+            '연': ['련', '년'], '열': ['렬'], '염': ['렴', '념'], '엽': ['렵', '녑'],
+            '영': ['령', '녕'], '예': ['례'], '요': ['료', '뇨'], '용': ['룡'],
+            '유': ['류', '뉴'], '육': ['륙', '뉵'], '윤': ['륜'], '율': ['률'],
+            '융': ['륭'], '음': ['름'], '이': ['리', '니'], '인': ['린'],
+            '임': ['림'], '입': ['립'], '일': ['릴'], '익': ['릭'],
+            '아': ['라'], '안': ['란'], '알': ['랄'], '암': ['람'], '압': ['랍'],
+            '앙': ['랑'], '애': ['래'], '액': ['랙'], '앤': ['랜'], '앨': ['랠'],
+            '앰': ['램'], '앱': ['랩'], '앵': ['랭'], '어': ['러'], '억': ['럭'],
+            '언': ['런'], '얼': ['럴'], '엄': ['럼'], '업': ['럽'], '엉': ['렁'],
+            '에': ['레'], '엑': ['렉'], '엔': ['렌'], '엘': ['렐'], '엠': ['렘'],
+            '엡': ['렙'], '엥': ['렝'], '오': ['로'], '옥': ['록'], '온': ['론'],
+            '올': ['롤'], '옴': ['롬'], '옵': ['롭'], '옹': ['롱'], '우': ['루'],
+            '욱': ['룩'], '운': ['룬'], '울': ['룰'], '움': ['룸'], '웁': ['룹'],
+            '웅': ['룽'], '워': ['뤄'], '원': ['뤈'], '월': ['뤌'], '위': ['뤼'],
+            '은': ['른'], '을': ['를'], '읍': ['릅'],
+        }
+        self.reverse_mappings: Dict[str, List[str]] = {}
+        for converted, originals in self.dueum_mappings.items():
+            for original in originals:
+                self.reverse_mappings.setdefault(original, []).append(converted)
+
+    def get_dueum_alternatives(self, char: str) -> List[str]:
+        alternatives = []
+        if char in self.dueum_mappings:
+            alternatives.extend(self.dueum_mappings[char])
+        if char in self.reverse_mappings:
+            alternatives.extend(self.reverse_mappings[char])
+        return list(set(alternatives))
+
+    def check_dueum_word_validity(self, input_word: str, target_char: str) -> Tuple[bool, List[str]]:
+        first_char = input_word[0]
+        if first_char == target_char:
+            return True, [target_char]
+        target_alternatives = self.get_dueum_alternatives(target_char)
+        input_alternatives = self.get_dueum_alternatives(first_char)
+        if first_char in target_alternatives or target_char in input_alternatives:
+            return True, [target_char, first_char]
+        common_alternatives = set(target_alternatives) & set(input_alternatives)
+        if common_alternatives:
+            return True, [target_char, first_char] + list(common_alternatives)
+        return False, []
+
+    def get_all_possible_starts(self, char: str) -> Set[str]:
+        possible_starts = {char}
+        possible_starts.update(self.get_dueum_alternatives(char))
+        return possible_starts
+
+
+def measure(label: str, func, chars: List[str]) -> float:
+    """글자 목록 전체 조회 시간 (호출당 ns)"""
+    start = time.perf_counter()
+    for char in chars:
+        func(char)
+    elapsed = time.perf_counter() - start
+    per_call = elapsed / len(chars) * 1e9
+    print(f"{label:<36} {elapsed:>8.3f}s {per_call:>8.0f}ns/call")
+    return per_call
+
+
+def coverage(rules) -> int:
+    """대안이 있는 한글 음절 수"""
+    return sum(1 for index in range(HANGUL_COUNT) if rules.get_dueum_alternatives(chr(HANGUL_BASE + index)))
+
+
+def main():
+    """벤치마크 실행"""
+    parser = argparse.ArgumentParser(description="두음법칙 조회 벤치마크")
+    parser.add_argument("--iterations", type=int, default=200000, help="조회 횟수")
+    args = parser.parse_args()
+
+    legacy = LegacyDueumRules()
+    start = time.perf_counter()
+    dense = DueumRules()
+    print(f"{'dense table compile':<36} {time.perf_counter() - start:>8.3f}s")
+    print(f"대안이 있는 음절: legacy {coverage(legacy)}개, dense {coverage(dense)}개 / {HANGUL_COUNT}개")
+
+    # 게임에서 자주 나오는 ㄹ/ㄴ/ㅇ 초성 음절 위주 + 일반 음절 섞기
+    rng = random.Random(42)
+    hot = list("라려료류리로루락란력련령례룡름릉나녀뇨뉴니노누낙요여유이오우양역연영")
+    chars = [
+        rng.choice(hot) if rng.random() < 0.5 else chr(HANGUL_BASE + rng.randrange(HANGUL_COUNT))
+        for _ in range(args.iterations)
+    ]
+    words = [f"{rng.choice(hot)}기" for _ in range(args.iterations)]
+
+    for name in ("get_dueum_alternatives", "get_all_possible_starts"):
+        before = measure(f"legacy {name}", getattr(legacy, name), chars)
+        after = measure(f"dense  {name}", getattr(dense, name), chars)
+        print(f"{'':<36} x{before / after:.1f}")
+
+    pairs = list(zip(words, chars))
+    before = measure("legacy check_dueum_word_validity", lambda pair: legacy.check_dueum_word_validity(*pair), pairs)
+    after = measure("dense  check_dueum_word_validity", lambda pair: dense.check_dueum_word_validity(*pair), pairs)
+    print(f"{'':<36} x{before / after:.1f}")
+
+
+if __name__ == "__main__":
+    main()
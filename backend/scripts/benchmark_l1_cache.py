@@ -0,0 +1,115 @@
+"""
+L1 캐시 벤치마크 스크립트
+Zipf 분포 단어 조회 워크로드에서 기존 L1(dict + O(n) LRU 퇴출)과 W-TinyLFU 비교
+
+실행: python -m scripts.benchmark_l1_cache [--keys 50000] [--ops 200000] [--capacity 1000]
+"""
+
+import time
+import random
+import argparse
+from datetime import datetime, timezone, timedelta
+from itertools import accumulate
+from typing import Any, Dict, List, Optional
+
+from utils.tinylfu import TinyLFUCache
+
+_MISSING = object()
+
+# 단어 생성용 음절
+SYLLABLES = "가나다라마바사아자차카타파하고노도로모보소오조초코토포호구누두루무부수우주추"
+
+
+class LegacyL1Cache:
+    """기존 CacheService L1 구현 (비교 기준)"""
+
+    def __init__(self, max_size: int = 1000):
+        self.l1_cache: Dict[str, Any] = {}
+        self.l1_access_times: Dict[str, datetime] = {}
+        self.l1_access_counts: Dict[str, int] = {}
+        self.l1_max_size = max_size
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self.l1_cache:
+            self.l1_access_times[key] = datetime.now(timezone.utc)
+            self.l1_access_counts[key] = self.l1_access_counts.get(key, 0) + 1
+            return self.l1_cache[key]["data"]
+        return default
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None):
+        if len(self.l1_cache) >= self.l1_max_size:
+            oldest_key = min(self.l1_access_times.keys(), key=lambda k: self.l1_access_times[k])
+            self.l1_cache.pop(oldest_key, None)
+            self.l1_access_times.pop(oldest_key, None)
+            self.l1_access_counts.pop(oldest_key, None)
+
+        self.l1_cache[key] = {
+            "data": value,
+            "created_at": datetime.now(timezone.utc),
+            "ttl": ttl,
+            "expires_at": datetime.now(timezone.utc) + timedelta(seconds=ttl) if ttl else None
+        }
+        self.l1_access_times[key] = datetime.now(timezone.utc)
+        self.l1_access_counts[key] = 1
+
+
+def make_words(count: int, seed: int) -> List[str]:
+    """중복 없는 2~4음절 단어 생성"""
+    rng = random.Random(seed)
+    words = set()
+    while len(words) < count:
+        length = rng.randint(2, 4)
+        words.add("".join(rng.choice(SYLLABLES) for _ in range(length)))
+    return list(words)
+
+
+def make_zipf_trace(words: List[str], ops: int, exponent: float, seed: int) -> List[str]:
+    """Zipf 분포 조회 순서 생성"""
+    rng = random.Random(seed)
+    cum_weights = list(accumulate(1.0 / (rank ** exponent) for rank in range(1, len(words) + 1)))
+    return rng.choices(words, cum_weights=cum_weights, k=ops)
+
+
+def run_trace(cache, trace: List[str]) -> Dict[str, float]:
+    """조회 후 미스면 저장하는 read-through 패턴 실행"""
+    hits = 0
+    start = time.perf_counter()
+    for word in trace:
+        if cache.get(word, _MISSING) is not _MISSING:
+            hits += 1
+        else:
+            cache.set(word, {"word": word, "is_valid": True}, 300)
+    elapsed = time.perf_counter() - start
+    return {
+        "hit_rate": hits / len(trace),
+        "ops_per_sec": len(trace) / elapsed,
+        "elapsed": elapsed
+    }
+
+
+def main():
+    """벤치마크 실행"""
+    parser = argparse.ArgumentParser(description="L1 캐시 벤치마크")
+    parser.add_argument("--keys", type=int, default=50000, help="고유 단어 수")
+    parser.add_argument("--ops", type=int, default=200000, help="조회 횟수")
+    parser.add_argument("--capacity", type=int, default=1000, help="L1 최대 항목 수")
+    parser.add_argument("--exponent", type=float, default=1.0, help="Zipf 지수")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    words = make_words(args.keys, args.seed)
+    trace = make_zipf_trace(words, args.ops, args.exponent, args.seed)
+
+    print(f"워크로드: 단어 {args.keys}개, 조회 {args.ops}회, 용량 {args.capacity}, Zipf s={args.exponent}")
+    print(f"{'구현':<12} {'적중률':>8} {'ops/sec':>12} {'시간(s)':>9}")
+
+    for name, cache in (
+        ("legacy", LegacyL1Cache(args.capacity)),
+        ("w-tinylfu", TinyLFUCache(max_size=args.capacity)),
+    ):
+        result = run_trace(cache, trace)
+        print(f"{name:<12} {result['hit_rate']:>8.2%} {result['ops_per_sec']:>12,.0f} {result['elapsed']:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,308 @@
+"""
+대용량 사전 가져오기 스크립트
+TSV/CSV/JSONL 사전 덤프(gzip 가능)를 스트리밍으로 읽어 첫 글자/끝 글자/길이를 계산하고 중복 제거,
+임시 스테이징 테이블에 COPY로 적재한 뒤 korean_dictionary에 upsert로 병합,
+같은 과정에서 블룸 필터를 만들어 저장하고 워커들에 재적재 신호 전송
+
+실행: python -m scripts.import_dictionary words.tsv.gz
+      python -m scripts.import_dictionary words.jsonl --replace   (파일에 없는 기존 단어 삭제)
+
+입력 형식 (헤더 행은 있으면 건너뜀):
+  TSV/CSV: 단어, 뜻, 난이도, 빈도, 품사 순서 (init_data.py의 korean_words.csv와 같은 순서)
+  JSONL:   {"word": ..., "definition": ..., "difficulty_level": ..., "frequency_score": ..., "word_type": ...}
+"""
+
+import io
+import re
+import csv
+import sys
+import gzip
+import json
+import time
+import logging
+import argparse
+from typing import Dict, Iterator, List, Optional, Any, Set, TextIO
+from database import engine
+from utils.bloom_filter import BloomFilter
+
+logger = logging.getLogger(__name__)
+
+KOREAN_WORD = re.compile(r'^[가-힣]+$')
+COLUMNS = ["word", "definition", "difficulty_level", "frequency_score", "word_type"]
+STAGING_TABLE = "korean_dictionary_staging"
+
+
+class ImportStats:
+    """가져오기 통계"""
+
+    def __init__(self):
+        self.read = 0
+        self.loaded = 0
+        self.duplicates = 0
+        self.invalid = 0
+        self.started = time.perf_counter()
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def rate(self) -> float:
+        return self.read / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def open_dump(path: str) -> TextIO:
+    """사전 덤프 열기 (.gz는 압축 해제, '-'는 표준 입력)"""
+    if path == "-":
+        return sys.stdin
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8", newline="")
+    return open(path, "r", encoding="utf-8", newline="")
+
+
+def detect_format(path: str) -> str:
+    """확장자로 입력 형식 판별"""
+    name = path[:-3] if path.endswith(".gz") else path
+    if name.endswith(".jsonl") or name.endswith(".ndjson"):
+        return "jsonl"
+    if name.endswith(".csv"):
+        return "csv"
+    return "tsv"
+
+
+def read_records(stream: TextIO, fmt: str) -> Iterator[Dict[str, Any]]:
+    """덤프에서 행을 하나씩 읽어 컬럼 이름이 붙은 레코드로 반환"""
+    if fmt == "jsonl":
+        for line in stream:
+            if line.strip():
+                yield json.loads(line)
+        return
+
+    reader = csv.reader(stream, delimiter="\t" if fmt == "tsv" else ",", quoting=csv.QUOTE_MINIMAL)
+    for row_num, row in enumerate(reader):
+        if not row:
+            continue
+        if row_num == 0 and row[0].strip().lower() == "word":
+            continue  # 헤더 행
+        yield dict(zip(COLUMNS, row))
+
+
+def _to_int(value: Any, default: int) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _copy_escape(value: str) -> str:
+    """COPY text 형식 이스케이프"""
+    return value.replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+
+
+def normalize(record: Dict[str, Any]) -> Optional[str]:
+    """레코드를 COPY 한 줄로 변환 (유효하지 않은 단어는 None)"""
+    word = str(record.get("word") or "").strip()
+    if len(word) < 2 or len(word) > 100 or not KOREAN_WORD.match(word):
+        return None
+    fields = [
+        word,
+        _copy_escape(str(record.get("definition") or "").strip()),
+        str(_to_int(record.get("difficulty_level"), 1)),
+        str(_to_int(record.get("frequency_score"), 50)),
+        _copy_escape(str(record.get("word_type") or "명사").strip()[:20]),
+        word[0],
+        word[-1],
+        str(len(word))
+    ]
+    return "\t".join(fields) + "\n"
+
+
+def copy_records(cursor, records: Iterator[Dict[str, Any]], seen: Set[str],
+                 stats: ImportStats, chunk_size: int):
+    """레코드를 묶음 단위로 스테이징 테이블에 COPY (첫 등장 단어만 유지)"""
+    buffer = io.StringIO()
+    buffered = 0
+    for record in records:
+        stats.read += 1
+        line = normalize(record)
+        if line is None:
+            stats.invalid += 1
+            continue
+        word = line.split("\t", 1)[0]
+        if word in seen:
+            stats.duplicates += 1
+            continue
+        seen.add(word)
+        buffer.write(line)
+        buffered += 1
+
+        if buffered >= chunk_size:
+            _flush_copy(cursor, buffer)
+            stats.loaded += buffered
+            buffer = io.StringIO()
+            buffered = 0
+            logger.info(f"적재 중: {stats.loaded:,}개 ({stats.rate():,.0f}행/초)")
+
+    if buffered:
+        _flush_copy(cursor, buffer)
+        stats.loaded += buffered
+
+
+def _flush_copy(cursor, buffer: io.StringIO):
+    buffer.seek(0)
+    cursor.copy_expert(
+        f"COPY {STAGING_TABLE} (word, definition, difficulty_level, frequency_score, "
+        f"word_type, first_char, last_char, word_length) FROM STDIN WITH (FORMAT text)",
+        buffer
+    )
+
+
+MERGE_SQL = f"""
+INSERT INTO korean_dictionary
+    (word, definition, difficulty_level, frequency_score, word_type, first_char, last_char, word_length)
+SELECT word, definition, difficulty_level, frequency_score, word_type, first_char, last_char, word_length
+FROM {STAGING_TABLE}
+ON CONFLICT (word) DO UPDATE SET
+    definition = EXCLUDED.definition,
+    difficulty_level = EXCLUDED.difficulty_level,
+    frequency_score = EXCLUDED.frequency_score,
+    word_type = EXCLUDED.word_type
+WHERE (korean_dictionary.definition, korean_dictionary.difficulty_level,
+       korean_dictionary.frequency_score, korean_dictionary.word_type)
+      IS DISTINCT FROM
+      (EXCLUDED.definition, EXCLUDED.difficulty_level, EXCLUDED.frequency_score, EXCLUDED.word_type)
+"""
+
+DELETE_MISSING_SQL = f"""
+DELETE FROM korean_dictionary d
+WHERE NOT EXISTS (SELECT 1 FROM {STAGING_TABLE} s WHERE s.word = d.word)
+"""
+
+EXISTING_ONLY_SQL = f"""
+SELECT d.word FROM korean_dictionary d
+WHERE NOT EXISTS (SELECT 1 FROM {STAGING_TABLE} s WHERE s.word = d.word)
+"""
+
+
+def import_dump(path: str, fmt: str, replace: bool, chunk_size: int,
+                build_filter: bool) -> Dict[str, Any]:
+    """덤프 가져오기 (한 트랜잭션), 결과 통계 반환"""
+    stats = ImportStats()
+    seen: Set[str] = set()
+    existing_only: List[str] = []
+
+    connection = engine.raw_connection()
+    try:
+        cursor = connection.cursor()
+        cursor.execute(
+            f"CREATE TEMP TABLE {STAGING_TABLE} "
+            f"(LIKE korean_dictionary INCLUDING DEFAULTS) ON COMMIT DROP"
+        )
+        cursor.execute(f"ALTER TABLE {STAGING_TABLE} DROP COLUMN id")
+
+        with open_dump(path) as stream:
+            copy_records(cursor, read_records(stream, fmt), seen, stats, chunk_size)
+        copy_seconds = stats.elapsed
+        logger.info(
+            f"COPY 완료: 읽음 {stats.read:,}, 적재 {stats.loaded:,}, 중복 {stats.duplicates:,}, "
+            f"무효 {stats.invalid:,} ({copy_seconds:.1f}초, {stats.rate():,.0f}행/초)"
+        )
+
+        merge_started = time.perf_counter()
+        cursor.execute(f"CREATE INDEX ON {STAGING_TABLE} (word)")
+        cursor.execute(f"ANALYZE {STAGING_TABLE}")
+        cursor.execute(MERGE_SQL)
+        upserted = cursor.rowcount
+        deleted = 0
+        if replace:
+            cursor.execute(DELETE_MISSING_SQL)
+            deleted = cursor.rowcount
+        elif build_filter:
+            # 파일에 없는 기존 단어도 필터에 넣어야 거짓 음성이 없음
+            cursor.execute(EXISTING_ONLY_SQL)
+            existing_only = [row[0] for row in cursor]
+        connection.commit()
+        merge_seconds = time.perf_counter() - merge_started
+        logger.info(f"병합 완료: 추가/변경 {upserted:,}, 삭제 {deleted:,} ({merge_seconds:.1f}초)")
+
+        cursor.execute("ANALYZE korean_dictionary")
+        connection.commit()
+    except Exception:
+        connection.rollback()
+        raise
+    finally:
+        connection.close()
+
+    return {
+        "read": stats.read,
+        "loaded": stats.loaded,
+        "duplicates": stats.duplicates,
+        "invalid": stats.invalid,
+        "upserted": upserted,
+        "deleted": deleted,
+        "copy_seconds": copy_seconds,
+        "merge_seconds": merge_seconds,
+        "rows_per_second": stats.read / copy_seconds if copy_seconds > 0 else 0.0,
+        "words": seen,
+        "existing_only": existing_only
+    }
+
+
+def publish(result: Dict[str, Any], build_filter: bool):
+    """새 사전 버전의 블룸 필터를 저장한 뒤 워커들에 재적재 신호 전송"""
+    from database import get_db
+    from services.word_validator import get_word_validator
+
+    word_validator = get_word_validator()
+
+    def save_filter(version: int):
+        if not (build_filter and word_validator.word_filter_enabled):
+            return
+        db = next(get_db())
+        try:
+            signature = word_validator.get_dictionary_signature(db, version)
+        finally:
+            db.close()
+        if signature["count"] == 0:
+            return
+        word_filter = BloomFilter(int(signature["count"] * 1.1), word_validator.word_filter_error_rate)
+        word_filter.update(result["words"])
+        word_filter.update(result["existing_only"])
+        word_filter.meta = {"signature": signature}
+        word_filter.save(word_validator.word_filter_path)
+        logger.info(f"블룸 필터 저장: 단어 {len(word_filter):,}개, {word_filter.size_bytes // 1024}KB")
+
+    version = word_validator.publish_dictionary_update(before_publish=save_filter)
+    logger.info(f"사전 버전 v{version} 알림 완료")
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description="대용량 사전 가져오기 (COPY + upsert)")
+    parser.add_argument("path", help="사전 덤프 파일 경로 (.tsv/.csv/.jsonl, .gz 가능, '-'는 표준 입력)")
+    parser.add_argument("--format", choices=["tsv", "csv", "jsonl"], help="입력 형식 (기본값: 확장자로 판별)")
+    parser.add_argument("--replace", action="store_true", help="파일에 없는 기존 단어 삭제")
+    parser.add_argument("--chunk-size", type=int, default=50000, help="COPY 한 번에 보낼 행 수")
+    parser.add_argument("--no-filter", action="store_true", help="블룸 필터를 만들지 않음 (워커가 재생성)")
+    parser.add_argument("--no-publish", action="store_true", help="재적재 신호를 보내지 않음")
+    args = parser.parse_args()
+
+    fmt = args.format or detect_format(args.path)
+    build_filter = not args.no_filter
+    result = import_dump(args.path, fmt, args.replace, args.chunk_size, build_filter)
+
+    print(f"읽은 행      {result['read']:>12,}")
+    print(f"적재 단어    {result['loaded']:>12,}  (중복 {result['duplicates']:,}, 무효 {result['invalid']:,})")
+    print(f"추가/변경    {result['upserted']:>12,}  (삭제 {result['deleted']:,})")
+    print(f"COPY         {result['copy_seconds']:>11.1f}s  ({result['rows_per_second']:,.0f}행/초)")
+    print(f"병합         {result['merge_seconds']:>11.1f}s")
+
+    if not args.no_publish:
+        try:
+            publish(result, build_filter)
+        except Exception as e:
+            logger.warning(f"사전 변경 알림 실패: {e}")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
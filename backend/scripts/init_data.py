@@ -92,8 +92,8 @@ def insert_items(db: Session):
     logger.info("아이템 데이터 삽입 완료")
 
 
-def insert_korean_words(db: Session):
-    """한국어 단어 데이터 삽입 (CSV 파일에서만 로드)"""
+def insert_korean_words(db: Session) -> int:
+    """한국어 단어 데이터 삽입 (CSV 파일에서만 로드), 새로 삽입한 단어 수 반환"""
     import csv
     import os
     
@@ -144,6 +144,7 @@ def insert_korean_words(db: Session):
     # 데이터베이스에 삽입 (배치 처리)
     batch_size = 1000
     words_to_insert = []
+    inserted_count = 0
     
     for word_data in unique_words.values():
         # 중복 확인
@@ -171,14 +172,17 @@ def insert_korean_words(db: Session):
             if len(words_to_insert) >= batch_size:
                 db.add_all(words_to_insert)
                 db.commit()
+                inserted_count += len(words_to_insert)
                 words_to_insert = []
     
     # 남은 단어들 삽입
     if words_to_insert:
         db.add_all(words_to_insert)
         db.commit()
+        inserted_count += len(words_to_insert)
     
-    logger.info("한국어 단어 데이터 삽입 완료")
+    logger.info(f"한국어 단어 데이터 삽입 완료: {inserted_count}개 추가")
+    return inserted_count
 
 
 def main():
@@ -197,7 +201,16 @@ def main():
         insert_items(db)
         
         # 한국어 단어 삽입
-        insert_korean_words(db)
+        inserted_words = insert_korean_words(db)
+        
+        # 단어가 추가된 경우에만 사전 버전을 올려 워커들이 새 인덱스를 적재하도록 알림
+        # (버전이 그대로면 저장된 블룸 필터/웜 스타트 스냅샷을 재사용)
+        if inserted_words > 0:
+            try:
+                from services.word_validator import get_word_validator
+                get_word_validator().publish_dictionary_update()
+            except Exception as e:
+                logger.warning(f"사전 변경 알림 실패: {e}")
         
         logger.info("모든 초기 데이터 삽입 완료")
         
@@ -0,0 +1,77 @@
+"""
+금지어 관리 스크립트
+forbidden_words 테이블에 금지어를 추가/삭제한 뒤 금지어 목록 버전을 올려
+실행 중인 워커들이 재시작 없이 금지어 오토마톤만 다시 만들도록 알림
+
+실행: python -m scripts.manage_forbidden_words add 금지어1 금지어2
+      python -m scripts.manage_forbidden_words remove 금지어1
+      python -m scripts.manage_forbidden_words list
+"""
+
+import argparse
+import logging
+from typing import List
+from sqlalchemy import select, delete
+from sqlalchemy.dialects.postgresql import insert
+from database import SessionLocal
+from models import ForbiddenWord
+
+logger = logging.getLogger(__name__)
+
+
+def add_words(db, words: List[str]) -> int:
+    """금지어 추가 (이미 있으면 무시), 추가된 수 반환"""
+    result = db.execute(
+        insert(ForbiddenWord)
+        .values([{"word": word} for word in words])
+        .on_conflict_do_nothing(index_elements=["word"])
+    )
+    db.commit()
+    return result.rowcount
+
+
+def remove_words(db, words: List[str]) -> int:
+    """금지어 삭제, 삭제된 수 반환"""
+    result = db.execute(delete(ForbiddenWord).where(ForbiddenWord.word.in_(words)))
+    db.commit()
+    return result.rowcount
+
+
+def notify_workers():
+    """실행 중인 워커들에 금지어 재적재 신호 전송 (사전 인덱스와 캐시는 유지)"""
+    try:
+        from services.word_validator import get_word_validator
+        get_word_validator().publish_blocklist_update()
+    except Exception as e:
+        logger.warning(f"금지어 변경 알림 실패: {e}")
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description="금지어 관리")
+    parser.add_argument("command", choices=["add", "remove", "list"])
+    parser.add_argument("words", nargs="*", help="추가/삭제할 금지어")
+    args = parser.parse_args()
+
+    words = [word.strip() for word in args.words if word.strip()]
+    db = SessionLocal()
+    try:
+        if args.command == "list":
+            for (word,) in db.execute(select(ForbiddenWord.word).order_by(ForbiddenWord.word)):
+                print(word)
+            return
+
+        if not words:
+            parser.error("금지어를 하나 이상 입력하세요")
+        if args.command == "add":
+            logger.info(f"금지어 {add_words(db, words)}개 추가")
+        else:
+            logger.info(f"금지어 {remove_words(db, words)}개 삭제")
+        notify_workers()
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
@@ -3,6 +3,7 @@
 게임 통계, 사용자 행동 분석, 성과 지표, 리포팅
 """
 
+import asyncio
 import logging
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timezone, timedelta
@@ -542,25 +543,49 @@ class AnalyticsService:
     
     # === 정리 작업 ===
     
-    async def cleanup_old_data(self, days: int = 30):
-        """오래된 데이터 정리"""
+    async def cleanup_old_data(self, days: int = 30) -> Dict[str, int]:
+        """오래된 데이터 정리 (Redis 활성 사용자 키 일괄 UNLINK, 감사 로그는 보존 기간이 지난 파티션만 삭제)"""
+        result = {"redis_keys": 0, "partitions": 0}
+        cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
+        
         try:
-            cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
-            cutoff_str = cutoff_date.strftime("%Y%m%d")
-            
-            # 오래된 DAU 키 삭제
-            pattern = f"{self.metrics_prefix}dau:*"
-            keys = self.redis_client.keys(pattern)
-            
-            for key in keys:
-                date_str = key.decode().split(":")[-1]
-                if date_str < cutoff_str:
-                    self.redis_client.delete(key)
-            
-            logger.info(f"{days}일 이전 데이터 정리 완료")
-            
+            result["redis_keys"] = await asyncio.to_thread(self._cleanup_redis_keys, cutoff_date)
         except Exception as e:
-            logger.error(f"데이터 정리 중 오류: {e}")
+            logger.error(f"Redis 데이터 정리 중 오류: {e}")
+        
+        try:
+            from services.partition_manager import get_partition_manager
+            partition_manager = get_partition_manager()
+            # days는 Redis 지표용 기준이므로 감사 로그 보존 기간(AUDIT_LOG_RETENTION_DAYS)보다 짧게 자르지 않음
+            retention_days = max(days, partition_manager.retention_days)
+            partition_cutoff = datetime.now(timezone.utc) - timedelta(days=retention_days)
+            dropped = await asyncio.to_thread(partition_manager.drop_partitions_before, partition_cutoff)
+            result["partitions"] = len(dropped)
+        except Exception as e:
+            logger.error(f"감사 로그 파티션 정리 중 오류: {e}")
+        
+        logger.info(
+            f"{days}일 이전 데이터 정리 완료: Redis 키 {result['redis_keys']}개, "
+            f"감사 로그 파티션 {result['partitions']}개"
+        )
+        return result
+    
+    def _cleanup_redis_keys(self, cutoff_date: datetime, batch_size: int = 500) -> int:
+        """날짜가 붙은 DAU/HAU 키 중 cutoff 이전 것을 SCAN으로 찾아 묶음 단위 UNLINK"""
+        cutoff_str = cutoff_date.strftime("%Y%m%d")
+        removed = 0
+        batch = []
+        
+        for period in ("dau", "hau"):
+            for key in self.redis_client.scan_iter(match=f"{self.metrics_prefix}{period}:*", count=batch_size):
+                if key.split(":")[-1][:8] < cutoff_str:
+                    batch.append(key)
+                if len(batch) >= batch_size:
+                    removed += self.redis_client.unlink(*batch)
+                    batch = []
+        if batch:
+            removed += self.redis_client.unlink(*batch)
+        return removed
 
 
 # 전역 분석 서비스 인스턴스
@@ -0,0 +1,291 @@
+"""
+감사 로그 배치 기록기
+단어 제출/아이템 사용 기록을 메모리 큐에 모았다가 크기·시간 기준으로 한 번에 INSERT,
+큐가 가득 차거나 Postgres 기록이 실패하면 디스크에 임시 저장 후 다음 기록 때 재전송
+"""
+
+import os
+import json
+import uuid
+import asyncio
+import logging
+from pathlib import Path
+from datetime import datetime, timezone
+from typing import Dict, List, Any, Optional
+from sqlalchemy import insert
+from database import get_db
+from models.log_models import GameLog, WordSubmission
+
+logger = logging.getLogger(__name__)
+
+# 한 번에 기록할 단어 제출 / 게임 로그 행
+Batch = Dict[str, List[Dict[str, Any]]]
+
+
+class AuditLogWriter:
+    """WordSubmission / GameLog 비동기 배치 기록기 (게임 경로에서는 큐에 추가만)"""
+
+    def __init__(self):
+        self.enabled = os.getenv("AUDIT_LOG_ENABLED", "true").lower() == "true"
+        self.batch_size = int(os.getenv("AUDIT_LOG_BATCH_SIZE", "500"))
+        self.flush_interval = float(os.getenv("AUDIT_LOG_FLUSH_INTERVAL", "1.0"))
+        self.max_pending = int(os.getenv("AUDIT_LOG_MAX_PENDING", "20000"))
+        self.spool_dir = Path(os.getenv("AUDIT_LOG_SPOOL_DIR", "data/audit_spool"))
+        self.max_replay_attempts = int(os.getenv("AUDIT_LOG_MAX_REPLAY_ATTEMPTS", "5"))
+
+        self._submissions: List[Dict[str, Any]] = []
+        self._events: List[Dict[str, Any]] = []
+        self._wakeup = asyncio.Event()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._spill_tasks: set = set()
+        self._replay_failures: Dict[str, int] = {}  # 임시 저장 파일별 연속 재전송 실패 횟수
+        self.stats = {
+            "queued": 0, "written": 0, "batches": 0, "spilled": 0,
+            "replayed": 0, "quarantined": 0, "skipped": 0, "errors": 0
+        }
+
+    @property
+    def pending(self) -> int:
+        return len(self._submissions) + len(self._events)
+
+    async def start(self):
+        """주기적 기록 태스크 시작"""
+        if not self.enabled:
+            return
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    # === 기록 (게임 경로, I/O 없음) ===
+
+    def record_submission(self, session_id: Optional[str], user_id: int, word: str, is_valid: bool,
+                          validation_reason: Optional[str] = None, response_time_ms: Optional[int] = None,
+                          score_earned: int = 0, round_number: Optional[int] = None,
+                          turn_order: Optional[int] = None):
+        """단어 제출 기록 추가"""
+        if not self.enabled:
+            return
+        if not session_id:
+            self.stats["skipped"] += 1
+            return
+        self._submissions.append({
+            "session_id": session_id,
+            "user_id": user_id,
+            "word": word[:100],
+            "is_valid": is_valid,
+            "validation_reason": validation_reason,
+            "response_time_ms": response_time_ms,
+            "score_earned": score_earned,
+            "round_number": round_number,
+            "turn_order": turn_order,
+            "submitted_at": datetime.now(timezone.utc).isoformat()
+        })
+        self._queued()
+
+    def record_event(self, session_id: Optional[str], user_id: Optional[int], action_type: str,
+                     action_data: Optional[Dict[str, Any]] = None, round_number: Optional[int] = None):
+        """게임 로그(아이템 사용 등) 기록 추가"""
+        if not self.enabled:
+            return
+        if not session_id:
+            self.stats["skipped"] += 1
+            return
+        self._events.append({
+            "session_id": session_id,
+            "user_id": user_id,
+            "action_type": action_type,
+            "action_data": action_data or {},
+            "round_number": round_number,
+            "timestamp": datetime.now(timezone.utc).isoformat()
+        })
+        self._queued()
+
+    def _queued(self):
+        """큐 크기에 따라 즉시 기록 또는 디스크 임시 저장"""
+        self.stats["queued"] += 1
+        pending = self.pending
+        if pending >= self.max_pending:
+            # 기록이 밀리는 중: 큐를 비워 디스크로 넘김 (메모리 상한 유지)
+            self._spill_in_background(self._take_batch())
+        elif pending >= self.batch_size:
+            self._wakeup.set()
+
+    def _take_batch(self) -> Batch:
+        """대기 중인 기록을 꺼냄"""
+        batch = {"submissions": self._submissions, "events": self._events}
+        self._submissions = []
+        self._events = []
+        return batch
+
+    # === Postgres 기록 ===
+
+    async def _flush_loop(self):
+        """크기 또는 시간 기준으로 배치 기록"""
+        while True:
+            try:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._wakeup.clear()
+                await self.flush()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.error(f"감사 로그 기록 루프 오류: {e}")
+                await asyncio.sleep(1)
+
+    async def flush(self) -> bool:
+        """대기 중인 기록을 한 번에 INSERT (실패 시 디스크 임시 저장), 성공하면 임시 저장분 재전송"""
+        if self.pending:
+            batch = self._take_batch()
+            try:
+                await asyncio.to_thread(self._write_batch, batch)
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.warning(f"감사 로그 기록 실패, 디스크에 임시 저장: {e}")
+                await asyncio.to_thread(self._spill, batch)
+                return False
+        await self._replay_spool()
+        return True
+
+    def _write_batch(self, batch: Batch):
+        """한 트랜잭션에서 executemany로 INSERT"""
+        submissions = [self._decode(row, "submitted_at") for row in batch["submissions"]]
+        events = [self._decode(row, "timestamp") for row in batch["events"]]
+        db = next(get_db())
+        try:
+            if submissions:
+                db.execute(insert(WordSubmission), submissions)
+            if events:
+                db.execute(insert(GameLog), events)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+        self.stats["written"] += len(submissions) + len(events)
+        self.stats["batches"] += 1
+
+    @staticmethod
+    def _decode(row: Dict[str, Any], time_field: str) -> Dict[str, Any]:
+        """큐/파일에 저장된 문자열 값을 컬럼 타입으로 변환"""
+        return {
+            **row,
+            "session_id": uuid.UUID(row["session_id"]),
+            time_field: datetime.fromisoformat(row[time_field])
+        }
+
+    # === 디스크 임시 저장 ===
+
+    def _spill_in_background(self, batch: Batch):
+        """이벤트 루프를 막지 않도록 스레드에서 디스크 저장"""
+        try:
+            task = asyncio.get_running_loop().create_task(asyncio.to_thread(self._spill, batch))
+        except RuntimeError:
+            self._spill(batch)
+            return
+        self._spill_tasks.add(task)
+        task.add_done_callback(self._spill_tasks.discard)
+
+    def _spill(self, batch: Batch):
+        """배치를 JSON Lines 파일로 저장 (임시 파일 후 교체)"""
+        count = len(batch["submissions"]) + len(batch["events"])
+        if not count:
+            return
+        target = self.spool_dir / f"{datetime.now(timezone.utc):%Y%m%d%H%M%S%f}-{os.getpid()}-{uuid.uuid4().hex[:8]}.jsonl"
+        temp = target.with_suffix(".tmp")
+        try:
+            self.spool_dir.mkdir(parents=True, exist_ok=True)
+            with open(temp, "w", encoding="utf-8") as f:
+                for kind in ("submissions", "events"):
+                    for row in batch[kind]:
+                        f.write(json.dumps({"k": kind, "r": row}, ensure_ascii=False) + "\n")
+            temp.replace(target)
+            self.stats["spilled"] += count
+        except OSError as e:
+            self.stats["errors"] += 1
+            logger.error(f"감사 로그 임시 저장 실패, {count}건 유실: {e}")
+
+    async def _replay_spool(self, max_files: int = 4):
+        """임시 저장된 파일을 오래된 순으로 재전송 (기록 후 삭제)"""
+        try:
+            files = sorted(self.spool_dir.glob("*.jsonl"))[:max_files]
+        except OSError:
+            return
+        for path in files:
+            try:
+                batch = await asyncio.to_thread(self._read_spool, path)
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                # 깨진 파일은 다시 읽어도 같으므로 바로 격리
+                self.stats["errors"] += 1
+                self._quarantine(path, e)
+                continue
+            try:
+                await asyncio.to_thread(self._write_batch, batch)
+                path.unlink(missing_ok=True)
+                self._replay_failures.pop(path.name, None)
+                self.stats["replayed"] += len(batch["submissions"]) + len(batch["events"])
+            except Exception as e:
+                self.stats["errors"] += 1
+                failures = self._replay_failures.get(path.name, 0) + 1
+                if failures < self.max_replay_attempts:
+                    # DB 장애일 수 있으므로 다음 주기에 같은 파일부터 다시 시도
+                    self._replay_failures[path.name] = failures
+                    logger.warning(f"감사 로그 재전송 실패 ({path.name}, {failures}회): {e}")
+                    return
+                # 계속 기록되지 않는 파일이 뒤의 파일을 막지 않도록 격리 후 다음 파일 진행
+                self._quarantine(path, e)
+
+    def _quarantine(self, path: Path, error: Exception):
+        """재전송할 수 없는 임시 저장 파일을 *.bad로 옮겨 보관 (수동 확인용)"""
+        self._replay_failures.pop(path.name, None)
+        try:
+            path.replace(path.with_suffix(".bad"))
+            self.stats["quarantined"] += 1
+            logger.error(f"감사 로그 임시 저장 파일 격리 ({path.name}): {error}")
+        except OSError as e:
+            logger.error(f"감사 로그 임시 저장 파일 격리 실패 ({path.name}): {e}")
+
+    @staticmethod
+    def _read_spool(path: Path) -> Batch:
+        """임시 저장 파일 읽기"""
+        batch: Batch = {"submissions": [], "events": []}
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    item = json.loads(line)
+                    batch[item["k"]].append(item["r"])
+        return batch
+
+    async def stop(self):
+        """기록 태스크 종료 후 남은 기록 처리"""
+        if self._flush_task and not self._flush_task.done():
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+        if self._spill_tasks:
+            await asyncio.gather(*self._spill_tasks, return_exceptions=True)
+        if self.pending:
+            await self.flush()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """감사 로그 기록 통계"""
+        return {
+            "enabled": self.enabled,
+            "pending": self.pending,
+            "running": self._flush_task is not None and not self._flush_task.done(),
+            **self.stats
+        }
+
+
+# 전역 감사 로그 기록기 인스턴스
+audit_log_writer = AuditLogWriter()
+
+
+def get_audit_log_writer() -> AuditLogWriter:
+    """감사 로그 기록기 의존성"""
+    return audit_log_writer
@@ -0,0 +1,201 @@
+"""
+캐시 무효화 버스
+여러 노드의 L1 캐시 무효화를 Redis Pub/Sub로 전파, 짧은 주기 배치 발행,
+태그(카테고리) 버전으로 전체 무효화 및 지연 도착 값 차단
+"""
+
+import os
+import json
+import uuid
+import asyncio
+import logging
+from typing import Dict, Set, Optional, Any, Callable, Iterable
+from database import get_redis, get_async_redis
+
+logger = logging.getLogger(__name__)
+
+
+ApplyInvalidation = Callable[[Iterable[str], Iterable[str], Dict[str, int]], None]
+
+
+class CacheInvalidationBus:
+    """Redis Pub/Sub 기반 L1 캐시 무효화 버스"""
+
+    def __init__(self, apply: ApplyInvalidation, resync: Callable[[Dict[str, int]], None]):
+        self.apply = apply
+        self.resync = resync
+        self.enabled = os.getenv("CACHE_INVALIDATION_ENABLED", "true").lower() == "true"
+        self.node_id = os.getenv("NODE_ID") or uuid.uuid4().hex[:12]
+        self.channel = "cache:invalidate"
+        self.versions_key = "cache:tag_versions"
+        self.flush_interval = 0.005  # 발행 배치 주기 (초)
+
+        # 다음 배치로 발행할 키/패턴/태그 버전
+        self._pending_keys: Set[str] = set()
+        self._pending_patterns: Set[str] = set()
+        self._pending_tags: Dict[str, int] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+
+        self._pubsub = None
+        self._listener_task: Optional[asyncio.Task] = None
+        self._subscribed = asyncio.Event()
+        self.stats = {
+            "published": 0, "received": 0, "keys_invalidated": 0,
+            "patterns_invalidated": 0, "tags_bumped": 0, "resyncs": 0, "errors": 0
+        }
+
+    async def start(self, timeout: float = 2.0):
+        """무효화 채널 구독 시작 (첫 구독 및 L1 재동기화까지 대기)"""
+        if not self.enabled:
+            return
+        if self._listener_task is None or self._listener_task.done():
+            self._listener_task = asyncio.create_task(self._listen())
+        try:
+            await asyncio.wait_for(self._subscribed.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning("캐시 무효화 채널 구독이 지연되고 있습니다")
+
+    # === 발행 ===
+
+    def invalidate_keys(self, keys: Iterable[str]):
+        """다른 노드의 L1에서 키 삭제 요청"""
+        if not self.enabled:
+            return
+        self._pending_keys.update(keys)
+        self._schedule_flush()
+
+    def invalidate_pattern(self, pattern: str):
+        """다른 노드의 L1에서 패턴 매칭 키 삭제 요청"""
+        if not self.enabled:
+            return
+        self._pending_patterns.add(pattern)
+        self._schedule_flush()
+
+    def bump_tag(self, tag: str) -> Optional[int]:
+        """태그 버전 증가 (이전 버전으로 저장된 모든 L1 항목 무효화, 새 버전 반환)"""
+        if not self.enabled:
+            return None
+        try:
+            version = int(get_redis().hincrby(self.versions_key, tag, 1))
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.error(f"캐시 태그 버전 증가 실패 ({tag}): {e}")
+            return None
+        self._pending_tags[tag] = max(version, self._pending_tags.get(tag, 0))
+        self._schedule_flush()
+        return version
+
+    def _schedule_flush(self):
+        """다음 배치 발행 예약"""
+        if self._flush_handle is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush()  # 이벤트 루프 밖에서는 즉시 발행
+            return
+        self._flush_handle = loop.call_later(self.flush_interval, self.flush)
+
+    def flush(self):
+        """대기 중인 무효화를 한 메시지로 발행"""
+        self._flush_handle = None
+        if not (self._pending_keys or self._pending_patterns or self._pending_tags):
+            return
+
+        envelope = {
+            "o": self.node_id,
+            "k": list(self._pending_keys),
+            "p": list(self._pending_patterns),
+            "t": dict(self._pending_tags)
+        }
+        self._pending_keys.clear()
+        self._pending_patterns.clear()
+        self._pending_tags.clear()
+
+        try:
+            get_redis().publish(self.channel, json.dumps(envelope, ensure_ascii=False))
+            self.stats["published"] += 1
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.error(f"캐시 무효화 발행 실패: {e}")
+
+    # === 수신 ===
+
+    def _load_versions(self) -> Dict[str, int]:
+        """Redis에 저장된 전체 태그 버전"""
+        versions = get_redis().hgetall(self.versions_key) or {}
+        return {tag: int(version) for tag, version in versions.items()}
+
+    async def _listen(self):
+        """수신 루프 (재연결 시 놓친 무효화에 대비해 L1 재동기화)"""
+        while True:
+            try:
+                self._pubsub = get_async_redis().pubsub(ignore_subscribe_messages=True)
+                await self._pubsub.subscribe(self.channel)
+
+                # 구독 이전 또는 연결이 끊긴 동안의 무효화는 알 수 없으므로 L1을 비우고 버전 동기화
+                self.resync(self._load_versions())
+                self.stats["resyncs"] += 1
+                self._subscribed.set()
+
+                while True:
+                    message = await self._pubsub.get_message(timeout=1.0)
+                    if message is not None:
+                        self._dispatch(message)
+
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.error(f"캐시 무효화 수신 중 오류: {e}")
+                self._subscribed.clear()
+                await self._close_pubsub()
+                await asyncio.sleep(1)
+
+    def _dispatch(self, raw: Dict[str, Any]):
+        """수신한 무효화를 로컬 L1에 반영"""
+        if raw.get("type") != "message":
+            return
+
+        envelope = json.loads(raw["data"])
+        if envelope.get("o") == self.node_id:
+            return  # 자기 노드의 무효화는 이미 반영됨
+
+        keys = envelope.get("k", [])
+        patterns = envelope.get("p", [])
+        tags = envelope.get("t", {})
+        self.stats["received"] += 1
+        self.stats["keys_invalidated"] += len(keys)
+        self.stats["patterns_invalidated"] += len(patterns)
+        self.stats["tags_bumped"] += len(tags)
+        self.apply(keys, patterns, tags)
+
+    async def _close_pubsub(self):
+        if self._pubsub is not None:
+            try:
+                await self._pubsub.aclose()
+            except Exception:
+                pass
+            self._pubsub = None
+
+    async def stop(self):
+        """남은 무효화 발행 후 수신 태스크 정리"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+        self.flush()
+        if self._listener_task and not self._listener_task.done():
+            self._listener_task.cancel()
+            try:
+                await self._listener_task
+            except asyncio.CancelledError:
+                pass
+        await self._close_pubsub()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """무효화 버스 통계"""
+        return {
+            "enabled": self.enabled,
+            "node_id": self.node_id,
+            "listening": self._listener_task is not None and not self._listener_task.done(),
+            **self.stats
+        }
@@ -3,7 +3,12 @@
 Redis 기반 지능형 캐싱, 성능 최적화, 메모리 관리
 """
 
+import os
+import sys
 import json
+import time
+import fnmatch
+import uuid
 import logging
 import hashlib
 from typing import Any, Dict, List, Optional, Union, Callable
@@ -11,10 +16,36 @@ from datetime import datetime, timezone, timedelta
 from dataclasses import dataclass, asdict
 from enum import Enum
 from database import get_redis
+from utils.tinylfu import TinyLFUCache, CacheEntry
+from services.cache_invalidation import CacheInvalidationBus
 import asyncio
 
 logger = logging.getLogger(__name__)
 
+_MISSING = object()
+
+# 항목 객체 + 데이터/세그먼트 딕셔너리 슬롯 (약 100바이트)
+_L1_ENTRY_OVERHEAD = sys.getsizeof(CacheEntry("", None, None, 0)) + 100
+
+
+def _deep_sizeof(value: Any) -> int:
+    """값이 차지하는 메모리 바이트 (컨테이너 내부 포함, 같은 객체는 한 번만 계산)"""
+    total = 0
+    seen = set()
+    stack = [value]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+    return total
+
 
 class CacheStrategy(str, Enum):
     """캐시 전략"""
@@ -56,6 +87,10 @@ class CacheStats:
     deletes: int = 0
     evictions: int = 0
     memory_usage: int = 0
+    coalesced: int = 0                 # 진행 중인 로드에 합류한 요청 수
+    stale_served: int = 0              # 재검증 중 반환된 오래된 값 수
+    refreshes: int = 0                 # 백그라운드 재검증 수
+    stale_dropped: int = 0             # 조회 중 무효화되어 L1에 저장하지 않은 값 수
     
     @property
     def hit_rate(self) -> float:
@@ -80,15 +115,33 @@ class CacheService:
     def __init__(self):
         self.redis_client = get_redis()
         
-        # 다단계 캐시
-        self.l1_cache: Dict[str, Any] = {}  # 메모리 캐시
-        self.l1_access_times: Dict[str, datetime] = {}
-        self.l1_access_counts: Dict[str, int] = {}
-        self.l1_max_size = 1000
+        # 다단계 캐시 (L1: W-TinyLFU 메모리 캐시, TTL은 조회 시점에 만료, 바이트 총량 제한)
+        self.l1_max_size = int(os.getenv("CACHE_L1_MAX_ENTRIES", "10000"))
+        self.l1_max_bytes = int(os.getenv("CACHE_L1_MAX_BYTES", str(32 * 1024 * 1024)))
+        self.l1 = TinyLFUCache(max_size=self.l1_max_size, max_weight=self.l1_max_bytes, group_of=self._tag_of)
+        self.l1_category_hits: Dict[str, int] = {}
+        self.l1_category_misses: Dict[str, int] = {}
+        
+        # 노드 간 L1 무효화 (L1 항목은 저장 시점의 태그 버전과 함께 보관)
+        self.tag_versions: Dict[str, int] = {}
+        # 키/패턴 무효화 순번 (원본 조회 중 무효화가 지나가면 그 결과는 L1에 저장하지 않음)
+        self.invalidation_seq = 0
+        self.invalidation = CacheInvalidationBus(self._apply_invalidation, self._resync_l1)
+        # 무효화가 전파되면 L1을 더 오래 유지해도 안전
+        default_l1_ttl = "1800" if self.invalidation.enabled else "300"
+        self.l1_max_ttl = int(os.getenv("CACHE_L1_MAX_TTL", default_l1_ttl))
+        
+        # 마지막 워밍업 결과 (사전 인덱스 출처, 소요 시간)
+        self.last_warmup: Dict[str, Any] = {}
         
         # 캐시 통계
         self.stats = CacheStats()
         
+        # 키별 진행 중인 로드 (동시 미스 합치기)
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._refresh_tasks: set = set()
+        self.lock_timeout_ms = 5000
+        
         # 캐시 키 접두사
         self.prefixes = {
             "word_validation": "word_val:",
@@ -102,26 +155,6 @@ class CacheService:
             "user_profile": "user_profile:",
             "daily_stats": "daily_stats:"
         }
-        
-        # 비동기 정리 작업
-        self._cleanup_task = None
-        self._start_cleanup_task()
-    
-    def _start_cleanup_task(self):
-        """정리 작업 시작"""
-        if self._cleanup_task is None or self._cleanup_task.done():
-            self._cleanup_task = asyncio.create_task(self._periodic_cleanup())
-    
-    async def _periodic_cleanup(self):
-        """주기적 캐시 정리"""
-        while True:
-            try:
-                await asyncio.sleep(300)  # 5분마다 실행
-                await self._cleanup_expired_l1()
-                await self._enforce_l1_size_limit()
-                logger.debug("캐시 정리 완료")
-            except Exception as e:
-                logger.error(f"캐시 정리 중 오류: {e}")
     
     def _make_key(self, category: str, key: str) -> str:
         """캐시 키 생성"""
@@ -139,70 +172,82 @@ class CacheService:
     
     # === L1 캐시 (메모리) 관리 ===
     
-    def _get_l1(self, key: str) -> Optional[Any]:
-        """L1 캐시에서 조회"""
-        if key in self.l1_cache:
-            # 액세스 통계 업데이트
-            self.l1_access_times[key] = datetime.now(timezone.utc)
-            self.l1_access_counts[key] = self.l1_access_counts.get(key, 0) + 1
-            self.stats.hits += 1
-            return self.l1_cache[key]
-        
+    @staticmethod
+    def _tag_of(cache_key: str) -> str:
+        """캐시 키의 태그 (카테고리 접두사)"""
+        return cache_key.split(":", 1)[0]
+    
+    def _tag_version(self, cache_key: str) -> int:
+        """캐시 키가 속한 태그의 현재 버전"""
+        return self.tag_versions.get(self._tag_of(cache_key), 0)
+    
+    def _get_l1(self, key: str) -> Any:
+        """L1 캐시에서 조회 (없거나 태그 버전이 지났으면 _MISSING)"""
+        tag = self._tag_of(key)
+        entry = self.l1.get(key, _MISSING)
+        if entry is not _MISSING:
+            version, value = entry
+            if version >= self.tag_versions.get(tag, 0):
+                self.stats.hits += 1
+                self.l1_category_hits[tag] = self.l1_category_hits.get(tag, 0) + 1
+                return value
+            self.l1.delete(key)
         self.stats.misses += 1
-        return None
-    
-    def _set_l1(self, key: str, value: Any, ttl: Optional[int] = None):
-        """L1 캐시에 저장"""
-        # 크기 제한 확인
-        if len(self.l1_cache) >= self.l1_max_size:
-            self._evict_l1_item()
-        
-        self.l1_cache[key] = {
-            "data": value,
-            "created_at": datetime.now(timezone.utc),
-            "ttl": ttl,
-            "expires_at": datetime.now(timezone.utc) + timedelta(seconds=ttl) if ttl else None
-        }
-        
-        self.l1_access_times[key] = datetime.now(timezone.utc)
-        self.l1_access_counts[key] = 1
-        self.stats.sets += 1
-    
-    def _evict_l1_item(self):
-        """L1 캐시 항목 퇴출 (LRU 전략)"""
-        if not self.l1_cache:
+        self.l1_category_misses[tag] = self.l1_category_misses.get(tag, 0) + 1
+        return _MISSING
+    
+    def _set_l1(self, key: str, value: Any, ttl: Optional[int] = None, version: Optional[int] = None,
+                seq: Optional[int] = None):
+        """L1 캐시에 저장 (version/seq는 원본을 읽기 전에 확인한 태그 버전과 무효화 순번)"""
+        if seq is not None and seq != self.invalidation_seq:
+            # 조회 중 무효화가 도착함, 오래된 값일 수 있으므로 L1에 남기지 않음
+            self.stats.stale_dropped += 1
             return
-        
-        # 가장 오래 전에 액세스된 항목 찾기
-        oldest_key = min(self.l1_access_times.keys(), 
-                        key=lambda k: self.l1_access_times[k])
-        
-        self._delete_l1(oldest_key)
-        self.stats.evictions += 1
+        if version is None:
+            version = self._tag_version(key)
+        ttl = min(ttl, self.l1_max_ttl) if ttl else self.l1_max_ttl
+        entry = (version, value)
+        # 저장 시점에 한 번만 크기 측정 (키 + 값 + 항목 오버헤드)
+        size = sys.getsizeof(key) + _deep_sizeof(entry) + _L1_ENTRY_OVERHEAD
+        self.stats.evictions += self.l1.set(key, entry, ttl, weight=size)
+        self.stats.sets += 1
     
     def _delete_l1(self, key: str):
         """L1 캐시 항목 삭제"""
-        self.l1_cache.pop(key, None)
-        self.l1_access_times.pop(key, None)
-        self.l1_access_counts.pop(key, None)
-        self.stats.deletes += 1
+        self.invalidation_seq += 1
+        if self.l1.delete(key):
+            self.stats.deletes += 1
     
-    async def _cleanup_expired_l1(self):
-        """만료된 L1 캐시 항목 정리"""
-        now = datetime.now(timezone.utc)
-        expired_keys = []
-        
-        for key, cached_item in self.l1_cache.items():
-            if cached_item["expires_at"] and now >= cached_item["expires_at"]:
-                expired_keys.append(key)
-        
-        for key in expired_keys:
+    def _delete_l1_pattern(self, pattern: str):
+        """L1 캐시에서 패턴 매칭 항목 삭제"""
+        self.invalidation_seq += 1
+        for key in self.l1.keys():
+            if fnmatch.fnmatch(key, pattern):
+                self._delete_l1(key)
+    
+    def _apply_invalidation(self, keys, patterns, tags: Dict[str, int]):
+        """다른 노드에서 받은 무효화 반영"""
+        for tag, version in tags.items():
+            if version > self.tag_versions.get(tag, 0):
+                self.tag_versions[tag] = version
+        for key in keys:
             self._delete_l1(key)
+        for pattern in patterns:
+            self._delete_l1_pattern(pattern)
+    
+    def _resync_l1(self, versions: Dict[str, int]):
+        """무효화 채널 (재)구독 시 L1 비우고 태그 버전 동기화"""
+        self._apply_invalidation((), (), versions)
+        self.invalidation_seq += 1
+        self.l1.clear()
     
-    async def _enforce_l1_size_limit(self):
-        """L1 캐시 크기 제한 적용"""
-        while len(self.l1_cache) > self.l1_max_size:
-            self._evict_l1_item()
+    async def start(self):
+        """노드 간 L1 무효화 수신 시작"""
+        await self.invalidation.start()
+    
+    async def stop(self):
+        """L1 무효화 수신 종료"""
+        await self.invalidation.stop()
     
     # === L2 캐시 (Redis) 관리 ===
     
@@ -234,34 +279,160 @@ class CacheService:
     
     # === 공통 캐시 인터페이스 ===
     
-    async def get(self, category: str, key: str, default: Any = None) -> Any:
-        """캐시에서 값 조회 (다단계)"""
-        cache_key = self._make_key(category, key)
-        
+    async def _lookup(self, cache_key: str) -> Any:
+        """L1 → L2 순서로 원본 캐시 값 조회 (없으면 _MISSING)"""
         # L1 캐시 확인
         l1_result = self._get_l1(cache_key)
-        if l1_result is not None:
-            return l1_result["data"]
+        if l1_result is not _MISSING:
+            return l1_result
         
-        # L2 캐시 확인
+        # L2 캐시 확인 (조회 중 도착한 무효화를 놓치지 않도록 버전을 먼저 확인)
+        version, seq = self._tag_version(cache_key), self.invalidation_seq
         l2_result = await self._get_l2(cache_key)
         if l2_result is not None:
             # L1에도 저장
-            self._set_l1(cache_key, l2_result, ttl=300)  # L1은 5분 TTL
+            self._set_l1(cache_key, l2_result, version=version, seq=seq)
             return l2_result
         
-        return default
+        return _MISSING
+    
+    @staticmethod
+    def _unwrap(raw: Any) -> tuple:
+        """재검증용 래퍼 해제 (값, 신선 여부)"""
+        if isinstance(raw, dict) and raw.get("__swr__"):
+            return raw["v"], time.time() < raw["fresh_until"]
+        return raw, True
+    
+    async def get(self, category: str, key: str, default: Any = None) -> Any:
+        """캐시에서 값 조회 (다단계)"""
+        raw = await self._lookup(self._make_key(category, key))
+        if raw is _MISSING:
+            return default
+        return self._unwrap(raw)[0]
+    
+    async def get_or_load(self, category: str, key: str, loader: Callable, ttl: int = 3600,
+                          stale_ttl: int = 0, distributed: bool = False) -> Any:
+        """캐시 조회, 미스 시 키당 한 번만 로드 (stale_ttl 동안은 오래된 값 반환 후 백그라운드 재검증)"""
+        cache_key = self._make_key(category, key)
+        
+        raw = await self._lookup(cache_key)
+        if raw is not _MISSING:
+            value, fresh = self._unwrap(raw)
+            if not fresh:
+                self.stats.stale_served += 1
+                self._refresh_in_background(cache_key, loader, ttl, stale_ttl, distributed)
+            return value
+        
+        return await self._load_once(cache_key, loader, ttl, stale_ttl, distributed)
+    
+    async def _load_once(self, cache_key: str, loader: Callable, ttl: int,
+                         stale_ttl: int, distributed: bool) -> Any:
+        """동시에 들어온 미스를 하나의 로드로 합침"""
+        inflight = self._inflight.get(cache_key)
+        if inflight is not None:
+            self.stats.coalesced += 1
+            return await asyncio.shield(inflight)
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = future
+        try:
+            if distributed:
+                value = await self._load_with_lock(cache_key, loader, ttl, stale_ttl)
+            else:
+                value = await self._load_and_store(cache_key, loader, ttl, stale_ttl)
+            future.set_result(value)
+            return value
+        except BaseException as e:
+            if isinstance(e, Exception):
+                future.set_exception(e)
+                future.exception()  # 대기자가 없어도 경고가 남지 않도록 확인 처리
+            else:
+                future.cancel()
+            raise
+        finally:
+            self._inflight.pop(cache_key, None)
+    
+    async def _load_and_store(self, cache_key: str, loader: Callable, ttl: int, stale_ttl: int) -> Any:
+        """로더 실행 후 L1/L2에 저장"""
+        version, seq = self._tag_version(cache_key), self.invalidation_seq
+        value = await loader() if asyncio.iscoroutinefunction(loader) else loader()
+        if asyncio.iscoroutine(value):
+            value = await value
+        
+        if stale_ttl > 0:
+            stored = {"__swr__": True, "v": value, "fresh_until": time.time() + ttl}
+            self._set_l1(cache_key, stored, ttl + stale_ttl, version=version, seq=seq)
+            await self._set_l2(cache_key, stored, ttl + stale_ttl)
+        else:
+            self._set_l1(cache_key, value, ttl, version=version, seq=seq)
+            await self._set_l2(cache_key, value, ttl)
+        return value
+    
+    async def _load_with_lock(self, cache_key: str, loader: Callable, ttl: int, stale_ttl: int) -> Any:
+        """Redis 락으로 여러 노드의 동시 로드를 하나로 합침"""
+        lock_key = f"lock:{cache_key}"
+        token = uuid.uuid4().hex
+        try:
+            acquired = self.redis_client.set(lock_key, token, nx=True, px=self.lock_timeout_ms)
+        except Exception as e:
+            logger.error(f"캐시 로드 락 획득 중 오류: {e}")
+            acquired = True  # Redis 장애 시 로컬 합치기만 적용
+            token = None
+        
+        if not acquired:
+            # 다른 노드가 로드 중이면 결과가 L2에 저장될 때까지 대기
+            deadline = time.monotonic() + self.lock_timeout_ms / 1000
+            while time.monotonic() < deadline:
+                await asyncio.sleep(0.05)
+                version, seq = self._tag_version(cache_key), self.invalidation_seq
+                raw = await self._get_l2(cache_key)
+                if raw is not None:
+                    self._set_l1(cache_key, raw, ttl + stale_ttl, version=version, seq=seq)
+                    return self._unwrap(raw)[0]
+            logger.warning(f"캐시 로드 락 대기 시간 초과, 직접 로드: {cache_key}")
+        
+        try:
+            return await self._load_and_store(cache_key, loader, ttl, stale_ttl)
+        finally:
+            if acquired and token:
+                try:
+                    # 자신이 잡은 락만 해제
+                    self.redis_client.eval(
+                        "if redis.call('get', KEYS[1]) == ARGV[1] then return redis.call('del', KEYS[1]) end return 0",
+                        1, lock_key, token
+                    )
+                except Exception as e:
+                    logger.error(f"캐시 로드 락 해제 중 오류: {e}")
+    
+    def _refresh_in_background(self, cache_key: str, loader: Callable, ttl: int,
+                               stale_ttl: int, distributed: bool):
+        """오래된 값을 반환하는 동안 키당 하나의 재검증만 실행"""
+        if cache_key in self._inflight:
+            return
+        
+        self.stats.refreshes += 1
+        task = asyncio.create_task(self._load_once(cache_key, loader, ttl, stale_ttl, distributed))
+        self._refresh_tasks.add(task)
+        
+        def _done(t: asyncio.Task):
+            self._refresh_tasks.discard(t)
+            if not t.cancelled() and t.exception():
+                logger.error(f"캐시 재검증 중 오류 ({cache_key}): {t.exception()}")
+        
+        task.add_done_callback(_done)
     
     async def set(self, category: str, key: str, value: Any, ttl: int = 3600):
         """캐시에 값 저장 (다단계)"""
         cache_key = self._make_key(category, key)
         
-        # L1 캐시 저장
-        l1_ttl = min(ttl, 300)  # L1은 최대 5분
-        self._set_l1(cache_key, value, l1_ttl)
+        # L1 캐시 저장 (최대 l1_max_ttl)
+        self._set_l1(cache_key, value, ttl)
         
         # L2 캐시 저장
         await self._set_l2(cache_key, value, ttl)
+        
+        # 다른 노드의 이전 값 제거
+        self.invalidation.invalidate_keys([cache_key])
     
     async def delete(self, category: str, key: str):
         """캐시에서 삭제"""
@@ -276,13 +447,17 @@ class CacheService:
             self.stats.deletes += 1
         except Exception as e:
             logger.error(f"L2 캐시 삭제 중 오류: {e}")
+        
+        # 다른 노드의 L1에서 삭제
+        self.invalidation.invalidate_keys([cache_key])
     
     async def exists(self, category: str, key: str) -> bool:
         """캐시에 키가 존재하는지 확인"""
         cache_key = self._make_key(category, key)
         
         # L1 확인
-        if cache_key in self.l1_cache:
+        entry = self.l1.get(cache_key, _MISSING, record=False)
+        if entry is not _MISSING and entry[0] >= self._tag_version(cache_key):
             return True
         
         # L2 확인
@@ -296,15 +471,14 @@ class CacheService:
         """패턴 기반 캐시 무효화"""
         cache_pattern = self._make_key(category, pattern)
         
-        # L1 캐시에서 패턴 매칭 삭제
-        import fnmatch
-        keys_to_delete = []
-        for key in self.l1_cache.keys():
-            if fnmatch.fnmatch(key, cache_pattern):
-                keys_to_delete.append(key)
-        
-        for key in keys_to_delete:
-            self._delete_l1(key)
+        # 카테고리 전체 무효화는 태그 버전만 올림 (모든 노드의 L1 항목이 조회 시점에 무효)
+        version = self.invalidation.bump_tag(self._tag_of(cache_pattern)) if pattern == "*" else None
+        if version is not None:
+            self._apply_invalidation((), (), {self._tag_of(cache_pattern): version})
+        else:
+            # L1 캐시에서 패턴 매칭 삭제 후 다른 노드에 전파
+            self._delete_l1_pattern(cache_pattern)
+            self.invalidation.invalidate_pattern(cache_pattern)
         
         # L2 캐시에서 패턴 매칭 삭제
         try:
@@ -359,8 +533,9 @@ class CacheService:
     
     # === 메모이제이션 데코레이터 ===
     
-    def memoize(self, category: str, ttl: int = 3600, key_func: Optional[Callable] = None):
-        """메모이제이션 데코레이터"""
+    def memoize(self, category: str, ttl: int = 3600, key_func: Optional[Callable] = None,
+                stale_ttl: int = 0, distributed: bool = False):
+        """메모이제이션 데코레이터 (동시 호출은 한 번만 실행)"""
         def decorator(func):
             async def wrapper(*args, **kwargs):
                 # 키 생성
@@ -371,16 +546,12 @@ class CacheService:
                     key_parts.extend([f"{k}={v}" for k, v in kwargs.items()])
                     cache_key = self._hash_key("|".join(key_parts))
                 
-                # 캐시에서 조회
-                cached_result = await self.get(category, cache_key)
-                if cached_result is not None:
-                    return cached_result
-                
-                # 함수 실행 및 결과 캐싱
-                result = await func(*args, **kwargs) if asyncio.iscoroutinefunction(func) else func(*args, **kwargs)
-                await self.set(category, cache_key, result, ttl)
-                
-                return result
+                # 캐시 조회, 미스 시 같은 키의 동시 호출은 하나의 실행 결과를 공유
+                return await self.get_or_load(
+                    category, cache_key,
+                    lambda: func(*args, **kwargs),
+                    ttl=ttl, stale_ttl=stale_ttl, distributed=distributed
+                )
             
             return wrapper
         return decorator
@@ -388,14 +559,18 @@ class CacheService:
     # === 캐시 워밍업 ===
     
     async def warmup_game_data(self):
-        """게임 데이터 워밍업"""
+        """게임 데이터 워밍업 (디스크 스냅샷 우선, 사전이 바뀌었으면 Postgres에서 재생성)"""
         try:
             logger.info("캐시 워밍업 시작")
+            started = time.perf_counter()
             
-            # 자주 사용되는 단어들 사전 로드
+            # 사전 인덱스 (블룸 필터, 자주 쓰는 단어, 글자별 힌트)
             from services.word_validator import get_word_validator
-            word_validator = get_word_validator()
-            await word_validator.preload_common_words(1000)
+            index = await get_word_validator().reload_dictionary()
+            
+            # 직전 실행의 인기 캐시 키를 L2에서 일괄 복원
+            restored = self._restore_hot_keys(index.hot_keys)
+            index.hot_keys = []
             
             # 게임 모드 정보 캐싱
             from services.game_mode_service import get_game_mode_service
@@ -403,17 +578,62 @@ class CacheService:
             modes = game_mode_service.get_available_modes()
             await self.set("game_modes", "all", modes, ttl=86400)  # 24시간
             
-            logger.info("캐시 워밍업 완료")
+            self.last_warmup = {
+                "source": index.source,
+                "dictionary_version": index.version,
+                "seconds": round(time.perf_counter() - started, 3),
+                "hot_keys_restored": restored
+            }
+            logger.info(f"캐시 워밍업 완료: {self.last_warmup}")
             
         except Exception as e:
             logger.error(f"캐시 워밍업 중 오류: {e}")
     
+    def _restore_hot_keys(self, keys: List[str], chunk_size: int = 500) -> int:
+        """인기 캐시 키를 L2에서 읽어 L1에 적재 (청크당 왕복 1회)"""
+        restored = 0
+        for i in range(0, len(keys), chunk_size):
+            chunk = keys[i:i + chunk_size]
+            try:
+                pipe = self.redis_client.pipeline(transaction=False)
+                pipe.mget(chunk)
+                for key in chunk:
+                    pipe.pttl(key)
+                values, *ttls = pipe.execute()
+            except Exception as e:
+                logger.error(f"인기 캐시 키 복원 중 오류: {e}")
+                break
+            
+            for key, data, ttl_ms in zip(chunk, values, ttls):
+                if data is None or ttl_ms <= 0:
+                    continue
+                self._set_l1(key, json.loads(data), max(1, ttl_ms // 1000))
+                restored += 1
+        return restored
+    
+    async def save_warm_snapshot(self):
+        """현재 단어 정보/힌트와 인기 캐시 키를 스냅샷으로 저장 (종료 시 호출)"""
+        from services.word_validator import get_word_validator
+        word_validator = get_word_validator()
+        index = word_validator.index
+        if index.signature is None or not word_validator.warm_start_enabled:
+            return
+        snapshot = word_validator.warm_start
+        await asyncio.to_thread(
+            snapshot.save,
+            index.signature,
+            word_validator.export_warm_words(),
+            index.hints,
+            self.l1.hottest_keys(snapshot.hot_key_limit)
+        )
+    
     # === 성능 모니터링 ===
     
     async def get_performance_metrics(self) -> Dict[str, Any]:
         """캐시 성능 지표"""
-        l1_size = len(self.l1_cache)
-        l1_memory = sum(len(str(item)) for item in self.l1_cache.values())
+        l1_size = len(self.l1)
+        l1_memory = self.l1.weight
+        self.stats.memory_usage = l1_memory
         
         try:
             # Redis 정보
@@ -428,8 +648,17 @@ class CacheService:
                 "size": l1_size,
                 "max_size": self.l1_max_size,
                 "memory_usage": l1_memory,
-                "utilization": l1_size / self.l1_max_size
+                "max_bytes": self.l1_max_bytes,
+                "utilization": l1_size / self.l1_max_size,
+                "byte_utilization": l1_memory / self.l1_max_bytes if self.l1_max_bytes else 0.0,
+                "categories": self._get_category_stats(),
+                "segments": self.l1.segment_sizes(),
+                "expirations": self.l1.expirations,
+                "max_ttl": self.l1_max_ttl
             },
+            "invalidation": self.invalidation.get_stats(),
+            "warm_start": self.last_warmup,
+            "dictionary": self._get_dictionary_stats(),
             "l2_cache": {
                 "memory_usage": redis_memory
             },
@@ -439,24 +668,43 @@ class CacheService:
             }
         }
     
+    def _get_dictionary_stats(self) -> Dict[str, Any]:
+        """사전 인덱스 및 후보 단어 선적재 통계"""
+        from services.word_validator import get_word_validator
+        return get_word_validator().get_stats()
+    
+    def _get_category_stats(self) -> Dict[str, Dict[str, Any]]:
+        """카테고리별 L1 점유량 및 적중률 (집계값만 사용)"""
+        occupancy = self.l1.group_stats()
+        categories = set(occupancy) | set(self.l1_category_hits) | set(self.l1_category_misses)
+        
+        result = {}
+        for tag in sorted(categories):
+            hits = self.l1_category_hits.get(tag, 0)
+            misses = self.l1_category_misses.get(tag, 0)
+            usage = occupancy.get(tag, {"entries": 0, "weight": 0})
+            result[tag] = {
+                "entries": usage["entries"],
+                "bytes": usage["weight"],
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": hits / (hits + misses) if hits + misses else 0.0
+            }
+        return result
+    
     async def reset_stats(self):
         """통계 초기화"""
         self.stats = CacheStats()
+        self.l1_category_hits.clear()
+        self.l1_category_misses.clear()
     
     async def clear_all_cache(self):
         """모든 캐시 클리어 (개발/테스트용)"""
         # L1 캐시 클리어
-        self.l1_cache.clear()
-        self.l1_access_times.clear()
-        self.l1_access_counts.clear()
+        self.l1.clear()
         
         # L2 캐시 클리어 (주의: 모든 Redis 키 삭제)
         logger.warning("전체 캐시를 클리어합니다")
-        
-    def __del__(self):
-        """소멸자"""
-        if self._cleanup_task and not self._cleanup_task.done():
-            self._cleanup_task.cancel()
 
 
 # 전역 캐시 서비스 인스턴스
@@ -3,6 +3,7 @@
 게임 시작/종료, 턴 관리, 라운드 진행, 승리 조건 검사
 """
 
+import uuid
 import asyncio
 import logging
 from typing import Dict, List, Optional, Any, Tuple
@@ -11,10 +12,11 @@ from enum import Enum
 from dataclasses import dataclass
 from redis_models import RedisGameManager, GameState, GamePlayer, WordChainState
 from database import get_redis, get_db
-from models.game_models import GameRoom, GameSession
+from models.game_models import GameRoom
 from models.user_models import User
 from services.word_validator import ValidationResult
-from sqlalchemy import select
+from services.audit_log_writer import get_audit_log_writer
+from services.game_finalizer import get_game_finalizer
 
 logger = logging.getLogger(__name__)
 
@@ -63,9 +65,11 @@ class GameEngine:
         self.active_games: Dict[str, GameState] = {}
         self.game_timers: Dict[str, asyncio.Task] = {}
         
-        # 단어 검증기 초기화
-        from services.word_validator import WordValidator
-        self.word_validator = WordValidator()
+        # 단어 검증기 (사전 인덱스를 재적재하는 전역 인스턴스 공유)
+        from services.word_validator import get_word_validator
+        self.word_validator = get_word_validator()
+        self.audit_log = get_audit_log_writer()
+        self.finalizer = get_game_finalizer()
         
         # 게임 모드 서비스 지연 로딩 (순환 import 방지)
         self._game_mode_service = None
@@ -329,6 +333,7 @@ class GameEngine:
             # 게임 시작 처리
             game_state.status = GamePhase.STARTING.value
             game_state.started_at = datetime.now(timezone.utc).isoformat()
+            game_state.session_id = str(uuid.uuid4())
             game_state.current_round = 1
             game_state.current_turn = 0
             
@@ -342,9 +347,6 @@ class GameEngine:
             await self.redis_manager.update_game_state(room_id, game_state)
             self.active_games[room_id] = game_state
             
-            # 게임 세션 기록 생성
-            await self._create_game_session_record(room_id, game_state)
-            
             # 게임 상태를 PLAYING으로 변경하고 첫 턴 시작
             game_state.status = GamePhase.PLAYING.value
             await self.redis_manager.update_game_state(room_id, game_state)
@@ -417,8 +419,8 @@ class GameEngine:
             
             await self.redis_manager.update_game_state(room_id, game_state)
             
-            # 게임 세션 업데이트
-            await self._update_game_session_record(room_id, game_state, reason.value, results)
+            # 게임 기록/통계/드롭/리더보드는 백그라운드에서 한 트랜잭션으로 반영
+            self.finalizer.submit(self.finalizer.build_payload(room_id, game_state, results, reason.value))
             
             # 활성 게임에서 제거
             if room_id in self.active_games:
@@ -448,6 +450,7 @@ class GameEngine:
                 "score": player.score,
                 "words_submitted": player.words_submitted,
                 "items_used": player.items_used,
+                "max_combo": player.max_combo,
                 "rank": 0  # 점수 기준으로 나중에 계산
             })
         
@@ -520,49 +523,9 @@ class GameEngine:
         except Exception as e:
             logger.error(f"게임룸 기록 생성 중 오류: {e}")
     
-    async def _create_game_session_record(self, room_id: str, game_state: GameState):
-        """PostgreSQL에 게임 세션 기록 생성"""
-        try:
-            db = next(get_db())
-            
-            game_session = GameSession(
-                room_id=room_id,
-                player_count=len(game_state.players),
-                max_rounds=game_state.max_rounds,
-                started_at=datetime.fromisoformat(game_state.started_at.replace('Z', '+00:00'))
-            )
-            
-            db.add(game_session)
-            db.commit()
-            
-        except Exception as e:
-            logger.error(f"게임 세션 기록 생성 중 오류: {e}")
-    
-    async def _update_game_session_record(self, room_id: str, game_state: GameState, end_reason: str, results: List[Dict[str, Any]]):
-        """PostgreSQL 게임 세션 기록 업데이트"""
-        try:
-            db = next(get_db())
-            
-            # 게임 세션 조회 및 업데이트
-            result = db.execute(
-                select(GameSession).where(GameSession.room_id == room_id)
-            )
-            session = result.scalar_one_or_none()
-            
-            if session:
-                session.ended_at = datetime.fromisoformat(game_state.ended_at.replace('Z', '+00:00'))
-                session.winner_id = results[0]["user_id"] if results else None
-                session.total_words = game_state.word_chain.total_words
-                session.final_scores = {str(r["user_id"]): r["score"] for r in results}
-                session.end_reason = end_reason
-                
-                db.commit()
-            
-        except Exception as e:
-            logger.error(f"게임 세션 기록 업데이트 중 오류: {e}")
-    
-    async def submit_word(self, room_id: str, user_id: int, word: str) -> Tuple[bool, str, Optional[Any], Optional[Any]]:
-        """단어 제출 처리"""
+    async def submit_word(self, room_id: str, user_id: int, word: str,
+                          response_time_ms: Optional[int] = None) -> Tuple[bool, str, Optional[Any], Optional[Any]]:
+        """단어 제출 처리 (검증 결과는 감사 로그 큐에 기록)"""
         try:
             # 게임 상태 조회
             game_state = await self.redis_manager.get_game_state(room_id)
@@ -589,6 +552,13 @@ class GameEngine:
             )
             
             if validation_result.result != ValidationResult.VALID:
+                self.audit_log.record_submission(
+                    game_state.session_id, user_id, word_to_validate, False,
+                    validation_reason=validation_result.result.value,
+                    response_time_ms=response_time_ms,
+                    round_number=game_state.current_round,
+                    turn_order=game_state.total_turns
+                )
                 return False, validation_result.message, None, None
             
             # 단어 체인에 추가
@@ -607,6 +577,14 @@ class GameEngine:
             
             logger.info(f"점수 추가: {word_to_validate} ({len(word_to_validate)}글자) = {word_score}점")
             
+            self.audit_log.record_submission(
+                game_state.session_id, user_id, word_to_validate, True,
+                response_time_ms=response_time_ms,
+                score_earned=word_score,
+                round_number=game_state.current_round,
+                turn_order=game_state.total_turns
+            )
+            
             # 턴 시간 시스템으로 변경됨 - 개별 플레이어 시간 관리 제거
             
             # 다음 턴으로 이동
@@ -0,0 +1,384 @@
+"""
+게임 종료 후처리
+결과를 먼저 알린 뒤 백그라운드에서 게임 세션, 참가자, 사용자 통계, 아이템 드롭을
+트랜잭션 하나로 기록 (세션 ID 기준으로 한 번만 반영되므로 재시도 안전),
+리더보드/캐시/드롭 알림은 세션 행의 미반영 표시를 기준으로 반영될 때까지 재처리
+"""
+
+import os
+import json
+import uuid
+import asyncio
+import logging
+from datetime import datetime, timezone, timedelta
+from typing import Dict, List, Any, Optional, Callable, Awaitable, Tuple
+from sqlalchemy import select, update, func
+from sqlalchemy.dialects.postgresql import insert
+from database import get_db, get_redis
+from models.game_models import GameSession, GameParticipant
+from models.item_models import Item
+from models.user_models import User
+from redis_models import GameState
+from services.item_service import get_item_service
+from services.leaderboard_service import get_leaderboard_service
+
+logger = logging.getLogger(__name__)
+
+# 드롭 알림 콜백 (room_id, user_id → 아이템)
+DropNotifier = Callable[[str, Dict[int, Item]], Awaitable[None]]
+
+
+def _parse_time(value: Optional[str]) -> Optional[datetime]:
+    """ISO 시각 문자열 → datetime"""
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+class GameFinalizer:
+    """종료된 게임을 백그라운드에서 한 트랜잭션으로 기록 (실패하면 Redis 재시도 목록으로)"""
+
+    def __init__(self):
+        self.redis_client = get_redis()
+        self.item_service = get_item_service()
+        self.leaderboard = get_leaderboard_service()
+        self.retry_key = "game_finalize:retry"
+
+        self.max_attempts = int(os.getenv("GAME_FINALIZE_MAX_ATTEMPTS", "3"))
+        self.retry_backoff = float(os.getenv("GAME_FINALIZE_RETRY_BACKOFF", "0.5"))
+        self.retry_interval = float(os.getenv("GAME_FINALIZE_RETRY_INTERVAL", "30"))
+        self.retry_batch_size = int(os.getenv("GAME_FINALIZE_RETRY_BATCH_SIZE", "50"))
+        self.shutdown_timeout = float(os.getenv("GAME_FINALIZE_SHUTDOWN_TIMEOUT", "10"))
+        # 커밋 직후 반영 중인 게임과 겹치지 않도록 이만큼 지난 미반영 게임만 재처리
+        self.reconcile_delay = float(os.getenv("GAME_FINALIZE_RECONCILE_DELAY", "60"))
+        # 리더보드 적용 표시가 남아 있는 기간 안의 게임만 재처리 (표시가 만료된 뒤 다시 반영하면 점수가 두 번 더해짐)
+        self.reconcile_max_age = max(self.leaderboard.applied_ttl - 86400, self.reconcile_delay)
+
+        # 드롭 아이템 알림 (웹소켓 핸들러가 등록)
+        self.on_items_dropped: Optional[DropNotifier] = None
+
+        self._tasks: set = set()
+        self._retry_task: Optional[asyncio.Task] = None
+        self.stats = {
+            "submitted": 0, "finalized": 0, "duplicates": 0, "deferred": 0,
+            "retried": 0, "reconciled": 0, "expired": 0, "errors": 0
+        }
+
+    # === 제출 (게임 경로, I/O 없음) ===
+
+    @staticmethod
+    def build_payload(room_id: str, game_state: GameState, results: List[Dict[str, Any]],
+                      end_reason: str) -> Dict[str, Any]:
+        """게임 상태와 최종 순위로 기록할 내용 구성 (게임 상태 초기화 전에 호출)"""
+        ended_at = game_state.ended_at or datetime.now(timezone.utc).isoformat()
+        # 세션 ID가 없으면 방과 시작 시각으로 고정된 ID를 만들어 재시도 시에도 같은 게임으로 취급
+        session_id = game_state.session_id or str(
+            uuid.uuid5(uuid.NAMESPACE_URL, f"{room_id}:{game_state.started_at or ended_at}")
+        )
+        return {
+            "session_id": session_id,
+            "room_id": room_id,
+            "started_at": game_state.started_at,
+            "ended_at": ended_at,
+            "end_reason": end_reason,
+            "total_rounds": game_state.current_round,
+            "total_words": len(game_state.word_chain.words) if game_state.word_chain else 0,
+            "results": [
+                {
+                    "user_id": result["user_id"],
+                    "nickname": result.get("nickname"),
+                    "score": result.get("score", 0),
+                    "rank": result.get("rank"),
+                    "words_submitted": result.get("words_submitted", 0),
+                    "items_used": result.get("items_used", 0),
+                    "max_combo": result.get("max_combo", 0)
+                }
+                for result in results if result.get("user_id")
+            ]
+        }
+
+    def submit(self, payload: Dict[str, Any]):
+        """종료된 게임 기록을 백그라운드 태스크로 넘김"""
+        self.stats["submitted"] += 1
+        task = asyncio.create_task(self._finalize(payload))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    # === 백그라운드 처리 ===
+
+    async def start(self):
+        """재시도 목록 처리 태스크 시작"""
+        if self._retry_task is None or self._retry_task.done():
+            self._retry_task = asyncio.create_task(self._retry_loop())
+
+    async def stop(self):
+        """재시도 태스크 종료 후 진행 중인 기록을 기다림 (시간 안에 못 끝나면 재시도 목록으로)"""
+        if self._retry_task and not self._retry_task.done():
+            self._retry_task.cancel()
+            try:
+                await self._retry_task
+            except asyncio.CancelledError:
+                pass
+        if self._tasks:
+            _, pending = await asyncio.wait(set(self._tasks), timeout=self.shutdown_timeout)
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _retry_loop(self):
+        """주기적으로 재시도 목록의 게임을 다시 기록하고 리더보드 미반영 게임을 재처리"""
+        while True:
+            try:
+                await asyncio.sleep(self.retry_interval)
+                raw = await asyncio.to_thread(self.redis_client.lpop, self.retry_key, self.retry_batch_size)
+                for item in raw or []:
+                    self.stats["retried"] += 1
+                    self.submit(json.loads(item))
+                await self.reconcile_pending()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.error(f"게임 기록 재시도 목록 처리 실패: {e}")
+
+    async def _finalize(self, payload: Dict[str, Any]):
+        """드롭을 정한 뒤 트랜잭션 기록, 커밋된 경우에만 리더보드/캐시/알림 반영"""
+        try:
+            if "drops" not in payload:
+                # 재시도 때 같은 아이템을 주도록 한 번 정한 드롭을 기록 내용에 보관
+                payload["drops"] = await asyncio.to_thread(self._choose_drops, payload["results"])
+
+            for attempt in range(1, self.max_attempts + 1):
+                try:
+                    grants = await asyncio.to_thread(self._persist, payload)
+                    break
+                except Exception as e:
+                    self.stats["errors"] += 1
+                    logger.warning(f"게임 기록 실패 ({attempt}/{self.max_attempts}): session_id={payload['session_id']}, {e}")
+                    if attempt == self.max_attempts:
+                        self._defer(payload)
+                        return
+                    await asyncio.sleep(self.retry_backoff * 2 ** (attempt - 1))
+        except asyncio.CancelledError:
+            self._defer(payload)
+            raise
+
+        if grants is None:
+            # 이전 시도가 커밋했으면 후속 반영은 미반영 표시를 보고 재처리 루프가 마무리
+            self.stats["duplicates"] += 1
+            logger.debug(f"이미 기록된 게임: session_id={payload['session_id']}")
+            return
+        self.stats["finalized"] += 1
+        await self._after_commit(payload["session_id"], payload["room_id"], payload["results"], grants, fresh=True)
+
+    def _choose_drops(self, results: List[Dict[str, Any]]) -> Dict[str, int]:
+        """플레이어별 드롭 아이템 ID (JSON 저장을 위해 키는 문자열)"""
+        performances = {
+            result["user_id"]: {**result, "rank": result.get("rank") or len(results)}
+            for result in results
+        }
+        try:
+            drops = self.item_service.choose_drops(performances)
+        except Exception as e:
+            logger.error(f"아이템 드롭 결정 중 오류: {e}")
+            return {}
+        return {str(user_id): item.id for user_id, item in drops.items()}
+
+    def _persist(self, payload: Dict[str, Any]) -> Optional[Dict[int, int]]:
+        """세션/참가자/통계/드롭을 한 트랜잭션으로 기록, 반영한 드롭 반환 (이미 기록된 게임이면 None)"""
+        results = payload["results"]
+        started_at = _parse_time(payload.get("started_at"))
+        ended_at = _parse_time(payload["ended_at"])
+
+        db = next(get_db())
+        try:
+            # 게스트는 users 테이블에 없으므로 참가자/통계/드롭에서 제외
+            user_ids = [result["user_id"] for result in results]
+            existing = set(db.execute(select(User.id).where(User.id.in_(user_ids))).scalars()) if user_ids else set()
+            winner_id = next((result["user_id"] for result in results if result.get("rank") == 1), None)
+            grants = {
+                int(user_id): item_id for user_id, item_id in payload.get("drops", {}).items()
+                if int(user_id) in existing
+            }
+
+            # 세션 행이 이미 있으면 이전 시도가 커밋된 것이므로 나머지도 건너뜀
+            inserted = db.execute(
+                insert(GameSession)
+                .values(
+                    id=uuid.UUID(payload["session_id"]),
+                    room_id=payload["room_id"],
+                    started_at=started_at or ended_at,
+                    ended_at=ended_at,
+                    winner_id=winner_id if winner_id in existing else None,
+                    total_rounds=payload.get("total_rounds", 0),
+                    total_words=payload.get("total_words", 0),
+                    duration_ms=int((ended_at - started_at).total_seconds() * 1000) if started_at else None,
+                    # 리더보드/드롭 알림 재처리에 필요한 결과와 드롭을 함께 보관
+                    game_data={
+                        "end_reason": payload.get("end_reason"),
+                        "player_count": len(results),
+                        "results": results,
+                        "drops": {str(user_id): item_id for user_id, item_id in grants.items()}
+                    },
+                    final_scores={str(result["user_id"]): result["score"] for result in results},
+                    leaderboard_applied=False
+                )
+                .on_conflict_do_nothing(index_elements=["id"])
+                .returning(GameSession.id)
+            ).first()
+            if inserted is None:
+                db.rollback()
+                return None
+
+            participants = [
+                {
+                    "session_id": inserted[0],
+                    "user_id": result["user_id"],
+                    "final_score": result["score"],
+                    "final_rank": result.get("rank"),
+                    "words_submitted": result.get("words_submitted", 0),
+                    "items_used": result.get("items_used", 0),
+                    "max_combo": result.get("max_combo", 0)
+                }
+                for result in results if result["user_id"] in existing
+            ]
+            if participants:
+                db.execute(insert(GameParticipant), participants)
+                # 누적 점수/승수는 리더보드 동기화가 users 테이블에 반영
+                db.execute(
+                    update(User)
+                    .where(User.id.in_(existing))
+                    .values(total_games=func.coalesce(User.total_games, 0) + 1)
+                )
+
+            self.item_service.grant_items_in_transaction(db, grants)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+        return grants
+
+    async def _after_commit(self, session_id: str, room_id: str, results: List[Dict[str, Any]],
+                            grants: Dict[int, int], fresh: bool):
+        """커밋된 게임을 리더보드, 인벤토리 캐시, 드롭 알림에 반영한 뒤 반영 완료 표시 (실패하면 재처리 대상으로 남김)"""
+        try:
+            # 같은 세션은 한 번만 누적되므로 재처리해도 점수가 두 번 더해지지 않음
+            await asyncio.to_thread(self.leaderboard.record_game, session_id, results)
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.error(f"리더보드 기록 중 오류, 재처리 대기: session_id={session_id}, {e}")
+            return
+
+        if grants:
+            if fresh:
+                self.item_service.apply_granted_to_cache(grants)
+            else:
+                # 재처리 때는 캐시에 이미 더했는지 알 수 없으므로 버리고 다음 조회 때 DB에서 적재
+                for user_id in grants:
+                    self.item_service._invalidate_inventory(user_id)
+            catalog = self.item_service._get_catalog()
+            drops = {user_id: catalog[item_id] for user_id, item_id in grants.items() if item_id in catalog}
+            for user_id, item in drops.items():
+                logger.info(f"아이템 드롭: user_id={user_id}, item={item.name}")
+            if self.on_items_dropped and drops:
+                try:
+                    await self.on_items_dropped(room_id, drops)
+                except Exception as e:
+                    logger.error(f"아이템 드롭 알림 중 오류: {e}")
+
+        try:
+            await asyncio.to_thread(self._mark_applied, session_id)
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.error(f"리더보드 반영 표시 실패, 재처리 대기: session_id={session_id}, {e}")
+
+    @staticmethod
+    def _mark_applied(session_id: str):
+        """세션의 리더보드/캐시/드롭 알림 반영 완료 표시"""
+        db = next(get_db())
+        try:
+            db.execute(
+                update(GameSession)
+                .where(GameSession.id == uuid.UUID(session_id))
+                .values(leaderboard_applied=True)
+            )
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def _load_pending(self) -> List[Tuple[str, Optional[str], Dict[str, Any]]]:
+        """커밋됐지만 리더보드 반영이 끝나지 않은 게임 (오래된 순, 최대 retry_batch_size개)"""
+        now = datetime.now(timezone.utc)
+        cutoff = now - timedelta(seconds=self.reconcile_delay)
+        oldest = now - timedelta(seconds=self.reconcile_max_age)
+        db = next(get_db())
+        try:
+            # 적용 표시 보관 기간을 넘긴 게임은 이미 반영됐는지 알 수 없으므로 재처리하지 않고 포기 표시
+            expired = db.execute(
+                update(GameSession)
+                .where(GameSession.leaderboard_applied.is_(False), GameSession.ended_at < oldest)
+                .values(leaderboard_applied=True)
+            ).rowcount
+            db.commit()
+            if expired:
+                self.stats["expired"] += expired
+                logger.warning(f"리더보드 재처리 기간이 지난 게임 {expired}개는 반영하지 않고 완료 표시")
+
+            rows = db.execute(
+                select(GameSession.id, GameSession.room_id, GameSession.game_data)
+                .where(
+                    GameSession.leaderboard_applied.is_(False),
+                    GameSession.ended_at >= oldest,
+                    GameSession.ended_at < cutoff
+                )
+                .order_by(GameSession.ended_at)
+                .limit(self.retry_batch_size)
+            ).all()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+        return [(str(session_id), room_id, game_data or {}) for session_id, room_id, game_data in rows]
+
+    async def reconcile_pending(self) -> int:
+        """반영이 중단된 게임(커밋 후 오류/종료, 취소된 기록의 재시도)의 리더보드/캐시/드롭 알림 마무리"""
+        pending = await asyncio.to_thread(self._load_pending)
+        for session_id, room_id, game_data in pending:
+            grants = {int(user_id): item_id for user_id, item_id in game_data.get("drops", {}).items()}
+            await self._after_commit(session_id, room_id, game_data.get("results", []), grants, fresh=False)
+            self.stats["reconciled"] += 1
+        if pending:
+            logger.info(f"리더보드 미반영 게임 재처리: {len(pending)}개")
+        return len(pending)
+
+    def _defer(self, payload: Dict[str, Any]):
+        """재시도 목록에 보관 (다음 재시도 주기 또는 다른 프로세스가 처리)"""
+        try:
+            self.redis_client.rpush(self.retry_key, json.dumps(payload, ensure_ascii=False))
+            self.stats["deferred"] += 1
+        except Exception as e:
+            logger.error(f"게임 기록 유실: session_id={payload['session_id']}, {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """게임 종료 후처리 통계"""
+        return {
+            "in_flight": len(self._tasks),
+            "running": self._retry_task is not None and not self._retry_task.done(),
+            **self.stats
+        }
+
+
+# 전역 게임 종료 후처리기 인스턴스
+game_finalizer = GameFinalizer()
+
+
+def get_game_finalizer() -> GameFinalizer:
+    """게임 종료 후처리기 의존성"""
+    return game_finalizer
@@ -3,7 +3,11 @@
 아이템 관리, 효과 실행, 쿨다운 관리, 드롭 시스템
 """
 
+import os
+import time
+import uuid
 import random
+import asyncio
 import logging
 import json
 from typing import Dict, List, Any, Optional, Tuple
@@ -11,13 +15,131 @@ from dataclasses import dataclass
 from datetime import datetime, timezone, timedelta
 from enum import Enum
 from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert
 from database import get_db, get_redis
 from models.item_models import Item
-from models.user_models import UserItem
+from models.user_models import User, UserItem
 from redis_models import GameState, GamePlayer, WordChainState
+from utils.alias_table import AliasTable
 
 logger = logging.getLogger(__name__)
 
+# 사용자별 쿨다운 해시(아이템 ID → 만료 시각 ms)에서 만료된 항목을 지우고
+# 해시 TTL을 가장 늦은 만료 시각에 맞춤 (쿨다운을 설정할 때만 실행하는 지연 정리)
+SWEEP_COOLDOWNS_LUA = """
+local function sweep(key, now)
+    local latest = 0
+    local fields = redis.call('HGETALL', key)
+    for i = 1, #fields, 2 do
+        local expiry = tonumber(fields[i + 1])
+        if expiry <= now then
+            redis.call('HDEL', key, fields[i])
+        elseif expiry > latest then
+            latest = expiry
+        end
+    end
+    if latest > 0 then
+        redis.call('PEXPIRE', key, latest - now)
+    end
+end
+"""
+
+# 인벤토리 캐시가 있을 때만 쿨다운 확인과 수량 차감, 쿨다운 설정을 한 번에 처리 (차감하면 인벤토리 버전 증가)
+# KEYS[1]=인벤토리 해시, KEYS[2]=쿨다운 해시, KEYS[3]=인벤토리 버전 / ARGV[1]=아이템 ID, ARGV[2]=현재 시각(ms),
+# ARGV[3]=쿨다운 만료 시각(ms, 없으면 0), ARGV[4]=버전 TTL(초)
+# 반환: {0, 남은 수량} 성공, {1, 0} 캐시 없음, {2, 0} 미보유, {3, 남은 쿨다운(ms)}
+CONSUME_ITEM_SCRIPT = SWEEP_COOLDOWNS_LUA + """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return {1, 0}
+end
+local now = tonumber(ARGV[2])
+local cooldown_until = tonumber(redis.call('HGET', KEYS[2], ARGV[1]) or '0')
+if cooldown_until > now then
+    return {3, cooldown_until - now}
+end
+local quantity = tonumber(redis.call('HGET', KEYS[1], ARGV[1]) or '0')
+if quantity <= 0 then
+    return {2, 0}
+end
+quantity = redis.call('HINCRBY', KEYS[1], ARGV[1], -1)
+if quantity <= 0 then
+    redis.call('HDEL', KEYS[1], ARGV[1])
+end
+redis.call('INCR', KEYS[3])
+redis.call('EXPIRE', KEYS[3], ARGV[4])
+if tonumber(ARGV[3]) > now then
+    redis.call('HSET', KEYS[2], ARGV[1], ARGV[3])
+    sweep(KEYS[2], now)
+end
+return {0, quantity}
+"""
+
+# 쿨다운 설정 후 지연 정리
+# KEYS[1]=쿨다운 해시 / ARGV[1]=아이템 ID, ARGV[2]=현재 시각(ms), ARGV[3]=쿨다운 만료 시각(ms)
+SET_COOLDOWN_SCRIPT = SWEEP_COOLDOWNS_LUA + """
+redis.call('HSET', KEYS[1], ARGV[1], ARGV[3])
+sweep(KEYS[1], tonumber(ARGV[2]))
+return 1
+"""
+
+# 인벤토리 캐시가 있을 때만 수량 변경 (없으면 다음 조회 때 DB에서 적재)
+# 캐시가 없어도 버전은 올려서 변경 전에 DB를 읽은 적재가 캐시를 덮어쓰지 못하게 함
+# KEYS[1]=인벤토리 해시, KEYS[2]=인벤토리 버전 / ARGV[1]=아이템 ID, ARGV[2]=변경량, ARGV[3]=버전 TTL(초)
+ADJUST_ITEM_SCRIPT = """
+redis.call('INCR', KEYS[2])
+redis.call('EXPIRE', KEYS[2], ARGV[3])
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return nil
+end
+local quantity = redis.call('HINCRBY', KEYS[1], ARGV[1], ARGV[2])
+if quantity <= 0 then
+    redis.call('HDEL', KEYS[1], ARGV[1])
+end
+return quantity
+"""
+
+# 인벤토리 캐시 해시에서 적재 여부를 표시하는 필드 (빈 인벤토리도 캐시)
+INVENTORY_LOADED_FIELD = "_loaded"
+
+# DB에서 읽은 인벤토리를 읽기 전 버전이 그대로일 때만 캐시에 적재 (중간에 변경이 있었으면 0)
+# KEYS[1]=인벤토리 해시, KEYS[2]=인벤토리 버전 / ARGV[1]=읽기 전 버전(없으면 ''), ARGV[2]=캐시 TTL(초), ARGV[3...]=필드, 값
+FILL_INVENTORY_SCRIPT = """
+if (redis.call('GET', KEYS[2]) or '') ~= ARGV[1] then
+    return 0
+end
+redis.call('DEL', KEYS[1])
+redis.call('HSET', KEYS[1], unpack(ARGV, 3))
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+return 1
+"""
+
+# 룸 활성 효과 추가 (효과 레코드 해시 + 만료 시각 정렬 집합, 두 키 TTL은 가장 늦은 만료 시각 + 여유)
+# KEYS[1]=효과 해시, KEYS[2]=만료 정렬 집합 / ARGV[1]=효과 ID, ARGV[2]=레코드 JSON, ARGV[3]=만료 시각(ms), ARGV[4]=현재 시각(ms), ARGV[5]=여유(ms)
+ADD_EFFECT_SCRIPT = """
+redis.call('HSET', KEYS[1], ARGV[1], ARGV[2])
+redis.call('ZADD', KEYS[2], ARGV[3], ARGV[1])
+local latest = redis.call('ZRANGE', KEYS[2], -1, -1, 'WITHSCORES')
+local ttl = tonumber(latest[2]) - tonumber(ARGV[4]) + tonumber(ARGV[5])
+redis.call('PEXPIRE', KEYS[1], ttl)
+redis.call('PEXPIRE', KEYS[2], ttl)
+return 1
+"""
+
+# 만료된 룸 효과 제거 후 다음 만료 시각 반환 (남은 효과가 없으면 -1)
+# KEYS[1]=효과 해시, KEYS[2]=만료 정렬 집합 / ARGV[1]=현재 시각(ms)
+EXPIRE_EFFECTS_SCRIPT = """
+local expired = redis.call('ZRANGEBYSCORE', KEYS[2], '-inf', ARGV[1])
+if #expired > 0 then
+    redis.call('HDEL', KEYS[1], unpack(expired))
+    redis.call('ZREMRANGEBYSCORE', KEYS[2], '-inf', ARGV[1])
+end
+local upcoming = redis.call('ZRANGE', KEYS[2], 0, 0, 'WITHSCORES')
+if #upcoming == 0 then
+    return -1
+end
+return tonumber(upcoming[2])
+"""
+
 
 class ItemRarity(str, Enum):
     """아이템 희귀도"""
@@ -74,6 +196,7 @@ class ActiveEffect:
     effect: ItemEffect
     applied_at: datetime
     expires_at: Optional[datetime] = None
+    effect_id: str = ""
     
     @property
     def is_expired(self) -> bool:
@@ -83,6 +206,7 @@ class ActiveEffect:
     
     def to_dict(self) -> Dict[str, Any]:
         return {
+            "effect_id": self.effect_id,
             "item_id": self.item_id,
             "user_id": self.user_id,
             "effect": self.effect.to_dict(),
@@ -116,6 +240,24 @@ class ItemService:
         self.redis_client = get_redis()
         self.cooldown_prefix = "item_cooldown:"
         self.active_effects_prefix = "active_effects:"
+        self.inventory_prefix = "inventory:"
+        self.inventory_ttl = int(os.getenv("INVENTORY_CACHE_TTL", "3600"))
+        
+        # 아이템 목록과 활성 아이템 드롭 테이블 (프로세스 내 캐시, 아이템 정의는 거의 바뀌지 않음)
+        self.catalog_ttl = float(os.getenv("ITEM_CATALOG_TTL", "300"))
+        self._catalog: Dict[int, Item] = {}
+        self._drop_table: AliasTable[Item] = AliasTable([], [])
+        self._catalog_loaded_at = 0.0
+        
+        self._consume_script = self.redis_client.register_script(CONSUME_ITEM_SCRIPT)
+        self._adjust_script = self.redis_client.register_script(ADJUST_ITEM_SCRIPT)
+        self._fill_inventory_script = self.redis_client.register_script(FILL_INVENTORY_SCRIPT)
+        self._set_cooldown_script = self.redis_client.register_script(SET_COOLDOWN_SCRIPT)
+        self._add_effect_script = self.redis_client.register_script(ADD_EFFECT_SCRIPT)
+        self._expire_effects_script = self.redis_client.register_script(EXPIRE_EFFECTS_SCRIPT)
+        
+        # 룸별 다음 효과 만료 예약 (룸 ID → (만료 시각 ms, 예약 핸들))
+        self._effect_expiry: Dict[str, Tuple[int, asyncio.TimerHandle]] = {}
         
         # 아이템 효과 매핑
         self.effect_handlers = {
@@ -140,55 +282,65 @@ class ItemService:
     
     async def use_item(self, room_id: str, user_id: int, item_id: int, 
                       target_user_id: Optional[int] = None) -> ItemUseResult:
-        """아이템 사용"""
+        """아이템 사용 (보유/쿨다운 확인, 차감, 쿨다운 설정을 원자적으로 처리한 뒤 효과 실행)"""
         try:
-            db = next(get_db())
+            item = self._get_catalog().get(item_id)
+            if not item:
+                return ItemUseResult(
+                    success=False,
+                    message="보유하지 않은 아이템입니다"
+                )
             
-            # 1. 아이템 보유 확인
-            result = db.execute(
-                select(UserItem, Item)
-                .join(Item, UserItem.item_id == Item.id)
-                .where(UserItem.user_id == user_id, UserItem.item_id == item_id, UserItem.quantity > 0)
-            )
-            user_item_data = result.first()
+            # 1. 보유 확인, 쿨다운 확인, 수량 차감, 쿨다운 설정 (Redis 한 번)
+            now_ms = int(time.time() * 1000)
+            cooldown_until = None
+            cooldown_until_ms = 0
+            if item.cooldown_seconds and item.cooldown_seconds > 0:
+                cooldown_until_ms = now_ms + item.cooldown_seconds * 1000
+                cooldown_until = datetime.fromtimestamp(cooldown_until_ms / 1000, tz=timezone.utc)
+            status, value = self._consume_cached(user_id, item_id, now_ms, cooldown_until_ms)
             
-            if not user_item_data:
+            if status == 2:
                 return ItemUseResult(
                     success=False,
                     message="보유하지 않은 아이템입니다"
                 )
+            if status == 3:
+                return ItemUseResult(
+                    success=False,
+                    message=f"쿨다운 중입니다 (남은 시간: {max(1, value // 1000)}초)"
+                )
             
-            user_item, item = user_item_data
-            
-            # 2. 쿨다운 확인
-            if await self._is_on_cooldown(user_id, item_id):
-                cooldown_time = await self._get_cooldown_remaining(user_id, item_id)
+            # 2. DB 차감 (조건부 UPDATE 한 번, 수량이 0이면 차감되지 않음)
+            try:
+                consumed = self._consume_in_db(user_id, item_id)
+            except Exception:
+                # DB에서 차감되지 않았으므로 캐시 차감과 쿨다운도 되돌림
+                self._invalidate_inventory(user_id)
+                self._clear_cooldown(user_id, item_id)
+                raise
+            if not consumed:
+                # 캐시와 DB가 어긋난 경우: 캐시를 버리고 쿨다운 취소
+                self._invalidate_inventory(user_id)
+                self._clear_cooldown(user_id, item_id)
                 return ItemUseResult(
                     success=False,
-                    message=f"쿨다운 중입니다 (남은 시간: {cooldown_time}초)"
+                    message="보유하지 않은 아이템입니다"
                 )
             
-            # 3. 아이템 효과 생성
+            # 3. 아이템 효과 실행
             effect = self._create_effect_from_item(item)
-            
-            # 4. 아이템 효과 실행
             execution_result = await self._execute_item_effect(
                 room_id, user_id, effect, target_user_id
             )
             
             if not execution_result.success:
+                # 효과가 적용되지 않았으면 아이템과 쿨다운 되돌림
+                self._add_to_inventory_in_db(user_id, item_id, 1)
+                self._adjust_cached(user_id, item_id, 1)
+                self._clear_cooldown(user_id, item_id)
                 return execution_result
             
-            # 5. 아이템 소모
-            user_item.quantity -= 1
-            db.commit()
-            
-            # 6. 쿨다운 설정
-            cooldown_until = None
-            if item.cooldown_seconds > 0:
-                cooldown_until = datetime.now(timezone.utc) + timedelta(seconds=item.cooldown_seconds)
-                await self._set_cooldown(user_id, item_id, cooldown_until)
-            
             logger.info(f"아이템 사용 성공: user_id={user_id}, item_id={item_id}, effect={effect.effect_type}")
             
             return ItemUseResult(
@@ -205,6 +357,36 @@ class ItemService:
                 message="아이템 사용 중 오류가 발생했습니다"
             )
     
+    def _consume_cached(self, user_id: int, item_id: int, now_ms: int,
+                        cooldown_until_ms: int) -> Tuple[int, int]:
+        """캐시된 인벤토리에서 원자적으로 차감 (캐시가 없으면 DB에서 적재 후 한 번 더 시도)"""
+        keys = [self._inventory_key(user_id), self._cooldown_key(user_id), self._inventory_version_key(user_id)]
+        args = [item_id, now_ms, cooldown_until_ms, self.inventory_ttl]
+        
+        status, value = self._consume_script(keys=keys, args=args)
+        if status == 1:
+            self._load_inventory(user_id)
+            status, value = self._consume_script(keys=keys, args=args)
+        return int(status), int(value)
+    
+    def _consume_in_db(self, user_id: int, item_id: int) -> bool:
+        """조건부 UPDATE로 수량 1 차감 (차감했으면 True)"""
+        db = next(get_db())
+        try:
+            row = db.execute(
+                update(UserItem)
+                .where(UserItem.user_id == user_id, UserItem.item_id == item_id, UserItem.quantity > 0)
+                .values(quantity=UserItem.quantity - 1)
+                .returning(UserItem.quantity)
+            ).first()
+            db.commit()
+            return row is not None
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+    
     def _create_effect_from_item(self, item: Item) -> ItemEffect:
         """아이템으로부터 효과 생성"""
         effect_type = ItemEffectType(item.effect_type)
@@ -259,13 +441,8 @@ class ItemService:
                     message=f"지원되지 않는 아이템 효과입니다: {effect.effect_type}"
                 )
             
-            result = await handler(room_id, user_id, effect, target_user_id)
-            
-            # 지속 효과인 경우 활성 효과 목록에 추가
-            if effect.duration > 0 and result.success:
-                await self._add_active_effect(room_id, user_id, effect)
-            
-            return result
+            # 지속 효과는 핸들러가 대상에게 직접 등록 (여기서 또 추가하면 효과가 중첩됨)
+            return await handler(room_id, user_id, effect, target_user_id)
             
         except Exception as e:
             logger.error(f"아이템 효과 실행 중 오류: {e}")
@@ -658,144 +835,208 @@ class ItemService:
     
     # === 쿨다운 관리 ===
     
+    def _cooldown_key(self, user_id: int) -> str:
+        """사용자별 쿨다운 해시 키 (아이템 ID → 만료 시각 ms)"""
+        return f"{self.cooldown_prefix}{user_id}"
+    
     async def _is_on_cooldown(self, user_id: int, item_id: int) -> bool:
         """쿨다운 상태 확인"""
-        key = f"{self.cooldown_prefix}{user_id}:{item_id}"
-        cooldown_data = self.redis_client.get(key)
-        
-        if not cooldown_data:
-            return False
-        
-        cooldown_until = datetime.fromisoformat(cooldown_data.decode())
-        return datetime.now(timezone.utc) < cooldown_until
+        return await self._get_cooldown_remaining(user_id, item_id) > 0
     
     async def _set_cooldown(self, user_id: int, item_id: int, until: datetime):
-        """쿨다운 설정"""
-        key = f"{self.cooldown_prefix}{user_id}:{item_id}"
-        ttl = int((until - datetime.now(timezone.utc)).total_seconds())
-        
-        if ttl > 0:
-            self.redis_client.setex(key, ttl, until.isoformat())
+        """쿨다운 설정 (HSET 후 만료된 항목 정리)"""
+        now_ms = int(time.time() * 1000)
+        until_ms = int(until.timestamp() * 1000)
+        if until_ms > now_ms:
+            self._set_cooldown_script(keys=[self._cooldown_key(user_id)], args=[item_id, now_ms, until_ms])
     
     async def _get_cooldown_remaining(self, user_id: int, item_id: int) -> int:
         """남은 쿨다운 시간 반환 (초)"""
-        key = f"{self.cooldown_prefix}{user_id}:{item_id}"
-        cooldown_data = self.redis_client.get(key)
-        
-        if not cooldown_data:
+        cooldown_until = self.redis_client.hget(self._cooldown_key(user_id), item_id)
+        return self._remaining_seconds(cooldown_until, int(time.time() * 1000))
+    
+    def _get_cooldowns(self, raw: Dict[str, str]) -> Dict[int, int]:
+        """쿨다운 해시 값을 남은 시간(초)으로 변환 (만료된 항목 제외)"""
+        now_ms = int(time.time() * 1000)
+        cooldowns = {}
+        for item_id, cooldown_until in raw.items():
+            remaining = self._remaining_seconds(cooldown_until, now_ms)
+            if remaining > 0:
+                cooldowns[int(item_id)] = remaining
+        return cooldowns
+    
+    @staticmethod
+    def _remaining_seconds(cooldown_until: Optional[str], now_ms: int) -> int:
+        """만료 시각(ms)까지 남은 시간 (초 단위 올림)"""
+        if not cooldown_until:
             return 0
-        
-        cooldown_until = datetime.fromisoformat(cooldown_data.decode())
-        remaining = (cooldown_until - datetime.now(timezone.utc)).total_seconds()
-        return max(0, int(remaining))
+        remaining_ms = int(cooldown_until) - now_ms
+        return max(0, -(-remaining_ms // 1000))
+    
+    def _clear_cooldown(self, user_id: int, item_id: int):
+        """쿨다운 해제"""
+        self.redis_client.hdel(self._cooldown_key(user_id), item_id)
     
     # === 활성 효과 관리 ===
     
+    def _effects_keys(self, room_id: str) -> List[str]:
+        """룸 효과 레코드 해시와 만료 정렬 집합 키"""
+        key = f"{self.active_effects_prefix}{room_id}"
+        return [key, f"{key}:expiry"]
+    
     async def _add_active_effect(self, room_id: str, user_id: int, effect: ItemEffect):
-        """활성 효과 추가"""
-        key = f"{self.active_effects_prefix}{room_id}:{user_id}"
+        """활성 효과 추가 (같은 사용자의 기존 효과와 중첩)"""
+        now = datetime.now(timezone.utc)
+        duration = effect.duration if effect.duration > 0 else 3600  # 지속 시간이 없으면 1시간 유지
         
         active_effect = ActiveEffect(
             item_id=0,  # 임시
             user_id=user_id,
             effect=effect,
-            applied_at=datetime.now(timezone.utc),
-            expires_at=datetime.now(timezone.utc) + timedelta(seconds=effect.duration) if effect.duration > 0 else None
+            applied_at=now,
+            expires_at=now + timedelta(seconds=effect.duration) if effect.duration > 0 else None,
+            effect_id=uuid.uuid4().hex
         )
         
-        # Redis에 저장
-        ttl = effect.duration if effect.duration > 0 else 3600  # 1시간 기본 TTL
-        self.redis_client.setex(
-            key,
-            ttl,
-            json.dumps(active_effect.to_dict(), ensure_ascii=False)
+        now_ms = int(now.timestamp() * 1000)
+        expires_ms = now_ms + duration * 1000
+        self._add_effect_script(
+            keys=self._effects_keys(room_id),
+            args=[active_effect.effect_id, json.dumps(active_effect.to_dict(), ensure_ascii=False),
+                  expires_ms, now_ms, 60000]
         )
+        self._schedule_effect_expiry(room_id, expires_ms)
+    
+    async def get_room_effects(self, room_id: str) -> Dict[int, List[ActiveEffect]]:
+        """룸의 모든 활성 효과를 사용자별로 조회 (Redis 한 번)"""
+        records = self.redis_client.hgetall(self._effects_keys(room_id)[0])
+        
+        effects: Dict[int, List[ActiveEffect]] = {}
+        for effect_id, record in records.items():
+            try:
+                active_effect = self._parse_active_effect(effect_id, json.loads(record))
+            except Exception as e:
+                logger.error(f"활성 효과 파싱 중 오류: {e}")
+                continue
+            # 만료 예약이 실행되기 전이라도 만료된 효과는 제외
+            if not active_effect.is_expired:
+                effects.setdefault(active_effect.user_id, []).append(active_effect)
+        
+        for user_effects in effects.values():
+            user_effects.sort(key=lambda active_effect: active_effect.applied_at)
+        return effects
     
     async def get_active_effects(self, room_id: str, user_id: int) -> List[ActiveEffect]:
         """활성 효과 목록 조회"""
-        key = f"{self.active_effects_prefix}{room_id}:{user_id}"
-        effect_data = self.redis_client.get(key)
-        
-        if not effect_data:
-            return []
-        
+        effects = await self.get_room_effects(room_id)
+        return effects.get(user_id, [])
+    
+    @staticmethod
+    def _parse_active_effect(effect_id: str, data: Dict[str, Any]) -> ActiveEffect:
+        """효과 레코드를 ActiveEffect로 변환"""
+        effect = ItemEffect(
+            effect_type=ItemEffectType(data["effect"]["effect_type"]),
+            value=data["effect"]["value"],
+            duration=data["effect"]["duration"],
+            target_type=data["effect"]["target_type"]
+        )
+        return ActiveEffect(
+            item_id=data["item_id"],
+            user_id=data["user_id"],
+            effect=effect,
+            applied_at=datetime.fromisoformat(data["applied_at"]),
+            expires_at=datetime.fromisoformat(data["expires_at"]) if data["expires_at"] else None,
+            effect_id=effect_id
+        )
+    
+    async def clear_active_effects(self, room_id: str, user_id: int):
+        """사용자의 활성 효과 모두 제거"""
+        effects = await self.get_room_effects(room_id)
+        effect_ids = [active_effect.effect_id for active_effect in effects.get(user_id, [])]
+        if not effect_ids:
+            return
+        hash_key, expiry_key = self._effects_keys(room_id)
+        pipe = self.redis_client.pipeline()
+        pipe.hdel(hash_key, *effect_ids)
+        pipe.zrem(expiry_key, *effect_ids)
+        pipe.execute()
+    
+    async def clear_room_effects(self, room_id: str):
+        """룸의 활성 효과와 만료 예약 모두 제거"""
+        scheduled = self._effect_expiry.pop(room_id, None)
+        if scheduled:
+            scheduled[1].cancel()
+        self.redis_client.delete(*self._effects_keys(room_id))
+    
+    def _schedule_effect_expiry(self, room_id: str, expires_ms: int):
+        """룸의 가장 이른 효과 만료 시각에 정리 작업 예약 (룸당 예약 하나)"""
+        scheduled = self._effect_expiry.get(room_id)
+        if scheduled and scheduled[0] <= expires_ms:
+            return
         try:
-            data = json.loads(effect_data)
-            effect = ItemEffect(
-                effect_type=ItemEffectType(data["effect"]["effect_type"]),
-                value=data["effect"]["value"],
-                duration=data["effect"]["duration"],
-                target_type=data["effect"]["target_type"]
-            )
-            
-            active_effect = ActiveEffect(
-                item_id=data["item_id"],
-                user_id=data["user_id"],
-                effect=effect,
-                applied_at=datetime.fromisoformat(data["applied_at"]),
-                expires_at=datetime.fromisoformat(data["expires_at"]) if data["expires_at"] else None
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # 이벤트 루프 밖에서는 키 TTL과 조회 시 필터에 맡김
+        if scheduled:
+            scheduled[1].cancel()
+        delay = max(0.0, expires_ms / 1000 - time.time())
+        handle = loop.call_later(delay, self._expire_room_effects, room_id)
+        self._effect_expiry[room_id] = (expires_ms, handle)
+    
+    def _expire_room_effects(self, room_id: str):
+        """만료된 룸 효과를 제거하고 다음 만료 시각에 다시 예약"""
+        self._effect_expiry.pop(room_id, None)
+        try:
+            upcoming = self._expire_effects_script(
+                keys=self._effects_keys(room_id), args=[int(time.time() * 1000)]
             )
-            
-            # 만료된 효과 제거
-            if active_effect.is_expired:
-                self.redis_client.delete(key)
-                return []
-            
-            return [active_effect]
-            
         except Exception as e:
-            logger.error(f"활성 효과 파싱 중 오류: {e}")
-            return []
-    
-    async def clear_active_effects(self, room_id: str, user_id: int):
-        """활성 효과 모두 제거"""
-        key = f"{self.active_effects_prefix}{room_id}:{user_id}"
-        self.redis_client.delete(key)
+            logger.error(f"활성 효과 만료 처리 중 오류: room_id={room_id}, {e}")
+            return
+        if upcoming and int(upcoming) > 0:
+            self._schedule_effect_expiry(room_id, int(upcoming))
     
     # === 아이템 드롭 시스템 ===
     
     async def drop_random_item(self, user_id: int, game_performance: Dict[str, Any]) -> Optional[Item]:
         """게임 성과 기반 랜덤 아이템 드롭"""
+        drops = await self.drop_items_for_players({user_id: game_performance})
+        return drops.get(user_id)
+    
+    async def drop_items_for_players(self, performances: Dict[int, Dict[str, Any]]) -> Dict[int, Item]:
+        """게임 종료 시 모든 플레이어의 아이템 드롭을 정한 뒤 인벤토리에 한 번에 추가"""
         try:
-            db = next(get_db())
-            
-            # 모든 활성 아이템 조회
-            result = db.execute(select(Item).where(Item.is_active == True))
-            available_items = result.fetchall()
-            
-            if not available_items:
-                return None
+            drops = self.choose_drops(performances)
+            if not drops:
+                return {}
+            granted = self._add_items_to_inventory({user_id: item.id for user_id, item in drops.items()})
+            drops = {user_id: item for user_id, item in drops.items() if user_id in granted}
+            for user_id, item in drops.items():
+                logger.info(f"아이템 드롭: user_id={user_id}, item={item.name}")
+            return drops
             
+        except Exception as e:
+            logger.error(f"아이템 드롭 중 오류: {e}")
+            return {}
+    
+    def choose_drops(self, performances: Dict[int, Dict[str, Any]]) -> Dict[int, Item]:
+        """플레이어별 드롭 아이템 결정 (메모리 내 선택만, 인벤토리 반영은 호출자가 담당)"""
+        self._get_catalog()
+        drop_table = self._drop_table
+        if not drop_table:
+            return {}
+        
+        drops: Dict[int, Item] = {}
+        for user_id, performance in performances.items():
             # 성과 기반 드롭률 조정
             base_drop_chance = 0.7  # 기본 70% 확률
-            performance_bonus = self._calculate_performance_bonus(game_performance)
+            performance_bonus = self._calculate_performance_bonus(performance)
             final_drop_chance = min(0.95, base_drop_chance + performance_bonus)
             
-            # 드롭 여부 결정
-            if random.random() > final_drop_chance:
-                return None
-            
-            # 희귀도 기반 가중 선택
-            weighted_items = []
-            for item in available_items:
-                weight = 1.0 / Item.get_rarity_drop_rate(item.rarity)
-                weighted_items.extend([item] * int(weight * 100))
-            
-            if not weighted_items:
-                return None
-            
-            # 랜덤 선택
-            selected_item = random.choice(weighted_items)
-            
-            # 사용자 인벤토리에 추가
-            await self._add_item_to_inventory(user_id, selected_item.id, 1)
-            
-            logger.info(f"아이템 드롭: user_id={user_id}, item={selected_item.name}")
-            return selected_item
-            
-        except Exception as e:
-            logger.error(f"아이템 드롭 중 오류: {e}")
-            return None
+            # 드롭 여부 결정 후 희귀도 기반 가중 선택 (별칭 테이블, O(1))
+            if random.random() <= final_drop_chance:
+                drops[user_id] = drop_table.sample()
+        return drops
     
     def _calculate_performance_bonus(self, performance: Dict[str, Any]) -> float:
         """게임 성과 기반 드롭률 보너스 계산"""
@@ -834,54 +1075,189 @@ class ItemService:
         return min(0.25, bonus)  # 최대 25% 보너스
     
     async def _add_item_to_inventory(self, user_id: int, item_id: int, quantity: int = 1):
-        """인벤토리에 아이템 추가"""
+        """인벤토리에 아이템 추가 (DB 기록 후 캐시에 반영)"""
         try:
-            db = next(get_db())
-            
-            # 기존 아이템 확인
-            result = db.execute(
-                select(UserItem).where(UserItem.user_id == user_id, UserItem.item_id == item_id)
-            )
-            existing_item = result.scalar_one_or_none()
-            
-            if existing_item:
-                # 수량 증가
-                existing_item.quantity += quantity
-            else:
-                # 새 아이템 추가
-                new_user_item = UserItem(
-                    user_id=user_id,
-                    item_id=item_id,
-                    quantity=quantity
-                )
-                db.add(new_user_item)
-            
-            db.commit()
+            self._add_to_inventory_in_db(user_id, item_id, quantity)
+            self._adjust_cached(user_id, item_id, quantity)
             logger.info(f"아이템 인벤토리 추가: user_id={user_id}, item_id={item_id}, quantity={quantity}")
             
         except Exception as e:
             logger.error(f"아이템 인벤토리 추가 중 오류: {e}")
+    
+    def _add_items_to_inventory(self, grants: Dict[int, int]) -> Dict[int, int]:
+        """여러 사용자에게 아이템 1개씩 추가 (upsert 한 번 후 캐시 반영, DB에 없는 게스트는 건너뛰고 추가된 항목 반환)"""
+        db = next(get_db())
+        try:
+            existing = set(db.execute(select(User.id).where(User.id.in_(list(grants)))).scalars())
+            grants = {user_id: item_id for user_id, item_id in grants.items() if user_id in existing}
+            if not grants:
+                return {}
+            self.grant_items_in_transaction(db, grants)
+            db.commit()
+        except Exception:
             db.rollback()
+            raise
+        finally:
+            db.close()
+        
+        self.apply_granted_to_cache(grants)
+        return grants
     
-    async def get_user_inventory(self, user_id: int) -> List[Dict[str, Any]]:
-        """사용자 인벤토리 조회"""
+    @staticmethod
+    def grant_items_in_transaction(db, grants: Dict[int, int]):
+        """user_items에 아이템 1개씩 upsert (커밋은 호출자 트랜잭션에서, 사용자는 DB에 있어야 함)"""
+        if not grants:
+            return
+        statement = insert(UserItem).values([
+            {"user_id": user_id, "item_id": item_id, "quantity": 1}
+            for user_id, item_id in grants.items()
+        ])
+        db.execute(statement.on_conflict_do_update(
+            index_elements=[UserItem.user_id, UserItem.item_id],
+            set_={"quantity": UserItem.quantity + statement.excluded.quantity}
+        ))
+    
+    def apply_granted_to_cache(self, grants: Dict[int, int]):
+        """커밋된 아이템 추가를 인벤토리 캐시에 반영 (파이프라인 한 번, 실패하면 캐시 삭제)"""
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            for user_id, item_id in grants.items():
+                self._adjust_script(
+                    keys=[self._inventory_key(user_id), self._inventory_version_key(user_id)],
+                    args=[item_id, 1, self.inventory_ttl], client=pipe
+                )
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"인벤토리 캐시 반영 실패, 캐시 삭제: {e}")
+            for user_id in grants:
+                self._invalidate_inventory(user_id)
+    
+    def _add_to_inventory_in_db(self, user_id: int, item_id: int, quantity: int):
+        """user_items 수량 증가 (행이 없으면 추가, upsert 한 번)"""
+        db = next(get_db())
         try:
+            statement = insert(UserItem).values(user_id=user_id, item_id=item_id, quantity=quantity)
+            db.execute(statement.on_conflict_do_update(
+                index_elements=[UserItem.user_id, UserItem.item_id],
+                set_={"quantity": UserItem.quantity + statement.excluded.quantity}
+            ))
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+    
+    # === 인벤토리 캐시 ===
+    
+    def _inventory_key(self, user_id: int) -> str:
+        return f"{self.inventory_prefix}{user_id}"
+    
+    def _inventory_version_key(self, user_id: int) -> str:
+        """인벤토리 변경마다 증가하는 버전 키 (적재 중 변경 감지용)"""
+        return f"{self.inventory_prefix}{user_id}:version"
+    
+    def _load_inventory(self, user_id: int, attempts: int = 3) -> Dict[int, int]:
+        """DB에서 인벤토리를 읽어 Redis 해시에 적재 (아이템 ID → 수량)
+        
+        읽는 동안 지급/차감이 있었으면 읽은 값이 오래됐으므로 적재하지 않고 다시 읽음
+        """
+        key = self._inventory_key(user_id)
+        version_key = self._inventory_version_key(user_id)
+        for _ in range(attempts):
+            version = self.redis_client.get(version_key) or ""
             db = next(get_db())
+            try:
+                rows = db.execute(
+                    select(UserItem.item_id, UserItem.quantity)
+                    .where(UserItem.user_id == user_id, UserItem.quantity > 0)
+                ).all()
+            finally:
+                db.close()
+            
+            quantities = {item_id: int(quantity) for item_id, quantity in rows}
+            fields = [INVENTORY_LOADED_FIELD, 1]
+            for item_id, quantity in quantities.items():
+                fields.extend((item_id, quantity))
+            if self._fill_inventory_script(keys=[key, version_key], args=[version, self.inventory_ttl, *fields]):
+                break
+        return quantities
+    
+    @staticmethod
+    def _parse_inventory(cached: Dict[str, str]) -> Dict[int, int]:
+        """인벤토리 캐시 해시를 아이템 ID → 수량으로 변환"""
+        return {
+            int(item_id): int(quantity)
+            for item_id, quantity in cached.items()
+            if item_id != INVENTORY_LOADED_FIELD and int(quantity) > 0
+        }
+    
+    def _adjust_cached(self, user_id: int, item_id: int, delta: int):
+        """캐시된 인벤토리 수량 변경 (캐시가 없으면 그대로 둠)"""
+        try:
+            self._adjust_script(
+                keys=[self._inventory_key(user_id), self._inventory_version_key(user_id)],
+                args=[item_id, delta, self.inventory_ttl]
+            )
+        except Exception as e:
+            logger.warning(f"인벤토리 캐시 반영 실패, 캐시 삭제: user_id={user_id}, {e}")
+            self._invalidate_inventory(user_id)
+    
+    def _invalidate_inventory(self, user_id: int):
+        """인벤토리 캐시 삭제 (다음 조회 때 DB에서 적재)"""
+        try:
+            # 삭제 전에 DB를 읽은 적재가 다시 채우지 못하도록 버전도 올림
+            pipe = self.redis_client.pipeline()
+            pipe.delete(self._inventory_key(user_id))
+            pipe.incr(self._inventory_version_key(user_id))
+            pipe.expire(self._inventory_version_key(user_id), self.inventory_ttl)
+            pipe.execute()
+        except Exception as e:
+            logger.error(f"인벤토리 캐시 삭제 중 오류: {e}")
+    
+    def _get_catalog(self) -> Dict[int, Item]:
+        """아이템 목록 (프로세스 내 캐시, ITEM_CATALOG_TTL마다 다시 조회하며 드롭 테이블도 다시 계산)"""
+        if self._catalog and time.monotonic() - self._catalog_loaded_at < self.catalog_ttl:
+            return self._catalog
+        
+        db = next(get_db())
+        try:
+            items = db.execute(select(Item)).scalars().all()
+        finally:
+            db.close()
+        
+        active_items = [item for item in items if item.is_active]
+        self._drop_table = AliasTable(
+            active_items,
+            [Item.get_rarity_drop_rate(item.rarity) for item in active_items]
+        )
+        self._catalog = {item.id: item for item in items}
+        self._catalog_loaded_at = time.monotonic()
+        return self._catalog
+    
+    async def get_user_inventory(self, user_id: int) -> List[Dict[str, Any]]:
+        """사용자 인벤토리 조회 (인벤토리와 쿨다운 해시를 Redis 한 번에 조회, 캐시가 없으면 DB에서 적재)"""
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.hgetall(self._inventory_key(user_id))
+            pipe.hgetall(self._cooldown_key(user_id))
+            cached, raw_cooldowns = pipe.execute()
             
-            result = db.execute(
-                select(UserItem, Item)
-                .join(Item, UserItem.item_id == Item.id)
-                .where(UserItem.user_id == user_id, UserItem.quantity > 0)
-                .order_by(Item.rarity, Item.name)
+            quantities = self._parse_inventory(cached) if cached else self._load_inventory(user_id)
+            cooldowns = self._get_cooldowns(raw_cooldowns)
+            catalog = self._get_catalog()
+            owned = sorted(
+                (catalog[item_id] for item_id in quantities if item_id in catalog),
+                key=lambda item: (item.rarity, item.name)
             )
             
             inventory = []
-            for user_item, item in result.fetchall():
-                cooldown_remaining = await self._get_cooldown_remaining(user_id, item.id)
+            for item in owned:
+                cooldown_remaining = cooldowns.get(item.id, 0)
                 
                 inventory.append({
                     "item": item.to_dict(),
-                    "quantity": user_item.quantity,
+                    "quantity": quantities[item.id],
                     "cooldown_remaining": cooldown_remaining,
                     "can_use": cooldown_remaining == 0
                 })
@@ -0,0 +1,340 @@
+"""
+리더보드 서비스
+게임 종료 시 Redis 정렬 집합(전체/일간/주간)에 점수를 ZINCRBY로 누적하고
+상위 N명, 내 순위, 내 주변 순위를 O(log n)으로 조회,
+전체 누적 점수/승수는 주기적으로 users 테이블에 묶음 단위로 반영
+"""
+
+import os
+import uuid
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Dict, List, Any, Optional, Tuple
+import redis
+from sqlalchemy import select, update, bindparam
+from database import get_db, get_redis
+from models.user_models import User
+
+logger = logging.getLogger(__name__)
+
+BOARDS = ("all", "daily", "weekly")  # 전체, 일간(UTC), 주간(ISO 주)
+
+# 게임 한 판의 점수를 모든 보드에 한 번만 누적 (적용 표시를 SET NX로 남기고 같은 스크립트에서 ZINCRBY)
+# KEYS: 적용 표시, 전체, 일간, 주간, 승수, 닉네임, 변경 사용자 집합
+# ARGV: 적용 표시 TTL, 일간 TTL, 주간 TTL, 이후 (user_id, 점수, 1위 여부, 닉네임) 반복
+RECORD_GAME_SCRIPT = """
+if not redis.call('SET', KEYS[1], '1', 'NX', 'EX', ARGV[1]) then
+    return 0
+end
+for i = 4, #ARGV, 4 do
+    local member = ARGV[i]
+    local score = tonumber(ARGV[i + 1])
+    redis.call('ZINCRBY', KEYS[2], score, member)
+    redis.call('ZINCRBY', KEYS[3], score, member)
+    redis.call('ZINCRBY', KEYS[4], score, member)
+    if ARGV[i + 2] == '1' then
+        redis.call('ZINCRBY', KEYS[5], 1, member)
+    end
+    if ARGV[i + 3] ~= '' then
+        redis.call('HSET', KEYS[6], member, ARGV[i + 3])
+    end
+    redis.call('SADD', KEYS[7], member)
+end
+redis.call('EXPIRE', KEYS[3], ARGV[2])
+redis.call('EXPIRE', KEYS[4], ARGV[3])
+return 1
+"""
+
+# 초기 적재 잠금 해제 (내가 잡은 잠금일 때만 삭제)
+RELEASE_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class LeaderboardService:
+    """Redis 정렬 집합 기반 리더보드"""
+
+    def __init__(self):
+        self.redis_client = get_redis()
+        self.prefix = "ranking:"
+        self.daily_ttl = 2 * 86400      # 지난 일간 보드는 이틀 뒤 소멸
+        self.weekly_ttl = 14 * 86400    # 지난 주간 보드는 2주 뒤 소멸
+        self.applied_ttl = 7 * 86400    # 게임별 적용 표시 보관 기간 (재시도/재처리 중복 방지)
+
+        self.sync_enabled = os.getenv("LEADERBOARD_SYNC_ENABLED", "true").lower() == "true"
+        self.sync_interval = float(os.getenv("LEADERBOARD_SYNC_INTERVAL", "60"))
+        self.sync_batch_size = int(os.getenv("LEADERBOARD_SYNC_BATCH_SIZE", "500"))
+        self.seed_lock_ttl = int(os.getenv("LEADERBOARD_SEED_LOCK_TTL", "600"))
+        self._release_lock = self.redis_client.register_script(RELEASE_LOCK_SCRIPT)
+        self._record_game = self.redis_client.register_script(RECORD_GAME_SCRIPT)
+
+        self._sync_task: Optional[asyncio.Task] = None
+        self.stats = {"games": 0, "synced": 0, "sync_errors": 0, "seeded": 0}
+
+    # === 키 ===
+
+    def _board_key(self, board: str, metric: str = "score", now: Optional[datetime] = None) -> str:
+        """보드 키 (일간/주간은 현재 기간, UTC 기준)"""
+        now = now or datetime.now(timezone.utc)
+        if board == "daily":
+            return f"{self.prefix}{metric}:daily:{now:%Y%m%d}"
+        if board == "weekly":
+            year, week, _ = now.isocalendar()
+            return f"{self.prefix}{metric}:weekly:{year}W{week:02d}"
+        return f"{self.prefix}{metric}:all"
+
+    @property
+    def _nicknames_key(self) -> str:
+        return f"{self.prefix}nicknames"
+
+    @property
+    def _dirty_key(self) -> str:
+        """users 테이블에 아직 반영하지 않은 사용자 집합"""
+        return f"{self.prefix}dirty"
+
+    @property
+    def _seeded_key(self) -> str:
+        """전체 보드를 users 테이블에서 채웠는지 표시 (합치기가 끝난 뒤에만 설정)"""
+        return f"{self.prefix}seeded"
+
+    @property
+    def _seed_lock_key(self) -> str:
+        """초기 적재 중인 노드 표시 (TTL이 있어 적재 중 죽어도 다른 노드가 다시 시도)"""
+        return f"{self.prefix}seed_lock"
+
+    # === 기록 ===
+
+    def record_game(self, game_id: str, results: List[Dict[str, Any]]) -> bool:
+        """게임 결과를 모든 보드에 누적 (스크립트 한 번, 1위는 승수 증가, 같은 game_id는 한 번만 반영)"""
+        now = datetime.now(timezone.utc)
+        keys = [
+            f"{self.prefix}applied:{game_id}",
+            self._board_key("all", now=now),
+            self._board_key("daily", now=now),
+            self._board_key("weekly", now=now),
+            self._board_key("all", "wins", now=now),
+            self._nicknames_key,
+            self._dirty_key
+        ]
+        args = [self.applied_ttl, self.daily_ttl, self.weekly_ttl]
+        for result in results:
+            if not result.get("user_id"):
+                continue
+            args.extend([
+                str(result["user_id"]),
+                int(result.get("score", 0)),
+                1 if result.get("rank") == 1 else 0,
+                result.get("nickname") or ""
+            ])
+        applied = bool(self._record_game(keys=keys, args=args))
+        if applied:
+            self.stats["games"] += 1
+        return applied
+
+    # === 조회 ===
+
+    async def get_top(self, board: str = "all", limit: int = 10) -> List[Dict[str, Any]]:
+        """상위 N명"""
+        entries = self.redis_client.zrevrange(self._board_key(board), 0, max(0, limit - 1), withscores=True)
+        return self._with_nicknames(entries, start_rank=1)
+
+    async def get_rank(self, board: str, user_id: int) -> Optional[Dict[str, Any]]:
+        """내 순위와 점수 (보드에 없으면 None)"""
+        key = self._board_key(board)
+        pipe = self.redis_client.pipeline(transaction=False)
+        pipe.zrevrank(key, str(user_id))
+        pipe.zscore(key, str(user_id))
+        pipe.hget(self._nicknames_key, str(user_id))
+        rank, score, nickname = pipe.execute()
+        if rank is None:
+            return None
+        return {"rank": rank + 1, "user_id": user_id, "nickname": nickname, "score": int(score)}
+
+    async def get_around(self, board: str, user_id: int, radius: int = 5) -> List[Dict[str, Any]]:
+        """내 위아래 radius명 (보드에 없으면 빈 목록)"""
+        key = self._board_key(board)
+        rank = self.redis_client.zrevrank(key, str(user_id))
+        if rank is None:
+            return []
+        start = max(0, rank - radius)
+        entries = self.redis_client.zrevrange(key, start, rank + radius, withscores=True)
+        return self._with_nicknames(entries, start_rank=start + 1)
+
+    def _with_nicknames(self, entries: List[Tuple[str, float]], start_rank: int) -> List[Dict[str, Any]]:
+        """(멤버, 점수) 목록에 순위와 닉네임 추가 (HMGET 한 번)"""
+        if not entries:
+            return []
+        nicknames = self.redis_client.hmget(self._nicknames_key, [member for member, _ in entries])
+        return [
+            {"rank": start_rank + i, "user_id": int(member), "nickname": nickname, "score": int(score)}
+            for i, ((member, score), nickname) in enumerate(zip(entries, nicknames))
+        ]
+
+    # === users 테이블 동기화 ===
+
+    async def start(self):
+        """전체 보드 초기 적재 후 주기적 동기화 태스크 시작"""
+        if not self.sync_enabled:
+            return
+        try:
+            await asyncio.to_thread(self.seed_from_database)
+        except Exception as e:
+            logger.error(f"리더보드 초기 적재 실패: {e}")
+        if self._sync_task is None or self._sync_task.done():
+            self._sync_task = asyncio.create_task(self._sync_loop())
+
+    async def stop(self):
+        """동기화 태스크 종료 후 남은 변경 반영"""
+        if self._sync_task and not self._sync_task.done():
+            self._sync_task.cancel()
+            try:
+                await self._sync_task
+            except asyncio.CancelledError:
+                pass
+            try:
+                await asyncio.to_thread(self.sync_to_database)
+            except Exception as e:
+                logger.error(f"리더보드 동기화 실패: {e}")
+
+    async def _sync_loop(self):
+        """주기적으로 변경된 사용자의 누적 점수/승수를 users 테이블에 반영 (초기 적재 전이면 적재부터 시도)"""
+        while True:
+            try:
+                await asyncio.sleep(self.sync_interval)
+                await asyncio.to_thread(self.seed_from_database)
+                await asyncio.to_thread(self.sync_to_database)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                self.stats["sync_errors"] += 1
+                logger.error(f"리더보드 동기화 실패: {e}")
+
+    def seed_from_database(self) -> int:
+        """전체 보드가 비어 있으면 users 테이블의 누적 점수/승수로 채움 (잠금을 잡은 노드 하나만 실행)"""
+        if self.redis_client.exists(self._seeded_key):
+            return 0
+        token = uuid.uuid4().hex
+        if not self.redis_client.set(self._seed_lock_key, token, nx=True, ex=self.seed_lock_ttl):
+            return 0  # 다른 노드가 적재 중
+
+        all_key = self._board_key("all")
+        wins_key = self._board_key("all", "wins")
+        staging = {all_key: f"{all_key}:seed:{token}", wins_key: f"{wins_key}:seed:{token}"}
+        seeded = 0
+        last_id = 0
+        db = next(get_db())
+        try:
+            while True:
+                rows = db.execute(
+                    select(User.id, User.nickname, User.total_score, User.total_wins)
+                    .where(User.id > last_id, (User.total_score > 0) | (User.total_wins > 0))
+                    .order_by(User.id)
+                    .limit(self.sync_batch_size)
+                ).all()
+                if not rows:
+                    break
+                pipe = self.redis_client.pipeline(transaction=False)
+                for user_id, nickname, total_score, total_wins in rows:
+                    if total_score:
+                        pipe.zadd(staging[all_key], {str(user_id): int(total_score)})
+                    if total_wins:
+                        pipe.zadd(staging[wins_key], {str(user_id): int(total_wins)})
+                    pipe.hsetnx(self._nicknames_key, str(user_id), nickname)
+                for staging_key in staging.values():
+                    pipe.expire(staging_key, self.seed_lock_ttl)
+                pipe.execute()
+                seeded += len(rows)
+                last_id = rows[-1][0]
+
+            # 초기 적재 중에 끝난 게임 점수가 이미 들어 있을 수 있으므로 한 번에 더해서 합치고,
+            # 잠금이 아직 내 것일 때만 합친 뒤 완료 표시 (잠금이 만료돼 다른 노드가 적재 중이면 중복 합산 방지)
+            with self.redis_client.pipeline() as pipe:
+                pipe.watch(self._seed_lock_key)
+                if pipe.get(self._seed_lock_key) != token:
+                    raise RuntimeError("초기 적재 잠금이 만료되었습니다")
+                pipe.multi()
+                for board_key, staging_key in staging.items():
+                    pipe.zunionstore(board_key, [board_key, staging_key], aggregate="SUM")
+                pipe.set(self._seeded_key, datetime.now(timezone.utc).isoformat())
+                pipe.delete(self._seed_lock_key)
+                pipe.execute()
+        except redis.WatchError:
+            raise RuntimeError("초기 적재 잠금이 만료되었습니다")
+        finally:
+            db.close()
+            # 합치기 성공/실패와 관계없이 임시 집합과 내 잠금 정리 (실패하면 다음 주기에 다시 시도)
+            try:
+                self.redis_client.delete(*staging.values())
+                self._release_lock(keys=[self._seed_lock_key], args=[token])
+            except Exception as e:
+                logger.warning(f"리더보드 초기 적재 정리 실패: {e}")
+
+        self.stats["seeded"] += seeded
+        logger.info(f"리더보드 초기 적재: 사용자 {seeded}명")
+        return seeded
+
+    def sync_to_database(self) -> int:
+        """변경된 사용자의 전체 보드 점수/승수를 users 테이블에 묶음 단위로 기록 (절대값이라 재시도 안전)"""
+        if not self.redis_client.exists(self._seeded_key):
+            return 0  # 초기 적재가 끝나기 전에는 보드 값이 누적 전체가 아님
+
+        all_key = self._board_key("all")
+        wins_key = self._board_key("all", "wins")
+        synced = 0
+        while True:
+            members = self.redis_client.spop(self._dirty_key, self.sync_batch_size)
+            if not members:
+                break
+
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.zmscore(all_key, members)
+            pipe.zmscore(wins_key, members)
+            scores, wins = pipe.execute()
+            rows = [
+                {"target_id": int(member), "new_score": int(score or 0), "new_wins": int(win or 0)}
+                for member, score, win in zip(members, scores, wins)
+            ]
+
+            db = next(get_db())
+            try:
+                db.connection().execute(
+                    update(User.__table__)
+                    .where(User.__table__.c.id == bindparam("target_id"))
+                    .values(total_score=bindparam("new_score"), total_wins=bindparam("new_wins")),
+                    rows
+                )
+                db.commit()
+            except Exception:
+                db.rollback()
+                # 다음 동기화 때 다시 반영
+                self.redis_client.sadd(self._dirty_key, *members)
+                raise
+            finally:
+                db.close()
+            synced += len(rows)
+
+        if synced:
+            self.stats["synced"] += synced
+            logger.debug(f"리더보드 동기화: 사용자 {synced}명")
+        return synced
+
+    def get_stats(self) -> Dict[str, Any]:
+        """리더보드 통계"""
+        return {
+            "sync_enabled": self.sync_enabled,
+            "running": self._sync_task is not None and not self._sync_task.done(),
+            **self.stats
+        }
+
+
+# 전역 리더보드 서비스 인스턴스
+leaderboard_service = LeaderboardService()
+
+
+def get_leaderboard_service() -> LeaderboardService:
+    """리더보드 서비스 의존성"""
+    return leaderboard_service
@@ -0,0 +1,306 @@
+"""
+감사 로그 파티션 관리
+game_logs / word_submissions 월별 범위 파티션을 미리 만들고,
+보존 기간이 지난 파티션을 통째로 삭제 (행 단위 DELETE 없음)
+파티션 도입 전의 일반 테이블은 처음 유지보수할 때 파티션 테이블로 변환
+"""
+
+import os
+import re
+import asyncio
+import logging
+from datetime import datetime, timezone, timedelta
+from typing import Dict, List, Any, Optional, Tuple
+from sqlalchemy import text
+from database import get_db
+from models import Base
+
+logger = logging.getLogger(__name__)
+
+# 파티션 테이블 → 파티션 키 컬럼
+PARTITIONED_TABLES = {
+    "game_logs": "timestamp",
+    "word_submissions": "submitted_at"
+}
+
+# 여러 프로세스가 동시에 유지보수하지 않도록 잡는 advisory lock 키
+MAINTENANCE_LOCK_KEY = "kkua:partition_maintenance"
+
+
+def month_start(moment: datetime) -> datetime:
+    """해당 시각이 속한 달의 1일 0시 (UTC)"""
+    return datetime(moment.year, moment.month, 1, tzinfo=timezone.utc)
+
+
+def add_months(month: datetime, months: int) -> datetime:
+    """월 단위 이동"""
+    index = month.year * 12 + month.month - 1 + months
+    return datetime(index // 12, index % 12 + 1, 1, tzinfo=timezone.utc)
+
+
+def partition_name(table: str, month: datetime) -> str:
+    """월별 파티션 이름 (예: game_logs_202601)"""
+    return f"{table}_{month:%Y%m}"
+
+
+def default_partition_name(table: str) -> str:
+    """월별 파티션 범위 밖의 행을 받는 기본 파티션 이름 (예: game_logs_default)"""
+    return f"{table}_default"
+
+
+class PartitionManager:
+    """월별 파티션 생성/삭제 (주기적 유지보수 태스크 포함)"""
+
+    def __init__(self):
+        self.enabled = os.getenv("PARTITION_MAINTENANCE_ENABLED", "true").lower() == "true"
+        self.months_ahead = int(os.getenv("PARTITION_MONTHS_AHEAD", "3"))
+        self.retention_days = int(os.getenv("AUDIT_LOG_RETENTION_DAYS", "90"))
+        self.interval = float(os.getenv("PARTITION_MAINTENANCE_INTERVAL", "3600"))
+
+        self._task: Optional[asyncio.Task] = None
+        self.stats = {"runs": 0, "created": 0, "dropped": 0, "errors": 0, "last_run": None}
+
+    async def start(self):
+        """파티션을 바로 준비한 뒤 주기적 유지보수 태스크 시작"""
+        if not self.enabled:
+            return
+        try:
+            await asyncio.to_thread(self.run_maintenance)
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.error(f"파티션 유지보수 실패: {e}")
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._maintenance_loop())
+
+    async def stop(self):
+        """유지보수 태스크 종료"""
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def _maintenance_loop(self):
+        """주기적으로 다음 달 파티션 생성 및 만료 파티션 삭제"""
+        while True:
+            try:
+                await asyncio.sleep(self.interval)
+                await asyncio.to_thread(self.run_maintenance)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.error(f"파티션 유지보수 실패: {e}")
+
+    def run_maintenance(self) -> Dict[str, List[str]]:
+        """파티션 생성과 보존 기간 정리를 한 번 실행"""
+        created = self.ensure_partitions()
+        cutoff = datetime.now(timezone.utc) - timedelta(days=self.retention_days)
+        dropped = self.drop_partitions_before(cutoff)
+        self.stats["runs"] += 1
+        self.stats["last_run"] = datetime.now(timezone.utc).isoformat()
+        return {"created": created, "dropped": dropped}
+
+    # === 파티션 생성 ===
+
+    def ensure_partitions(self, months_ahead: Optional[int] = None) -> List[str]:
+        """이번 달부터 months_ahead개월 뒤까지의 파티션 생성 (이미 있으면 건너뜀), 새로 만든 이름 반환"""
+        months_ahead = self.months_ahead if months_ahead is None else months_ahead
+        current = month_start(datetime.now(timezone.utc))
+        months = [add_months(current, offset) for offset in range(months_ahead + 1)]
+
+        created = []
+        db = next(get_db())
+        try:
+            self._lock(db)
+            for table in PARTITIONED_TABLES:
+                if self._is_unpartitioned(db, table):
+                    created.extend(self._convert_to_partitioned(db, table))
+                existing = {name for name, _ in self._list_partitions(db, table)}
+                for month in months:
+                    if partition_name(table, month) not in existing:
+                        created.append(self._create_partition(db, table, month))
+                # 유지보수가 늦어져 월별 파티션이 없는 달의 행도 기록되도록
+                db.execute(text(
+                    f"CREATE TABLE IF NOT EXISTS {default_partition_name(table)} PARTITION OF {table} DEFAULT"
+                ))
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+        if created:
+            self.stats["created"] += len(created)
+            logger.info(f"감사 로그 파티션 생성: {', '.join(created)}")
+        return created
+
+    # === 보존 기간 정리 ===
+
+    def drop_partitions_before(self, cutoff: datetime) -> List[str]:
+        """cutoff 이전 데이터만 담은 월별 파티션 삭제 (cutoff가 걸친 달은 유지), 삭제한 이름 반환"""
+        if cutoff.tzinfo is None:
+            cutoff = cutoff.replace(tzinfo=timezone.utc)
+        cutoff_month = month_start(cutoff)
+
+        dropped = []
+        db = next(get_db())
+        try:
+            self._lock(db)
+            for table in PARTITIONED_TABLES:
+                for name, month in self._list_partitions(db, table):
+                    if add_months(month, 1) <= cutoff_month:
+                        db.execute(text(f"DROP TABLE IF EXISTS {name}"))
+                        dropped.append(name)
+                # 기본 파티션에 남은 만료된 행 (월별 파티션이 늦게 만들어진 경우만 있으므로 적음)
+                if self._exists(db, default_partition_name(table)):
+                    db.execute(
+                        text(f'DELETE FROM {default_partition_name(table)} WHERE "{PARTITIONED_TABLES[table]}" < :cutoff'),
+                        {"cutoff": cutoff_month}
+                    )
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+        if dropped:
+            self.stats["dropped"] += len(dropped)
+            logger.info(f"만료된 감사 로그 파티션 삭제: {', '.join(dropped)}")
+        return dropped
+
+    # === 내부 ===
+
+    def _create_partition(self, db, table: str, month: datetime) -> str:
+        """월별 파티션 생성 (기본 파티션에 같은 달 행이 있으면 옮긴 뒤 연결), 이름 반환"""
+        name = partition_name(table, month)
+        column = PARTITIONED_TABLES[table]
+        start, end = f"{month:%Y-%m-%d}", f"{add_months(month, 1):%Y-%m-%d}"
+        default = default_partition_name(table)
+
+        has_default_rows = self._exists(db, default) and db.execute(
+            text(f'SELECT EXISTS (SELECT 1 FROM {default} WHERE "{column}" >= :start AND "{column}" < :end)'),
+            {"start": start, "end": end}
+        ).scalar()
+        if not has_default_rows:
+            db.execute(text(
+                f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {table} "
+                f"FOR VALUES FROM ('{start}') TO ('{end}')"
+            ))
+            return name
+
+        # 기본 파티션에 해당 달 행이 있으면 PARTITION OF가 실패하므로 별도 테이블에 옮긴 뒤 연결
+        db.execute(text(f"CREATE TABLE {name} (LIKE {table} INCLUDING DEFAULTS)"))
+        db.execute(
+            text(
+                f'WITH moved AS (DELETE FROM {default} WHERE "{column}" >= :start AND "{column}" < :end RETURNING *) '
+                f"INSERT INTO {name} SELECT * FROM moved"
+            ),
+            {"start": start, "end": end}
+        )
+        db.execute(text(f"ALTER TABLE {table} ATTACH PARTITION {name} FOR VALUES FROM ('{start}') TO ('{end}')"))
+        return name
+
+    def _convert_to_partitioned(self, db, table: str) -> List[str]:
+        """파티션 도입 전 일반 테이블을 파티션 테이블로 바꾸고 기존 행을 옮김, 만든 월별 파티션 이름 반환"""
+        legacy = f"{table}_legacy"
+        column = PARTITIONED_TABLES[table]
+        logger.warning(f"{table}이(가) 파티션 테이블이 아니므로 변환합니다")
+
+        db.execute(text(f"ALTER TABLE {table} RENAME TO {legacy}"))
+        # 새 부모 테이블과 이름이 겹치는 기존 인덱스(기본 키 포함)와 id 시퀀스 이름 변경
+        index_names = db.execute(
+            text("SELECT indexname FROM pg_indexes WHERE tablename = :table"), {"table": legacy}
+        ).scalars().all()
+        for index_name in index_names:
+            db.execute(text(f'ALTER INDEX "{index_name}" RENAME TO "{index_name[:55]}_legacy"'))
+        sequence = db.execute(text("SELECT pg_get_serial_sequence(:table, 'id')"), {"table": legacy}).scalar()
+        if sequence:
+            db.execute(text(f"ALTER SEQUENCE {sequence} RENAME TO {legacy}_id_seq"))
+
+        Base.metadata.tables[table].create(bind=db.connection())
+
+        # 기존 행이 있는 달부터 이번 달까지 월별 파티션을 만든 뒤 복사 (그보다 뒤의 행은 기본 파티션으로)
+        created = []
+        first = db.execute(text(f'SELECT MIN("{column}") FROM {legacy}')).scalar()
+        if first is not None:
+            month = month_start(first)
+            current = month_start(datetime.now(timezone.utc))
+            while month <= current:
+                created.append(self._create_partition(db, table, month))
+                month = add_months(month, 1)
+        db.execute(text(f"CREATE TABLE IF NOT EXISTS {default_partition_name(table)} PARTITION OF {table} DEFAULT"))
+
+        columns = [c.name for c in Base.metadata.tables[table].columns]
+        insert_columns = ", ".join(f'"{name}"' for name in columns)
+        # 파티션 키는 기본 키에 포함되어 NULL일 수 없음
+        select_columns = ", ".join(
+            f'COALESCE("{name}", now())' if name == column else f'"{name}"' for name in columns
+        )
+        moved = db.execute(text(f"INSERT INTO {table} ({insert_columns}) SELECT {select_columns} FROM {legacy}")).rowcount
+        db.execute(text(
+            f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), COALESCE(MAX(id), 0) + 1, false) FROM {table}"
+        ))
+        db.execute(text(f"DROP TABLE {legacy}"))
+
+        logger.info(f"{table} 파티션 테이블 변환 완료: {moved}행 이동")
+        return created
+
+    @staticmethod
+    def _exists(db, relation: str) -> bool:
+        """테이블 존재 여부"""
+        return db.execute(text("SELECT to_regclass(:relation) IS NOT NULL"), {"relation": relation}).scalar()
+
+    @staticmethod
+    def _is_unpartitioned(db, table: str) -> bool:
+        """파티션 도입 전의 일반 테이블인지 (relkind 'r', 파티션 테이블은 'p')"""
+        relkind = db.execute(
+            text("SELECT relkind FROM pg_class WHERE oid = to_regclass(:table)"), {"table": table}
+        ).scalar()
+        return relkind == "r"
+
+    @staticmethod
+    def _lock(db):
+        """트랜잭션 동안 유지되는 유지보수 잠금 (다른 프로세스는 끝날 때까지 대기)"""
+        db.execute(text("SELECT pg_advisory_xact_lock(hashtext(:key))"), {"key": MAINTENANCE_LOCK_KEY})
+
+    @staticmethod
+    def _list_partitions(db, table: str) -> List[Tuple[str, datetime]]:
+        """테이블의 월별 파티션 (이름, 시작 월) 목록"""
+        rows = db.execute(text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE parent.relname = :table"
+        ), {"table": table}).scalars()
+
+        pattern = re.compile(rf"^{table}_(\d{{4}})(\d{{2}})$")
+        partitions = []
+        for name in rows:
+            match = pattern.match(name)
+            if match:
+                month = datetime(int(match.group(1)), int(match.group(2)), 1, tzinfo=timezone.utc)
+                partitions.append((name, month))
+        return sorted(partitions, key=lambda item: item[1])
+
+    def get_stats(self) -> Dict[str, Any]:
+        """파티션 유지보수 통계"""
+        return {
+            "enabled": self.enabled,
+            "months_ahead": self.months_ahead,
+            "retention_days": self.retention_days,
+            "running": self._task is not None and not self._task.done(),
+            **self.stats
+        }
+
+
+# 전역 파티션 관리자 인스턴스
+partition_manager = PartitionManager()
+
+
+def get_partition_manager() -> PartitionManager:
+    """파티션 관리자 의존성"""
+    return partition_manager
@@ -0,0 +1,104 @@
+"""
+웜 스타트 스냅샷
+자주 쓰는 단어 정보, 글자별 힌트 목록, 인기 캐시 키를 디스크에 저장해
+재시작 시 DB/Redis 왕복 없이 한 번의 파일 읽기로 복원 (사전 서명이 바뀌면 재생성)
+"""
+
+import os
+import gzip
+import json
+import time
+import logging
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+from sqlalchemy import select, func
+from models.dictionary_models import KoreanDictionary
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FORMAT = 1
+
+
+class WarmStartSnapshot:
+    """웜 스타트 스냅샷 저장/로드"""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or os.getenv("WARM_START_PATH", "data/warm_start.json.gz")
+        self.word_limit = int(os.getenv("WARM_START_WORDS", "20000"))
+        self.hints_per_char = 10
+        self.hot_key_limit = 2000
+
+    def load(self, signature: Dict[str, int]) -> Optional[Dict[str, Any]]:
+        """스냅샷 로드 (없거나 형식/사전 서명이 다르면 None)"""
+        target = Path(self.path)
+        if not target.exists():
+            return None
+        try:
+            with gzip.open(target, "rt", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception as e:
+            logger.warning(f"웜 스타트 스냅샷 읽기 실패: {e}")
+            return None
+
+        if data.get("format") != SNAPSHOT_FORMAT or data.get("signature") != signature:
+            logger.info("사전이 변경되어 웜 스타트 스냅샷을 사용하지 않습니다")
+            return None
+        return data
+
+    def save(self, signature: Dict[str, int], words: List[List[Any]],
+             hints: Dict[str, List[str]], hot_keys: List[str]) -> bool:
+        """스냅샷 저장 (임시 파일 후 교체)"""
+        data = {
+            "format": SNAPSHOT_FORMAT,
+            "signature": signature,
+            "created_at": time.time(),
+            "words": words,
+            "hints": hints,
+            "hot_keys": hot_keys[:self.hot_key_limit]
+        }
+        target = Path(self.path)
+        temp = target.with_suffix(f"{target.suffix}.{os.getpid()}.tmp")  # 여러 엔진 프로세스 동시 저장 대비
+        try:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            with gzip.open(temp, "wt", encoding="utf-8", compresslevel=1) as f:
+                json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+            temp.replace(target)
+            return True
+        except OSError as e:
+            # 디스크 부족 등으로 쓰다 만 임시 파일은 남기지 않음
+            temp.unlink(missing_ok=True)
+            logger.warning(f"웜 스타트 스냅샷 저장 실패: {e}")
+            return False
+
+    def build_from_database(self, db) -> Dict[str, Any]:
+        """Postgres에서 자주 쓰는 단어와 글자별 힌트 목록 생성 (쿼리 2회)"""
+        words = [
+            [row.word, row.definition or "", row.difficulty_level or 1, row.frequency_score or 0]
+            for row in db.execute(
+                select(
+                    KoreanDictionary.word, KoreanDictionary.definition,
+                    KoreanDictionary.difficulty_level, KoreanDictionary.frequency_score
+                )
+                .order_by(KoreanDictionary.frequency_score.desc())
+                .limit(self.word_limit)
+            )
+        ]
+
+        # 첫 글자별 빈도 상위 단어 (get_word_hints 정렬 기준과 동일)
+        ranked = select(
+            KoreanDictionary.first_char,
+            KoreanDictionary.word,
+            func.row_number().over(
+                partition_by=KoreanDictionary.first_char,
+                order_by=KoreanDictionary.frequency_score.desc()
+            ).label("rank")
+        ).subquery()
+        hints: Dict[str, List[str]] = {}
+        for first_char, word in db.execute(
+            select(ranked.c.first_char, ranked.c.word)
+            .where(ranked.c.rank <= self.hints_per_char)
+            .order_by(ranked.c.first_char, ranked.c.rank)
+        ):
+            hints.setdefault(first_char, []).append(word)
+
+        return {"words": words, "hints": hints, "hot_keys": []}
@@ -0,0 +1,124 @@
+"""
+다음 턴 후보 단어 선적재
+턴 시작 시 다음 단어가 시작할 수 있는 글자(두음법칙 포함)의 사전 단어를 메모리에 미리 적재,
+제출 단어를 I/O 없이 검증, 선적재 적중률 집계
+"""
+
+import os
+import asyncio
+import logging
+from typing import Dict, List, Any, Optional, Tuple
+from sqlalchemy import select
+from database import get_db
+from models.dictionary_models import KoreanDictionary
+from utils.dueum_rules import dueum_rules
+from utils.tinylfu import TinyLFUCache
+
+logger = logging.getLogger(__name__)
+
+# 단어 → (뜻, 난이도, 빈도)
+Bucket = Dict[str, Tuple[str, int, int]]
+
+
+class WordPrefetcher:
+    """다음 턴 후보 단어 선적재기"""
+
+    def __init__(self):
+        self.enabled = os.getenv("WORD_PREFETCH_ENABLED", "true").lower() == "true"
+        self.max_words = int(os.getenv("WORD_PREFETCH_MAX_WORDS", "200000"))
+        self.bucket_ttl = 600  # 글자별 단어 묶음 유지 시간 (초)
+
+        # 키: "사전버전:첫글자", 크기: 단어 수
+        self.buckets = TinyLFUCache(max_size=4096, max_weight=self.max_words)
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._tasks: set = set()
+        self.stats = {
+            "prefetches": 0, "buckets_loaded": 0, "words_loaded": 0,
+            "hits": 0, "misses": 0, "rejections": 0, "errors": 0
+        }
+
+    @staticmethod
+    def _bucket_key(version: int, first_char: str) -> str:
+        return f"{version}:{first_char}"
+
+    def prefetch(self, last_char: str, version: int) -> Optional[asyncio.Task]:
+        """다음 단어가 시작할 수 있는 글자들의 단어 묶음을 백그라운드로 적재"""
+        if not self.enabled or not last_char:
+            return None
+
+        missing = [
+            start_char for start_char in dueum_rules.get_all_possible_starts(last_char)
+            if self._bucket_key(version, start_char) not in self._inflight
+            and self.buckets.get(self._bucket_key(version, start_char), record=False) is None
+        ]
+        if not missing:
+            return None
+
+        self.stats["prefetches"] += 1
+        task = asyncio.create_task(self._load_buckets(missing, version))
+        for start_char in missing:
+            self._inflight[self._bucket_key(version, start_char)] = task
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def _load_buckets(self, start_chars: List[str], version: int):
+        """글자별 단어 묶음 조회 후 저장 (한 번의 쿼리)"""
+        try:
+            buckets = await asyncio.to_thread(self._query_buckets, start_chars)
+            for start_char in start_chars:
+                bucket = buckets.get(start_char, {})
+                self.buckets.set(self._bucket_key(version, start_char), bucket, self.bucket_ttl, weight=len(bucket))
+                self.stats["buckets_loaded"] += 1
+                self.stats["words_loaded"] += len(bucket)
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.error(f"후보 단어 선적재 중 오류 ({start_chars}): {e}")
+        finally:
+            for start_char in start_chars:
+                self._inflight.pop(self._bucket_key(version, start_char), None)
+
+    def _query_buckets(self, start_chars: List[str]) -> Dict[str, Bucket]:
+        """첫 글자별 사전 단어 조회"""
+        db = next(get_db())
+        try:
+            rows = db.execute(
+                select(
+                    KoreanDictionary.first_char, KoreanDictionary.word, KoreanDictionary.definition,
+                    KoreanDictionary.difficulty_level, KoreanDictionary.frequency_score
+                ).where(KoreanDictionary.first_char.in_(start_chars))
+            )
+            buckets: Dict[str, Bucket] = {}
+            for first_char, word, definition, difficulty, frequency_score in rows:
+                buckets.setdefault(first_char, {})[word] = (definition or "", difficulty or 1, frequency_score or 0)
+            return buckets
+        finally:
+            db.close()
+
+    def lookup(self, word: str, version: int) -> Tuple[bool, Optional[Tuple[str, int, int]]]:
+        """선적재된 묶음에서 단어 조회 (묶음 존재 여부, 단어 정보) - 묶음이 있는데 없으면 사전에 없는 단어"""
+        if not self.enabled or not word:
+            return False, None
+
+        bucket = self.buckets.get(self._bucket_key(version, word[0]))
+        if bucket is None:
+            self.stats["misses"] += 1
+            return False, None
+
+        self.stats["hits"] += 1
+        entry = bucket.get(word)
+        if entry is None:
+            self.stats["rejections"] += 1
+        return True, entry
+
+    def get_stats(self) -> Dict[str, Any]:
+        """선적재 통계"""
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            "enabled": self.enabled,
+            "buckets": len(self.buckets),
+            "words": self.buckets.weight,
+            "inflight": len(self._inflight),
+            "hit_rate": self.stats["hits"] / lookups if lookups else 0.0,
+            **self.stats
+        }
@@ -3,16 +3,22 @@
 한국어 단어 유효성 검증, 끝말잇기 규칙, 중복 확인, Redis 캐싱
 """
 
+import os
 import re
+import asyncio
 import logging
-from typing import Dict, Set, Optional, Tuple, Any, List
-from dataclasses import dataclass
+from typing import Dict, Set, Optional, Tuple, Any, List, Callable
+from dataclasses import dataclass, field, replace
 from enum import Enum
-from database import get_db, get_redis
-from models.dictionary_models import KoreanDictionary
+from database import get_db, get_redis, get_async_redis
+from models.dictionary_models import KoreanDictionary, ForbiddenWord
 from redis_models import WordChainState
 from utils.dueum_rules import dueum_rules, check_dueum_word_validity, get_dueum_display_text, get_dueum_input_help
-from sqlalchemy import select
+from utils.bloom_filter import BloomFilter
+from utils.aho_corasick import AhoCorasick
+from services.warm_start import WarmStartSnapshot
+from services.word_prefetcher import WordPrefetcher
+from sqlalchemy import select, func, text
 import redis
 import json
 
@@ -53,6 +59,21 @@ class ValidationResponse:
     score_info: Optional[Dict[str, Any]] = None
 
 
+@dataclass
+class DictionaryIndex:
+    """사전 인덱스 (사전 버전 단위로 통째로 교체)"""
+    version: int = 0
+    signature: Optional[Dict[str, int]] = None
+    word_filter: Optional[BloomFilter] = None         # 없는 단어 거절용 블룸 필터
+    words: Dict[str, WordInfo] = field(default_factory=dict)  # 자주 쓰는 단어 정보
+    hints: Dict[str, List[str]] = field(default_factory=dict)  # 첫 글자별 빈도 상위 단어
+    hints_depth: int = 0
+    source: str = "empty"                              # snapshot / database
+    hot_keys: List[str] = field(default_factory=list)  # 스냅샷에 저장된 인기 캐시 키
+    forbidden: AhoCorasick = field(default_factory=AhoCorasick)  # 기본 + DB 금지어 오토마톤
+    syllable_stats: Dict[str, Tuple[int, int]] = field(default_factory=dict)  # 글자별 (시작 단어 수, 끝 단어 수)
+
+
 class WordValidator:
     """단어 검증기"""
     
@@ -64,18 +85,41 @@ class WordValidator:
         self.max_word_length = 50  # 최대 길이 제한 완화
         self.cache_ttl = 3600  # 1시간
         
-        # 금지된 단어 패턴 (욕설, 비속어)
-        self.forbidden_patterns = [
-            r'.*시발.*', r'.*씨발.*', r'.*개새.*', r'.*병신.*',
-            r'.*미친.*', r'.*바보.*', r'.*멍청.*', r'.*죽어.*'
+        # 기본 금지어 (욕설, 비속어) - forbidden_words 테이블의 단어와 합쳐 검사
+        self.forbidden_words = [
+            '시발', '씨발', '개새', '병신',
+            '미친', '바보', '멍청', '죽어'
         ]
         
         # 한국어 문자 패턴
         self.korean_pattern = re.compile(r'^[가-힣]+$')
         
-        # Redis 키 접두사
+        # Redis 키 접두사 (단어/힌트 캐시 키에는 사전 버전이 포함됨)
         self.word_cache_prefix = "word_cache:"
         self.chain_cache_prefix = "chain_cache:"
+        self.version_key = "dictionary:version"
+        self.reload_channel = "dictionary:reload"
+        # 금지어 목록은 사전과 따로 버전 관리 (바뀌면 금지어 오토마톤만 다시 생성)
+        self.blocklist_version_key = "forbidden_words:version"
+        self.blocklist_channel = "forbidden_words:reload"
+        self.blocklist_version = 0
+        
+        # 사전 인덱스 (새 인덱스를 백그라운드에서 만든 뒤 참조만 교체)
+        self.index = DictionaryIndex(forbidden=AhoCorasick(self.forbidden_words))
+        self.word_filter_enabled = os.getenv("WORD_FILTER_ENABLED", "true").lower() == "true"
+        self.word_filter_path = os.getenv("WORD_FILTER_PATH", "data/word_filter.bin")
+        self.word_filter_error_rate = float(os.getenv("WORD_FILTER_ERROR_RATE", "0.01"))
+        self.warm_start_enabled = os.getenv("WARM_START_ENABLED", "true").lower() == "true"
+        self.warm_start = WarmStartSnapshot()
+        self.reload_poll_interval = 30  # 재적재 신호 유실 대비 버전 확인 주기 (초)
+        self.filter_rejections = 0
+        self.reloads = 0
+        self.blocklist_reloads = 0
+        
+        # 턴 시작 시 다음 후보 단어 선적재
+        self.prefetcher = WordPrefetcher()
+        self._reload_lock = asyncio.Lock()
+        self._watch_task: Optional[asyncio.Task] = None
     
     async def validate_word(self, word: str, word_chain: WordChainState, used_words: Set[str]) -> ValidationResponse:
         """단어 종합 검증"""
@@ -154,13 +198,12 @@ class WordValidator:
                 message="한국어만 사용 가능합니다"
             )
         
-        # 금지어 검증
-        for pattern in self.forbidden_patterns:
-            if re.match(pattern, word):
-                return ValidationResponse(
-                    result=ValidationResult.FORBIDDEN,
-                    message="사용할 수 없는 단어입니다"
-                )
+        # 금지어 검증 (전체 금지어를 한 번에 검사)
+        if self.index.forbidden.find(word) is not None:
+            return ValidationResponse(
+                result=ValidationResult.FORBIDDEN,
+                message="사용할 수 없는 단어입니다"
+            )
         
         return ValidationResponse(
             result=ValidationResult.VALID,
@@ -208,11 +251,347 @@ class WordValidator:
         """두음법칙 대체 문자 표시용 (통합된 유틸리티 사용)"""
         return get_dueum_display_text(char)
     
+    # === 사전 인덱스 ===
+    
+    def get_dictionary_version(self) -> int:
+        """Redis에 기록된 사전 버전"""
+        try:
+            return int(self.redis_client.get(self.version_key) or 0)
+        except Exception as e:
+            logger.error(f"사전 버전 조회 중 오류: {e}")
+            return self.index.version
+    
+    def get_dictionary_signature(self, db, version: int) -> Dict[str, int]:
+        """사전 변경 감지용 서명 (버전, 단어 수, 최대 ID)"""
+        count, max_id = db.execute(
+            select(func.count(KoreanDictionary.id), func.max(KoreanDictionary.id))
+        ).one()
+        return {"version": version, "count": count or 0, "max_id": max_id or 0}
+    
+    def _load_word_filter(self, db, signature: Dict[str, int]) -> Optional[BloomFilter]:
+        """사전 블룸 필터 로드 (서명이 다르거나 파일이 없으면 재생성 후 저장)"""
+        try:
+            cached_filter = BloomFilter.load(self.word_filter_path)
+        except Exception as e:
+            logger.warning(f"블룸 필터 파일 손상, 재생성: {e}")
+            cached_filter = None
+        if cached_filter and cached_filter.meta.get("signature") == signature:
+            logger.info(f"블룸 필터 로드: 단어 {len(cached_filter)}개, {cached_filter.size_bytes // 1024}KB")
+            return cached_filter
+        
+        if signature["count"] == 0:
+            # 빈 사전에서는 모든 단어가 거절되므로 필터를 쓰지 않음
+            return None
+        
+        word_filter = BloomFilter(int(signature["count"] * 1.1), self.word_filter_error_rate)
+        rows = db.execute(
+            select(KoreanDictionary.word).execution_options(yield_per=10000)
+        )
+        word_filter.update(row[0] for row in rows)
+        word_filter.meta = {"signature": signature}
+        
+        try:
+            word_filter.save(self.word_filter_path)
+        except OSError as e:
+            logger.warning(f"블룸 필터 저장 실패: {e}")
+        
+        logger.info(f"블룸 필터 생성: 단어 {len(word_filter)}개, {word_filter.size_bytes // 1024}KB")
+        return word_filter
+    
+    def _load_forbidden_matcher(self, db) -> AhoCorasick:
+        """기본 금지어와 forbidden_words 테이블로 금지어 오토마톤 생성"""
+        words = list(self.forbidden_words)
+        try:
+            words.extend(row[0] for row in db.execute(select(ForbiddenWord.word)))
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"금지어 목록 조회 실패, 기본 금지어만 사용: {e}")
+        matcher = AhoCorasick(words)
+        logger.info(f"금지어 오토마톤 생성: {len(matcher)}개")
+        return matcher
+    
+    def _load_syllable_stats(self, db) -> Dict[str, Tuple[int, int]]:
+        """syllable_stats 구체화 뷰에서 글자별 시작/끝 단어 수 로드 (뷰가 없으면 집계 쿼리)"""
+        try:
+            rows = db.execute(text("SELECT syllable, start_count, end_count FROM syllable_stats")).all()
+            return {syllable: (start_count, end_count) for syllable, start_count, end_count in rows}
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"syllable_stats 뷰 조회 실패, 직접 집계: {e}")
+        
+        stats: Dict[str, Tuple[int, int]] = {}
+        for first_char, count in db.execute(
+            select(KoreanDictionary.first_char, func.count()).group_by(KoreanDictionary.first_char)
+        ):
+            stats[first_char] = (count, 0)
+        for last_char, count in db.execute(
+            select(KoreanDictionary.last_char, func.count()).group_by(KoreanDictionary.last_char)
+        ):
+            stats[last_char] = (stats.get(last_char, (0, 0))[0], count)
+        return stats
+    
+    def refresh_syllable_stats(self) -> bool:
+        """사전 변경 후 syllable_stats 구체화 뷰 갱신 (조회를 막지 않는 CONCURRENTLY)"""
+        db = next(get_db())
+        try:
+            db.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY syllable_stats"))
+            db.commit()
+            return True
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"syllable_stats 뷰 갱신 실패: {e}")
+            return False
+        finally:
+            db.close()
+    
+    def build_index(self, version: Optional[int] = None) -> DictionaryIndex:
+        """사전 인덱스 생성 (디스크 스냅샷 우선, 서명이 다르면 Postgres에서 재생성)"""
+        if version is None:
+            version = self.get_dictionary_version()
+        
+        db = next(get_db())
+        try:
+            signature = self.get_dictionary_signature(db, version)
+            index = DictionaryIndex(version=version, signature=signature, source="database")
+            self.blocklist_version = self.get_blocklist_version()
+            index.forbidden = self._load_forbidden_matcher(db)
+            index.syllable_stats = self._load_syllable_stats(db)
+            if self.word_filter_enabled:
+                index.word_filter = self._load_word_filter(db, signature)
+            
+            if self.warm_start_enabled:
+                data = self.warm_start.load(signature)
+                if data is not None:
+                    index.source = "snapshot"
+                else:
+                    data = self.warm_start.build_from_database(db)
+                    self.warm_start.save(signature, data["words"], data["hints"], [])
+                
+                index.words = {
+                    word: WordInfo(
+                        word=word,
+                        definition=definition,
+                        difficulty=difficulty,
+                        frequency_score=frequency_score,
+                        first_char=word[0],
+                        last_char=word[-1],
+                        length=len(word),
+                        is_valid=True
+                    )
+                    for word, definition, difficulty, frequency_score in data["words"]
+                }
+                index.hints = data["hints"]
+                index.hints_depth = self.warm_start.hints_per_char
+                index.hot_keys = data["hot_keys"]
+            return index
+        finally:
+            db.close()
+    
+    async def reload_dictionary(self, version: Optional[int] = None) -> DictionaryIndex:
+        """새 사전 인덱스를 스레드에서 만든 뒤 교체 (교체 전까지 기존 인덱스로 검증 계속)"""
+        async with self._reload_lock:
+            if version is not None and version == self.index.version and self.index.signature:
+                return self.index
+            try:
+                index = await asyncio.to_thread(self.build_index, version)
+            except Exception as e:
+                logger.error(f"사전 인덱스 생성 중 오류: {e}")
+                return self.index
+            
+            previous_version = self.index.version
+            self.index = index
+            self.reloads += 1
+            logger.info(
+                f"사전 인덱스 교체: v{previous_version} → v{index.version} "
+                f"(출처={index.source}, 단어 {len(index.words)}개)"
+            )
+            return index
+    
+    def publish_dictionary_update(self, before_publish: Optional[Callable[[int], None]] = None,
+                                  refresh_stats: bool = True) -> int:
+        """사전 변경 알림 (글자 통계 갱신, 버전 증가 후 모든 워커에 재적재 신호, 새 버전 반환)"""
+        if refresh_stats:
+            self.refresh_syllable_stats()
+        version = int(self.redis_client.incr(self.version_key))
+        if before_publish is not None:
+            # 신호 전에 새 버전용 파일(블룸 필터 등)을 준비해 두면 워커가 재생성하지 않음
+            before_publish(version)
+        self.redis_client.publish(self.reload_channel, version)
+        logger.info(f"사전 버전 갱신: v{version}")
+        return version
+    
+    # === 금지어 목록 ===
+    
+    def get_blocklist_version(self) -> int:
+        """Redis에 기록된 금지어 목록 버전"""
+        try:
+            return int(self.redis_client.get(self.blocklist_version_key) or 0)
+        except Exception as e:
+            logger.error(f"금지어 목록 버전 조회 중 오류: {e}")
+            return self.blocklist_version
+    
+    def _build_forbidden_matcher(self) -> AhoCorasick:
+        """금지어 오토마톤만 새로 생성 (사전 인덱스는 그대로)"""
+        db = next(get_db())
+        try:
+            return self._load_forbidden_matcher(db)
+        finally:
+            db.close()
+    
+    async def reload_blocklist(self, version: int) -> AhoCorasick:
+        """금지어 오토마톤을 스레드에서 만든 뒤 현재 인덱스의 오토마톤만 교체"""
+        async with self._reload_lock:
+            if version == self.blocklist_version:
+                return self.index.forbidden
+            try:
+                matcher = await asyncio.to_thread(self._build_forbidden_matcher)
+            except Exception as e:
+                logger.error(f"금지어 오토마톤 생성 중 오류: {e}")
+                return self.index.forbidden
+            
+            self.index = replace(self.index, forbidden=matcher)
+            self.blocklist_version = version
+            self.blocklist_reloads += 1
+            logger.info(f"금지어 오토마톤 교체: v{version} ({len(matcher)}개)")
+            return matcher
+    
+    def publish_blocklist_update(self) -> int:
+        """금지어 목록 변경 알림 (금지어 버전 증가 후 모든 워커에 신호, 사전 버전/캐시는 유지)"""
+        version = int(self.redis_client.incr(self.blocklist_version_key))
+        self.redis_client.publish(self.blocklist_channel, version)
+        logger.info(f"금지어 목록 버전 갱신: v{version}")
+        return version
+    
+    async def start_watching(self):
+        """사전 변경 신호 수신 시작"""
+        if self._watch_task is None or self._watch_task.done():
+            self._watch_task = asyncio.create_task(self._watch_dictionary())
+    
+    async def stop_watching(self):
+        """사전 변경 신호 수신 종료"""
+        if self._watch_task and not self._watch_task.done():
+            self._watch_task.cancel()
+            try:
+                await self._watch_task
+            except asyncio.CancelledError:
+                pass
+    
+    async def _watch_dictionary(self):
+        """사전/금지어 재적재 신호 수신 루프 (신호 유실 대비 주기적으로 두 버전 확인)"""
+        pubsub = None
+        while True:
+            try:
+                pubsub = get_async_redis().pubsub(ignore_subscribe_messages=True)
+                await pubsub.subscribe(self.reload_channel, self.blocklist_channel)
+                while True:
+                    message = await pubsub.get_message(timeout=self.reload_poll_interval)
+                    if message is not None and message.get("type") == "message":
+                        if message["channel"] == self.blocklist_channel:
+                            await self.reload_blocklist(int(message["data"]))
+                            continue
+                        version = int(message["data"])
+                    else:
+                        version = self.get_dictionary_version()
+                        blocklist_version = self.get_blocklist_version()
+                        if blocklist_version != self.blocklist_version:
+                            await self.reload_blocklist(blocklist_version)
+                    if version != self.index.version:
+                        await self.reload_dictionary(version)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"사전 변경 신호 수신 중 오류: {e}")
+                await asyncio.sleep(1)
+            finally:
+                if pubsub is not None:
+                    try:
+                        await pubsub.aclose()
+                    except Exception:
+                        pass
+                    pubsub = None
+    
+    def prefetch_candidates(self, last_char: str):
+        """다음 단어 후보(두음법칙 포함) 선적재 시작"""
+        self.prefetcher.prefetch(last_char, self.index.version)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """사전 인덱스 및 선적재 통계"""
+        index = self.index
+        return {
+            "version": index.version,
+            "source": index.source,
+            "filter_loaded": index.word_filter is not None,
+            "local_words": len(index.words),
+            "forbidden_words": len(index.forbidden),
+            "blocklist_version": self.blocklist_version,
+            "blocklist_reloads": self.blocklist_reloads,
+            "syllables": len(index.syllable_stats),
+            "filter_rejections": self.filter_rejections,
+            "reloads": self.reloads,
+            "prefetch": self.prefetcher.get_stats()
+        }
+    
+    def export_warm_words(self) -> List[List[Any]]:
+        """웜 스타트 스냅샷용 단어 정보"""
+        return [
+            [info.word, info.definition, info.difficulty, info.frequency_score]
+            for info in self.index.words.values()
+        ]
+    
+    def _word_cache_key(self, word: str, version: Optional[int] = None) -> str:
+        """단어 캐시 키 (사전 버전 포함, 버전이 바뀌면 이전 캐시는 TTL로 소멸)"""
+        if version is None:
+            version = self.index.version
+        return f"{self.word_cache_prefix}v{version}:{word}"
+    
+    def _make_invalid_word_info(self, word: str) -> WordInfo:
+        """사전에 없는 단어 정보"""
+        return WordInfo(
+            word=word,
+            definition="",
+            difficulty=0,
+            frequency_score=0,
+            first_char=word[0] if word else "",
+            last_char=word[-1] if word else "",
+            length=len(word),
+            is_valid=False
+        )
+    
     async def _get_word_info(self, word: str) -> Optional[WordInfo]:
-        """단어 정보 조회 (캐시 우선)"""
+        """단어 정보 조회 (블룸 필터 → 캐시 → DB)"""
         try:
+            # 조회 도중 인덱스가 교체되어도 한 버전 기준으로 처리
+            index = self.index
+            
+            # 블룸 필터에 없으면 확실히 없는 단어 (I/O 없이 거절, 음성 캐시도 남기지 않음)
+            if index.word_filter is not None and word not in index.word_filter:
+                self.filter_rejections += 1
+                return self._make_invalid_word_info(word)
+            
+            # 턴 시작 시 선적재된 후보 단어 (묶음이 있으면 사전 조회 결과와 동일)
+            covered, entry = self.prefetcher.lookup(word, index.version)
+            if covered:
+                if entry is None:
+                    return self._make_invalid_word_info(word)
+                definition, difficulty, frequency_score = entry
+                return WordInfo(
+                    word=word,
+                    definition=definition,
+                    difficulty=difficulty,
+                    frequency_score=frequency_score,
+                    first_char=word[0],
+                    last_char=word[-1],
+                    length=len(word),
+                    is_valid=True
+                )
+            
+            # 웜 스타트로 적재된 단어
+            local_info = index.words.get(word)
+            if local_info is not None:
+                return local_info
+            
             # Redis 캐시에서 조회
-            cache_key = f"{self.word_cache_prefix}{word}"
+            cache_key = self._word_cache_key(word, index.version)
             cached_data = self.redis_client.get(cache_key)
             
             if cached_data:
@@ -268,17 +647,8 @@ class WordValidator:
                 
                 return word_info
             
-            # 없는 단어도 캐시 (무효한 단어로)
-            invalid_info = WordInfo(
-                word=word,
-                definition="",
-                difficulty=0,
-                frequency_score=0,
-                first_char=word[0] if word else "",
-                last_char=word[-1] if word else "",
-                length=len(word),
-                is_valid=False
-            )
+            # 없는 단어도 캐시 (무효한 단어로, 블룸 필터 오탐인 경우)
+            invalid_info = self._make_invalid_word_info(word)
             
             cache_data = {
                 "word": invalid_info.word,
@@ -329,16 +699,29 @@ class WordValidator:
     async def get_word_hints(self, last_char: str, count: int = 3) -> List[str]:
         """다음에 올 수 있는 단어 힌트 (두음법칙 고려)"""
         try:
+            import random
+            
+            # 두음법칙을 고려한 가능한 시작 글자들 획득
+            possible_starts = dueum_rules.get_all_possible_starts(last_char)
+            
+            # 웜 스타트 힌트 목록 (글자별 빈도 상위 단어를 메모리에서 조합)
+            index = self.index
+            if index.hints and count <= index.hints_depth:
+                words = [
+                    word
+                    for start_char in possible_starts
+                    for word in index.hints.get(start_char, [])[:count]
+                ]
+                random.shuffle(words)
+                return words[:count]
+            
             # Redis 캐시 확인
-            cache_key = f"{self.chain_cache_prefix}{last_char}:{count}"
+            cache_key = f"{self.chain_cache_prefix}v{index.version}:{last_char}:{count}"
             cached_hints = self.redis_client.get(cache_key)
             
             if cached_hints:
                 return json.loads(cached_hints)
             
-            # 두음법칙을 고려한 가능한 시작 글자들 획득
-            possible_starts = dueum_rules.get_all_possible_starts(last_char)
-            
             # 데이터베이스에서 조회 (모든 가능한 시작 글자로)
             db = next(get_db())
             words = []
@@ -353,7 +736,6 @@ class WordValidator:
                 words.extend([row[0] for row in result.fetchall()])
             
             # 무작위로 섞어서 힌트 개수만큼 반환
-            import random
             random.shuffle(words)
             hints = words[:count]
             
@@ -373,26 +755,31 @@ class WordValidator:
     async def get_possible_words_count(self, last_char: str) -> int:
         """해당 글자로 시작하는 가능한 단어 개수 (두음법칙 고려)"""
         try:
+            # 두음법칙을 고려한 가능한 시작 글자들 획득
+            possible_starts = dueum_rules.get_all_possible_starts(last_char)
+            
+            # 사전 인덱스의 글자별 통계 (syllable_stats 뷰, I/O 없음)
+            index = self.index
+            if index.syllable_stats:
+                return sum(index.syllable_stats.get(start_char, (0, 0))[0] for start_char in possible_starts)
+            
             # Redis 캐시 확인
-            cache_key = f"count_dueum:{last_char}"
+            cache_key = f"count_dueum:v{index.version}:{last_char}"
             cached_count = self.redis_client.get(cache_key)
             
             if cached_count:
                 return int(cached_count)
             
-            # 두음법칙을 고려한 가능한 시작 글자들 획득
-            possible_starts = dueum_rules.get_all_possible_starts(last_char)
-            
-            # 데이터베이스에서 조회 (모든 가능한 시작 글자로)
+            # 데이터베이스에서 집계 (모든 가능한 시작 글자로)
             db = next(get_db())
-            total_count = 0
-            
-            for start_char in possible_starts:
-                result = db.execute(
-                    select(KoreanDictionary.word_id)
-                    .where(KoreanDictionary.first_char == start_char)
-                )
-                total_count += len(result.fetchall())
+            try:
+                total_count = db.execute(
+                    select(func.count())
+                    .select_from(KoreanDictionary)
+                    .where(KoreanDictionary.first_char.in_(list(possible_starts)))
+                ).scalar() or 0
+            finally:
+                db.close()
             
             # Redis에 캐시 (1시간)
             self.redis_client.setex(cache_key, 3600, str(total_count))
@@ -404,7 +791,7 @@ class WordValidator:
             return 0
     
     async def is_ending_character(self, char: str) -> bool:
-        """게임 종료 글자 확인 (다음 단어가 없는 글자)"""
+        """게임 종료 글자 확인 (다음 단어가 없는 글자, 두음법칙 대안 글자까지 syllable_stats로 확인)"""
         count = await self.get_possible_words_count(char)
         return count == 0
     
@@ -413,14 +800,10 @@ class WordValidator:
         try:
             if word:
                 # 특정 단어 캐시 삭제
-                cache_key = f"{self.word_cache_prefix}{word}"
-                self.redis_client.delete(cache_key)
+                self.redis_client.delete(self._word_cache_key(word))
             else:
-                # 모든 단어 캐시 삭제
-                pattern = f"{self.word_cache_prefix}*"
-                keys = self.redis_client.keys(pattern)
-                if keys:
-                    self.redis_client.delete(*keys)
+                # 사전 버전을 올려 모든 워커가 새 키를 사용 (이전 캐시는 TTL로 소멸)
+                self.publish_dictionary_update()
                     
         except Exception as e:
             logger.error(f"캐시 삭제 중 오류: {e}")
@@ -449,7 +832,7 @@ class WordValidator:
                     is_valid=True
                 )
                 
-                cache_key = f"{self.word_cache_prefix}{dict_entry.word}"
+                cache_key = self._word_cache_key(dict_entry.word)
                 cache_data = {
                     "word": word_info.word,
                     "definition": word_info.definition,
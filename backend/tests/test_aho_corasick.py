@@ -0,0 +1,63 @@
+"""
+아호-코라식 다중 문자열 검색 테스트 케이스
+"""
+
+import pytest
+from utils.aho_corasick import AhoCorasick
+
+
+class TestAhoCorasick:
+    """오토마톤 기본 기능 테스트"""
+
+    def test_find_substring(self):
+        """단어 어디에 있든 패턴 검출"""
+        matcher = AhoCorasick(["바보", "멍청"])
+        assert matcher.find("바보") == "바보"
+        assert matcher.find("왕바보야") == "바보"
+        assert matcher.find("멍청이") == "멍청"
+        assert matcher.find("사과") is None
+
+    def test_failure_links(self):
+        """부분 일치가 실패한 뒤에도 다른 패턴 검출"""
+        matcher = AhoCorasick(["abcd", "bce"])
+        assert matcher.find("abce") == "bce"
+        assert matcher.find("abcd") == "abcd"
+        assert matcher.find("abc") is None
+
+    def test_suffix_patterns(self):
+        """다른 패턴의 접미사인 패턴 검출"""
+        matcher = AhoCorasick(["he", "she", "his", "hers"])
+        assert matcher.find("ushers") == "she"
+        assert matcher.find_all("ushers") == ["she", "he", "hers"]
+        assert matcher.find_all("ahishers") == ["his", "she", "he", "hers"]
+
+    def test_empty_and_duplicate_patterns(self):
+        """빈 패턴은 무시, 중복 패턴은 한 번만 집계"""
+        matcher = AhoCorasick(["", "미친", "미친"])
+        assert len(matcher) == 1
+        assert matcher.find("") is None
+
+        empty = AhoCorasick()
+        assert len(empty) == 0
+        assert empty.find("아무말") is None
+
+    def test_matches_naive_search(self):
+        """단순 부분 문자열 검사와 결과 일치"""
+        patterns = ["가나", "나다", "다라마", "라", "바사아"]
+        matcher = AhoCorasick(patterns)
+        for text in ["가나다라", "마바사", "바사아자", "다라마바", "하하"]:
+            found = matcher.find(text)
+            assert (found is not None) == any(p in text for p in patterns)
+            assert found is None or found in text
+
+    def test_many_patterns(self):
+        """대량 패턴에서도 정확히 검출"""
+        patterns = [f"금지{i}어" for i in range(20000)]
+        matcher = AhoCorasick(patterns)
+        assert len(matcher) == 20000
+        assert matcher.find("앞금지12345어뒤") == "금지12345어"
+        assert matcher.find("금지어") is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,58 @@
+"""
+별칭 테이블 가중 랜덤 선택 테스트 케이스
+"""
+
+import random
+from collections import Counter
+
+import pytest
+from utils.alias_table import AliasTable
+
+
+class TestAliasTable:
+    """별칭 테이블 기본 기능 테스트"""
+
+    def test_distribution_matches_weights(self):
+        """선택 빈도가 가중치 비율과 일치"""
+        weights = {"common": 0.60, "uncommon": 0.25, "rare": 0.10, "epic": 0.04, "legendary": 0.01}
+        table = AliasTable(list(weights), list(weights.values()))
+        rng = random.Random(42)
+        draws = 200000
+        counts = Counter(table.sample(rng) for _ in range(draws))
+        for item, weight in weights.items():
+            assert abs(counts[item] / draws - weight) < 0.01
+
+    def test_single_item(self):
+        """항목이 하나면 항상 그 항목"""
+        table = AliasTable(["사과"], [3.0])
+        assert all(table.sample() == "사과" for _ in range(100))
+
+    def test_zero_weights_excluded(self):
+        """가중치 0 이하 항목은 선택되지 않음"""
+        table = AliasTable(["a", "b", "c"], [0.0, 1.0, -1.0])
+        assert len(table) == 1
+        assert all(table.sample() == "b" for _ in range(100))
+
+    def test_empty_table(self):
+        """빈 테이블은 선택 시 IndexError"""
+        table = AliasTable([], [])
+        assert not table
+        with pytest.raises(IndexError):
+            table.sample()
+
+    def test_length_mismatch(self):
+        """항목과 가중치 길이가 다르면 ValueError"""
+        with pytest.raises(ValueError):
+            AliasTable(["a", "b"], [1.0])
+
+    def test_unnormalized_weights(self):
+        """합이 1이 아닌 가중치도 비율대로 선택"""
+        table = AliasTable(["x", "y"], [1, 3])
+        rng = random.Random(7)
+        draws = 100000
+        counts = Counter(table.sample(rng) for _ in range(draws))
+        assert abs(counts["y"] / draws - 0.75) < 0.01
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,71 @@
+"""
+블룸 필터 테스트 케이스
+"""
+
+import pytest
+from utils.bloom_filter import BloomFilter
+
+
+def make_words(prefix: str, count: int):
+    return [f"{prefix}{i}" for i in range(count)]
+
+
+class TestBloomFilter:
+    """블룸 필터 기본 기능 테스트"""
+
+    def test_no_false_negatives(self):
+        """추가한 단어는 항상 포함으로 판정"""
+        words = make_words("사과", 5000)
+        bloom = BloomFilter(len(words))
+        bloom.update(words)
+        assert all(word in bloom for word in words)
+        assert len(bloom) == 5000
+
+    def test_false_positive_rate_bounded(self):
+        """오탐률이 설정값 근처로 유지"""
+        bloom = BloomFilter(10000, error_rate=0.01)
+        bloom.update(make_words("사과", 10000))
+        false_positives = sum(1 for word in make_words("바나나", 20000) if word in bloom)
+        assert false_positives / 20000 < 0.02
+
+    def test_empty_filter_rejects(self):
+        """빈 필터는 모든 단어 거절"""
+        bloom = BloomFilter(100)
+        assert "사과" not in bloom
+
+    def test_bytes_round_trip(self):
+        """직렬화 후 복원해도 동일하게 판정"""
+        words = make_words("사과", 1000)
+        bloom = BloomFilter(len(words))
+        bloom.update(words)
+        bloom.meta = {"signature": {"count": 1000, "max_id": 1000}}
+
+        restored = BloomFilter.from_bytes(bloom.to_bytes())
+        assert restored.meta == bloom.meta
+        assert len(restored) == len(bloom)
+        assert all(word in restored for word in words)
+        assert restored.bits == bloom.bits
+
+    def test_rejects_invalid_data(self):
+        """형식이 다른 데이터는 거부"""
+        data = bytearray(BloomFilter(100).to_bytes())
+        data[:4] = b"XXXX"
+        with pytest.raises(ValueError):
+            BloomFilter.from_bytes(bytes(data))
+
+    def test_save_and_load(self, tmp_path):
+        """파일 저장 후 로드"""
+        path = tmp_path / "nested" / "word_filter.bin"
+        assert BloomFilter.load(str(path)) is None
+
+        bloom = BloomFilter(100)
+        bloom.add("사과")
+        bloom.save(str(path))
+
+        loaded = BloomFilter.load(str(path))
+        assert "사과" in loaded
+        assert not list(path.parent.glob("*.tmp"))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,58 @@
+"""
+L2 조회 중 도착한 무효화 처리 테스트 케이스
+"""
+
+import asyncio
+
+import pytest
+from services.cache_service import CacheService, _MISSING
+
+
+@pytest.fixture
+def cache():
+    """L2 조회를 직접 흉내 내는 캐시 서비스 (Redis 호출 없음)"""
+    return CacheService()
+
+
+def _l2_with_invalidation(cache, value, keys=(), patterns=()):
+    """값을 돌려주기 전에 다른 노드의 무효화가 도착하는 L2 조회"""
+    async def get_l2(key):
+        cache._apply_invalidation(keys, patterns, {})
+        return value
+    return get_l2
+
+
+class TestL1InvalidationRace:
+    """원본 조회 중 무효화가 지나간 값의 L1 저장 테스트"""
+
+    def test_key_invalidation_drops_l1_write(self, cache):
+        """키 무효화가 조회 중 도착하면 L1에 남기지 않음"""
+        cache._get_l2 = _l2_with_invalidation(cache, {"old": True}, keys=["user_inv:1"])
+        assert asyncio.run(cache._lookup("user_inv:1")) == {"old": True}
+        assert cache.l1.get("user_inv:1", _MISSING, record=False) is _MISSING
+        assert cache.stats.stale_dropped == 1
+
+    def test_pattern_invalidation_drops_l1_write(self, cache):
+        """패턴 무효화도 같은 방식으로 처리"""
+        cache._get_l2 = _l2_with_invalidation(cache, [1, 2], patterns=["word_hints:*"])
+        asyncio.run(cache._lookup("word_hints:가"))
+        assert cache.l1.get("word_hints:가", _MISSING, record=False) is _MISSING
+
+    def test_loader_result_dropped_after_delete(self, cache):
+        """로더 실행 중 로컬 삭제가 일어나면 로드 결과를 L1에 남기지 않음"""
+        cache._set_l2 = lambda *args: asyncio.sleep(0)
+
+        async def loader():
+            cache._delete_l1("game_stats:room")
+            return {"score": 1}
+
+        assert asyncio.run(cache._load_and_store("game_stats:room", loader, 600, 0)) == {"score": 1}
+        assert cache.l1.get("game_stats:room", _MISSING, record=False) is _MISSING
+
+    def test_quiet_read_is_stored(self, cache):
+        """무효화가 없으면 평소대로 L1에 저장"""
+        async def get_l2(key):
+            return "value"
+        cache._get_l2 = get_l2
+        asyncio.run(cache._lookup("room_meta:1"))
+        assert cache._get_l1("room_meta:1") == "value"
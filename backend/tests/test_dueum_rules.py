@@ -10,9 +10,35 @@ from utils.dueum_rules import (
     get_dueum_display_text, 
     get_dueum_input_help,
     is_dueum_pair,
-    generate_dueum_variants
+    generate_dueum_variants,
+    HANGUL_BASE,
+    HANGUL_COUNT
 )
 
+# 규칙 도출 전 손으로 작성했던 음절 매핑 (변환된 글자 → 원래 글자들), 도출 규칙 비교용
+HANDWRITTEN_MAPPINGS = {
+    '나': ['라'], '낙': ['락'], '난': ['란'], '날': ['랄'], '남': ['람'],
+    '납': ['랍'], '낭': ['랑'], '내': ['래'], '냉': ['랭'], '녹': ['록'],
+    '논': ['론'], '농': ['롱'], '뇌': ['뢰'], '누': ['루'], '능': ['릉'],
+    '님': ['림'], '닙': ['립'], '노': ['로'], '뇽': ['룡'],
+    '약': ['략'], '양': ['량'], '여': ['려', '녀'], '역': ['력', '녁'],
+    '연': ['련', '년'], '열': ['렬'], '염': ['렴', '념'], '엽': ['렵', '녑'],
+    '영': ['령', '녕'], '예': ['례'], '요': ['료', '뇨'], '용': ['룡'],
+    '유': ['류', '뉴'], '육': ['륙', '뉵'], '윤': ['륜'], '율': ['률'],
+    '융': ['륭'], '음': ['름'], '이': ['리', '니'], '인': ['린'],
+    '임': ['림'], '입': ['립'], '일': ['릴'], '익': ['릭'],
+    '아': ['라'], '안': ['란'], '알': ['랄'], '암': ['람'], '압': ['랍'],
+    '앙': ['랑'], '애': ['래'], '액': ['랙'], '앤': ['랜'], '앨': ['랠'],
+    '앰': ['램'], '앱': ['랩'], '앵': ['랭'], '어': ['러'], '억': ['럭'],
+    '언': ['런'], '얼': ['럴'], '엄': ['럼'], '업': ['럽'], '엉': ['렁'],
+    '에': ['레'], '엑': ['렉'], '엔': ['렌'], '엘': ['렐'], '엠': ['렘'],
+    '엡': ['렙'], '엥': ['렝'], '오': ['로'], '옥': ['록'], '온': ['론'],
+    '올': ['롤'], '옴': ['롬'], '옵': ['롭'], '옹': ['롱'], '우': ['루'],
+    '욱': ['룩'], '운': ['룬'], '울': ['룰'], '움': ['룸'], '웁': ['룹'],
+    '웅': ['룽'], '워': ['뤄'], '원': ['뤈'], '월': ['뤌'], '위': ['뤼'],
+    '은': ['른'], '을': ['를'], '읍': ['릅'],
+}
+
 
 class TestDueumRules:
     """두음법칙 기본 기능 테스트"""
@@ -243,6 +269,74 @@ class TestDueumExamples:
         possible = dueum_rules.get_all_possible_starts('가')
         assert possible == {'가'}
 
+    def test_systematic_coverage(self):
+        """자모 분해로 도출한 규칙이 매핑에 없던 글자까지 적용되고 대안 관계는 대칭인지 테스트"""
+        assert '약' in dueum_rules.get_dueum_alternatives('략')
+        assert '뇌' in dueum_rules.get_dueum_alternatives('뢰')
+        assert '여' in dueum_rules.get_dueum_alternatives('녀')
+
+        # 손으로 작성한 매핑에 없던 글자들
+        assert set(dueum_rules.get_dueum_alternatives('윰')) == {'륨', '늄'}
+        assert dueum_rules.get_dueum_alternatives('륨') == ['윰']
+        assert dueum_rules.get_dueum_alternatives('늄') == ['윰']
+        assert set(dueum_rules.get_dueum_alternatives('랖')) == {'낲', '앞'}
+        assert check_dueum_word_validity('윰', '륨')[0]
+
+        # 완성형 한글 전 범위에서 대안 관계는 대칭이고 ㄹ/ㄴ/ㅇ 초성 음절만 대안이 있음
+        for code in range(HANGUL_BASE, HANGUL_BASE + HANGUL_COUNT):
+            char = chr(code)
+            initial = (code - HANGUL_BASE) // (21 * 28)
+            alternatives = dueum_rules.get_dueum_alternatives(char)
+            if initial in (2, 5, 11):  # ㄴ, ㄹ, ㅇ
+                assert alternatives
+            else:
+                assert alternatives == []
+            for alt in alternatives:
+                assert char in dueum_rules.get_dueum_alternatives(alt)
+
+    def test_no_vowel_initial_swap(self):
+        """ㄴ과 ㅇ 초성이 매핑 없이 서로 바뀌지 않음"""
+        assert not check_dueum_word_validity('는다', '은')[0]
+        assert not check_dueum_word_validity('너구리', '어')[0]
+        assert '는' not in dueum_rules.get_all_possible_starts('은')
+
+    def test_non_hangul_input(self):
+        """한글 음절이 아닌 입력 테스트"""
+        assert dueum_rules.get_dueum_alternatives('a') == []
+        assert dueum_rules.get_dueum_alternatives('ㄹ') == []
+        assert dueum_rules.get_all_possible_starts('a') == {'a'}
+        assert dueum_rules.get_display_text('1') == '1'
+
+
+class TestDueumDerivedTables:
+    """자모 분해로 도출한 음절 배열 검증"""
+
+    def test_covers_handwritten_mappings(self):
+        """손으로 작성한 매핑의 쌍은 규칙에 어긋나는 ㄴ+ㅣ계 모음 쌍 외에 모두 대안 관계"""
+        uncovered = {
+            (converted, original)
+            for converted, originals in HANDWRITTEN_MAPPINGS.items()
+            for original in originals
+            if not is_dueum_pair(converted, original)
+        }
+        # 님/닙/뇽은 ㄴ+ㅣ계 모음이라 ㅇ으로 바뀌는 쪽 (림 → 임, 룡 → 용)
+        assert uncovered == {('님', '림'), ('닙', '립'), ('뇽', '룡')}
+
+    def test_validity_matches_one_step_alternatives(self):
+        """완성형 한글 11,172자 전체에서 유효성 검사와 시작 가능 글자가 규칙 한 단계 대안과 동일"""
+        for code in range(HANGUL_BASE, HANGUL_BASE + HANGUL_COUNT):
+            target = chr(code)
+            alternatives = set(get_dueum_alternatives(target))
+            assert dueum_rules.get_all_possible_starts(target) == alternatives | {target}
+
+            # 대안의 대안은 한 단계로 이어지지 않으면 허용하지 않음 (나 ↔ 라 ↔ 아)
+            candidates = set(alternatives)
+            for alt in alternatives:
+                candidates.update(get_dueum_alternatives(alt))
+            candidates.discard(target)
+            for char in candidates:
+                assert check_dueum_word_validity(char, target)[0] == (char in alternatives)
+
 
 class TestDueumIntegration:
     """두음법칙 통합 테스트"""
@@ -0,0 +1,73 @@
+"""
+일관된 해싱 링 테스트 케이스
+"""
+
+import pytest
+from utils.hash_ring import ConsistentHashRing
+
+
+class TestConsistentHashRing:
+    """일관된 해싱 링 기본 기능 테스트"""
+
+    def test_empty_ring(self):
+        """빈 링은 담당 노드가 없음"""
+        ring = ConsistentHashRing()
+        assert ring.get_node("room_1") is None
+        assert len(ring) == 0
+
+    def test_single_node_owns_everything(self):
+        """노드가 하나면 모든 키를 담당"""
+        ring = ConsistentHashRing(["worker-a"])
+        assert all(ring.get_node(f"room_{i}") == "worker-a" for i in range(100))
+
+    def test_assignment_is_deterministic(self):
+        """노드 추가 순서와 무관하게 같은 배정"""
+        ring1 = ConsistentHashRing(["worker-a", "worker-b", "worker-c"])
+        ring2 = ConsistentHashRing(["worker-c", "worker-a", "worker-b"])
+        for i in range(500):
+            assert ring1.get_node(f"room_{i}") == ring2.get_node(f"room_{i}")
+
+    def test_distribution_is_balanced(self):
+        """가상 노드로 키가 고르게 분산"""
+        ring = ConsistentHashRing(["worker-a", "worker-b", "worker-c", "worker-d"])
+        counts = {node: 0 for node in ring.nodes}
+        for i in range(10000):
+            counts[ring.get_node(f"room_{i}")] += 1
+        for count in counts.values():
+            assert 1500 < count < 3500
+
+    def test_minimal_movement_on_join(self):
+        """노드 추가 시 새 노드로 옮겨지는 키만 재배치"""
+        ring = ConsistentHashRing(["worker-a", "worker-b", "worker-c"])
+        before = {f"room_{i}": ring.get_node(f"room_{i}") for i in range(2000)}
+
+        ring.add_node("worker-d")
+        moved = 0
+        for key, owner in before.items():
+            new_owner = ring.get_node(key)
+            if new_owner != owner:
+                assert new_owner == "worker-d"
+                moved += 1
+        assert moved < 1000
+
+    def test_remove_node_reassigns_only_its_keys(self):
+        """노드 제거 시 해당 노드의 키만 재배치"""
+        ring = ConsistentHashRing(["worker-a", "worker-b", "worker-c"])
+        before = {f"room_{i}": ring.get_node(f"room_{i}") for i in range(2000)}
+
+        ring.remove_node("worker-b")
+        assert "worker-b" not in ring
+        for key, owner in before.items():
+            if owner != "worker-b":
+                assert ring.get_node(key) == owner
+
+    def test_set_nodes_reports_change(self):
+        """노드 집합 교체 시 변경 여부 반환"""
+        ring = ConsistentHashRing(["worker-a"])
+        assert ring.set_nodes(["worker-a"]) is False
+        assert ring.set_nodes(["worker-a", "worker-b"]) is True
+        assert ring.nodes == ["worker-a", "worker-b"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,57 @@
+"""
+아이템 지속 효과 등록 테스트 케이스
+"""
+
+import json
+import asyncio
+
+import pytest
+from services.item_service import ItemService, ItemEffect, ItemEffectType
+
+
+class RecordingEffectScript:
+    """효과 등록 Lua 스크립트 대신 레코드를 모으는 가짜 스크립트"""
+
+    def __init__(self):
+        self.records = []
+
+    def __call__(self, keys, args):
+        self.records.append(json.loads(args[1]))
+
+
+@pytest.fixture
+def service():
+    """Redis 호출 없이 효과 등록만 기록하는 아이템 서비스"""
+    item_service = ItemService()
+    item_service._add_effect_script = RecordingEffectScript()
+    return item_service
+
+
+class TestItemEffectRecords:
+    """아이템 한 번 사용 시 효과 레코드 수 테스트"""
+
+    def test_shield_records_once(self, service):
+        """보호막은 사용자에게 레코드 하나"""
+        effect = ItemEffect(ItemEffectType.SHIELD, {"duration": 30}, duration=30)
+        result = asyncio.run(service._execute_item_effect("room", 1, effect))
+
+        assert result.success
+        records = service._add_effect_script.records
+        assert [record["user_id"] for record in records] == [1]
+
+    def test_freeze_records_only_target(self, service):
+        """동결은 대상에게만 레코드 하나 (사용자 본인에게는 없음)"""
+        effect = ItemEffect(ItemEffectType.FREEZE, {"duration": 10}, duration=10, target_type="opponent")
+        result = asyncio.run(service._execute_item_effect("room", 1, effect, target_user_id=2))
+
+        assert result.success
+        records = service._add_effect_script.records
+        assert [record["user_id"] for record in records] == [2]
+
+    def test_score_multiply_with_duration_records_once(self, service):
+        """지속 시간이 있는 점수 배수도 레코드 하나 (배수가 스스로 중첩되지 않음)"""
+        effect = ItemEffect(ItemEffectType.SCORE_MULTIPLY, {"multiplier": 2.0, "duration": 20}, duration=20)
+        result = asyncio.run(service._execute_item_effect("room", 1, effect))
+
+        assert result.success
+        assert len(service._add_effect_script.records) == 1
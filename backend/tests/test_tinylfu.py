@@ -0,0 +1,193 @@
+"""
+W-TinyLFU 캐시 테스트 케이스
+"""
+
+import pytest
+from utils.tinylfu import TinyLFUCache, FrequencySketch
+
+
+class FakeClock:
+    """테스트용 시계"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestFrequencySketch:
+    """빈도 스케치 테스트"""
+
+    def test_counts_accesses(self):
+        """접근 횟수 추정"""
+        sketch = FrequencySketch(100)
+        for _ in range(5):
+            sketch.increment("사과")
+        assert sketch.frequency("사과") >= 5
+        assert sketch.frequency("바나나") <= 1
+
+    def test_counter_saturates(self):
+        """카운터는 15에서 포화"""
+        sketch = FrequencySketch(1000)
+        for _ in range(100):
+            sketch.increment("사과")
+        assert sketch.frequency("사과") == 15
+
+    def test_aging_halves_counters(self):
+        """표본 크기 도달 시 카운터 절반 감소"""
+        sketch = FrequencySketch(16)
+        for _ in range(10):
+            sketch.increment("사과")
+        # 다음 기록에서 표본 크기에 도달하도록 맞춤 (해시 충돌과 무관하게 검증)
+        sketch._additions = sketch._sample_size - 1
+        sketch.increment("바나나")
+        assert sketch.frequency("사과") == 5
+
+
+class TestTinyLFUCache:
+    """W-TinyLFU 캐시 기본 기능 테스트"""
+
+    def test_get_set_delete(self):
+        """기본 조회/저장/삭제"""
+        cache = TinyLFUCache(max_size=10)
+        cache.set("사과", 1)
+        assert cache.get("사과") == 1
+        assert "사과" in cache
+        assert cache.delete("사과") is True
+        assert cache.get("사과") is None
+        assert cache.delete("사과") is False
+
+    def test_none_value_distinguished_from_miss(self):
+        """None 값도 캐시 적중으로 구분"""
+        cache = TinyLFUCache(max_size=10)
+        missing = object()
+        cache.set("사과", None)
+        assert cache.get("사과", missing) is None
+        assert cache.get("바나나", missing) is missing
+
+    def test_lazy_ttl_expiry(self):
+        """TTL은 조회 시점에 만료"""
+        clock = FakeClock()
+        cache = TinyLFUCache(max_size=10, clock=clock)
+        cache.set("사과", 1, ttl=5)
+        clock.now = 4.9
+        assert cache.get("사과") == 1
+        clock.now = 5.0
+        assert cache.get("사과") is None
+        assert len(cache) == 0
+        assert cache.expirations == 1
+
+    def test_size_is_bounded(self):
+        """최대 크기 유지"""
+        cache = TinyLFUCache(max_size=100)
+        for i in range(1000):
+            cache.set(f"단어{i}", i)
+        assert len(cache) <= 100
+        assert cache.evictions == 900
+
+    def test_frequent_keys_survive_scan(self):
+        """자주 쓰는 키는 일회성 스캔에 밀려나지 않음"""
+        cache = TinyLFUCache(max_size=100)
+        hot_keys = [f"인기{i}" for i in range(50)]
+        for _ in range(5):
+            for key in hot_keys:
+                if cache.get(key) is None:
+                    cache.set(key, key)
+
+        for i in range(2000):
+            cache.set(f"스캔{i}", i)
+
+        survivors = sum(1 for key in hot_keys if key in cache)
+        assert survivors >= 45
+
+    def test_update_existing_key(self):
+        """기존 키 갱신 시 크기 변화 없음"""
+        cache = TinyLFUCache(max_size=10)
+        cache.set("사과", 1)
+        cache.set("사과", 2)
+        assert cache.get("사과") == 2
+        assert len(cache) == 1
+
+    def test_single_slot_cache(self):
+        """크기 1 캐시"""
+        cache = TinyLFUCache(max_size=1)
+        cache.set("사과", 1)
+        cache.set("바나나", 2)
+        assert len(cache) == 1
+
+    def test_hottest_keys_prefers_protected(self):
+        """자주 쓰인 키가 인기 키 목록 앞쪽에 위치"""
+        cache = TinyLFUCache(max_size=100)
+        for i in range(20):
+            cache.set(f"단어{i}", i)
+        for _ in range(3):
+            cache.get("단어5")
+        keys = cache.hottest_keys(5)
+        assert keys[0] == "단어5"
+        assert len(keys) == 5
+
+    def test_clear(self):
+        """전체 삭제"""
+        cache = TinyLFUCache(max_size=10)
+        for i in range(5):
+            cache.set(f"단어{i}", i)
+        cache.clear()
+        assert len(cache) == 0
+        assert sum(cache.segment_sizes().values()) == 0
+
+
+class TestWeightedCache:
+    """크기(가중치) 제한 및 그룹 집계 테스트"""
+
+    def test_weight_budget_is_enforced(self):
+        """총 크기 제한 유지"""
+        cache = TinyLFUCache(max_size=1000, max_weight=1000)
+        for i in range(100):
+            cache.set(f"단어{i}", i, weight=100)
+        assert cache.weight <= 1000
+        assert len(cache) == 10
+        assert cache.evictions == 90
+
+    def test_oversized_entry_rejected(self):
+        """총량보다 큰 항목은 저장하지 않음"""
+        cache = TinyLFUCache(max_size=10, max_weight=100)
+        cache.set("사과", 1, weight=50)
+        assert cache.set("사과", 2, weight=500) == 1
+        assert "사과" not in cache
+        assert cache.weight == 0
+
+    def test_update_adjusts_weight(self):
+        """기존 키 갱신 시 크기 재계산"""
+        cache = TinyLFUCache(max_size=10)
+        cache.set("사과", 1, weight=10)
+        cache.set("사과", 2, weight=30)
+        assert cache.weight == 30
+        cache.delete("사과")
+        assert cache.weight == 0
+
+    def test_group_stats(self):
+        """그룹별 항목 수/크기 집계"""
+        cache = TinyLFUCache(max_size=100, group_of=lambda key: key.split(":", 1)[0])
+        cache.set("word:사과", 1, weight=10)
+        cache.set("word:바나나", 2, weight=20)
+        cache.set("inv:1", 3, weight=5)
+        assert cache.group_stats() == {
+            "word": {"entries": 2, "weight": 30},
+            "inv": {"entries": 1, "weight": 5}
+        }
+        cache.delete("inv:1")
+        assert "inv" not in cache.group_stats()
+
+    def test_group_stats_follow_evictions(self):
+        """퇴출된 항목은 집계에서 제외"""
+        cache = TinyLFUCache(max_size=50, max_weight=500, group_of=lambda key: key.split(":", 1)[0])
+        for i in range(200):
+            cache.set(f"word:{i}", i, weight=10)
+        stats = cache.group_stats()["word"]
+        assert stats["entries"] == len(cache)
+        assert stats["weight"] == cache.weight
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,87 @@
+"""
+아호-코라식 다중 문자열 검색
+금지어 목록 전체를 하나의 오토마톤으로 컴파일해 단어를 한 번만 훑어 검사
+(금지어 수와 무관하게 단어 길이에 비례하는 비용)
+"""
+
+from collections import deque
+from typing import Dict, Iterable, List, Optional
+
+
+class AhoCorasick:
+    """아호-코라식 오토마톤 (생성 후 변경 없음, 목록이 바뀌면 새로 만들어 교체)"""
+
+    def __init__(self, patterns: Iterable[str] = ()):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._length: List[int] = [0]  # 이 상태에서 끝나는 패턴 길이 (없으면 0)
+        self._report: List[int] = [0]  # 실패 링크를 따라 처음 만나는 패턴 끝 상태 (없으면 0)
+        self.count = 0
+
+        for pattern in patterns:
+            if pattern:
+                self._insert(pattern)
+        self._build()
+
+    def _insert(self, pattern: str):
+        """트라이에 패턴 추가"""
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._length.append(0)
+                self._report.append(0)
+            state = next_state
+        if not self._length[state]:
+            self._length[state] = len(pattern)
+            self.count += 1
+
+    def _build(self):
+        """너비 우선으로 실패 링크와 출력 링크 계산"""
+        goto, fail, length, report = self._goto, self._fail, self._length, self._report
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in goto[state].items():
+                queue.append(next_state)
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                target = goto[fallback].get(char, 0)
+                fail[next_state] = target
+                report[next_state] = target if length[target] else report[target]
+
+    def find(self, text: str) -> Optional[str]:
+        """텍스트에 포함된 패턴 중 가장 먼저 끝나는 것 (없으면 None)"""
+        goto, fail, length, report = self._goto, self._fail, self._length, self._report
+        state = 0
+        for position, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            matched = state if length[state] else report[state]
+            if matched:
+                return text[position - length[matched] + 1:position + 1]
+        return None
+
+    def find_all(self, text: str) -> List[str]:
+        """텍스트에 포함된 모든 패턴 (끝나는 위치 순, 중복 포함)"""
+        goto, fail, length, report = self._goto, self._fail, self._length, self._report
+        matches = []
+        state = 0
+        for position, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            matched = state if length[state] else report[state]
+            while matched:
+                matches.append(text[position - length[matched] + 1:position + 1])
+                matched = report[matched]
+        return matches
+
+    def __len__(self) -> int:
+        return self.count
@@ -0,0 +1,60 @@
+"""
+별칭 테이블 가중 랜덤 선택 (Walker/Vose alias method)
+가중치 목록을 O(n)에 한 번 전처리해 두고, 선택은 난수 두 개로 O(1)
+"""
+
+import random
+from typing import Generic, List, Sequence, TypeVar
+
+T = TypeVar("T")
+
+
+class AliasTable(Generic[T]):
+    """가중치 비례 선택 테이블 (생성 후 변경 없음, 가중치가 바뀌면 새로 만들어 교체)"""
+
+    __slots__ = ("_items", "_probability", "_alias")
+
+    def __init__(self, items: Sequence[T], weights: Sequence[float]):
+        if len(items) != len(weights):
+            raise ValueError("items와 weights의 길이가 다릅니다")
+
+        # 가중치가 0 이하인 항목은 선택되지 않음
+        pairs = [(item, float(weight)) for item, weight in zip(items, weights) if weight > 0]
+        self._items: List[T] = [item for item, _ in pairs]
+        count = len(pairs)
+        self._probability: List[float] = [1.0] * count
+        self._alias: List[int] = list(range(count))
+        if not count:
+            return
+
+        total = sum(weight for _, weight in pairs)
+        scaled = [weight * count / total for _, weight in pairs]
+        small = [i for i, value in enumerate(scaled) if value < 1.0]
+        large = [i for i, value in enumerate(scaled) if value >= 1.0]
+
+        while small and large:
+            less = small.pop()
+            more = large.pop()
+            self._probability[less] = scaled[less]
+            self._alias[less] = more
+            scaled[more] = scaled[more] + scaled[less] - 1.0
+            (small if scaled[more] < 1.0 else large).append(more)
+
+        # 남은 칸은 부동소수점 오차만 있으므로 확률 1로 고정
+        for i in small + large:
+            self._probability[i] = 1.0
+
+    def sample(self, rng: random.Random = random) -> T:
+        """가중치에 비례해 항목 하나 선택 (항목이 없으면 IndexError)"""
+        if not self._items:
+            raise IndexError("선택할 항목이 없습니다")
+        column = int(rng.random() * len(self._items))
+        if rng.random() < self._probability[column]:
+            return self._items[column]
+        return self._items[self._alias[column]]
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __bool__(self) -> bool:
+        return bool(self._items)
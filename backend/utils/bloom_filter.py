@@ -0,0 +1,109 @@
+"""
+블룸 필터
+사전에 없는 단어를 I/O 없이 판별하기 위한 확률적 집합 (거짓 음성 없음),
+프로세스 간 동일한 해시, 파일 저장/로드
+"""
+
+import os
+import json
+import math
+import struct
+import hashlib
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+_MAGIC = b"KKBF"
+_FORMAT_VERSION = 1
+_HEADER = struct.Struct(">4sBQBQI")  # magic, version, 비트 수, 해시 수, 항목 수, 메타 길이
+
+
+class BloomFilter:
+    """블룸 필터"""
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        capacity = max(1, capacity)
+        self.num_bits = max(64, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+        self.meta: Dict[str, Any] = {}
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        num_bits = self.num_bits
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % num_bits
+
+    def add(self, item: str):
+        """항목 추가"""
+        bits = self.bits
+        for position in self._positions(item):
+            bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def update(self, items: Iterable[str]):
+        """여러 항목 추가"""
+        for item in items:
+            self.add(item)
+
+    def __contains__(self, item: str) -> bool:
+        bits = self.bits
+        for position in self._positions(item):
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def size_bytes(self) -> int:
+        """비트 배열 크기"""
+        return len(self.bits)
+
+    # === 직렬화 ===
+
+    def to_bytes(self) -> bytes:
+        """바이트 직렬화 (메타데이터 포함)"""
+        meta = json.dumps(self.meta, ensure_ascii=False).encode("utf-8")
+        header = _HEADER.pack(_MAGIC, _FORMAT_VERSION, self.num_bits, self.num_hashes, self.count, len(meta))
+        return header + meta + bytes(self.bits)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "BloomFilter":
+        """바이트에서 복원"""
+        magic, version, num_bits, num_hashes, count, meta_length = _HEADER.unpack_from(data)
+        if magic != _MAGIC or version != _FORMAT_VERSION:
+            raise ValueError("지원하지 않는 블룸 필터 형식입니다")
+
+        offset = _HEADER.size
+        instance = cls.__new__(cls)
+        instance.num_bits = num_bits
+        instance.num_hashes = num_hashes
+        instance.count = count
+        instance.meta = json.loads(data[offset:offset + meta_length].decode("utf-8"))
+        instance.bits = bytearray(data[offset + meta_length:])
+        if len(instance.bits) != (num_bits + 7) // 8:
+            raise ValueError("블룸 필터 데이터 크기가 맞지 않습니다")
+        return instance
+
+    def save(self, path: str):
+        """파일 저장 (임시 파일 후 교체)"""
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        temp = target.with_suffix(f"{target.suffix}.{os.getpid()}.tmp")  # 여러 프로세스 동시 저장 대비
+        try:
+            temp.write_bytes(self.to_bytes())
+            temp.replace(target)
+        finally:
+            temp.unlink(missing_ok=True)
+
+    @classmethod
+    def load(cls, path: str) -> Optional["BloomFilter"]:
+        """파일 로드 (없으면 None)"""
+        target = Path(path)
+        if not target.exists():
+            return None
+        return cls.from_bytes(target.read_bytes())
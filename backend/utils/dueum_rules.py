@@ -5,53 +5,71 @@ This module handles Korean initial sound change rules where certain consonants
 at the beginning of words are replaced with other consonants in modern Korean.
 
 Key Rules:
-1. ㄹ → ㄴ: 라면 → 나면 (but 나면 is not used, 라면 stays)
-2. ㄹ → ㅇ: 료리 → 요리 (cooking)  
+1. ㄹ → ㄴ: 락원 → 낙원 (before vowels other than ㅣ/ㅑ/ㅒ/ㅕ/ㅖ/ㅛ/ㅠ)
+2. ㄹ → ㅇ: 료리 → 요리 (cooking)
 3. ㄴ → ㅇ: 뇨리 → 요리 (same word)
-4. Initial ㄹ/ㄴ can become silent (ㅇ) in compound words
+4. Initial ㄹ can become silent (ㅇ) in compound words: 름 → 음
+
+The rules are applied to the jamo decomposition of every Hangul syllable
+(U+AC00..U+D7A3) once at import, and the results are kept in dense tables
+indexed by ``ord(char) - 0xAC00`` so lookups are a single list access.
+Only one rule step links two syllables: 나 ↔ 라 ↔ 아 does not make 나 and 아
+alternatives of each other.
 """
 
-from typing import Dict, List, Set, Tuple, Optional
+from typing import Dict, List, FrozenSet, Tuple
+
+# 완성형 한글 음절 범위 (초성 19 × 중성 21 × 종성 28)
+HANGUL_BASE = 0xAC00
+HANGUL_COUNT = 11172
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+JONGSEONG_COUNT = 28
+
+# ㅣ 및 ㅣ로 시작하는 이중모음 (초성 ㄹ/ㄴ이 ㅇ으로 바뀜)
+Y_VOWELS = frozenset("ㅑㅒㅕㅖㅛㅠㅣ")
+
+# 대안이 없는 글자들이 공유하는 빈 목록 (수정 금지)
+_NO_ALTERNATIVES: List[str] = []
+
+
+def _syllable_index(char: str) -> int:
+    """완성형 한글 음절 인덱스 (한글 한 글자가 아니면 -1)"""
+    if len(char) != 1:
+        return -1
+    index = ord(char) - HANGUL_BASE
+    return index if 0 <= index < HANGUL_COUNT else -1
+
+
+def _decompose(index: int) -> Tuple[str, str]:
+    """음절 인덱스 → (초성, 모음 분류) ('y': ㅣ/ㅣ계 이중모음, 'other': 그 밖의 모음)"""
+    initial = CHOSEONG[index // (len(JUNGSEONG) * JONGSEONG_COUNT)]
+    jungseong = JUNGSEONG[(index // JONGSEONG_COUNT) % len(JUNGSEONG)]
+    return initial, "y" if jungseong in Y_VOWELS else "other"
+
+
+def _replace_initial(index: int, initial: str) -> str:
+    """음절의 초성만 바꾼 글자 (중성/종성 유지)"""
+    medial_final = index % (len(JUNGSEONG) * JONGSEONG_COUNT)
+    return chr(HANGUL_BASE + CHOSEONG.index(initial) * len(JUNGSEONG) * JONGSEONG_COUNT + medial_final)
 
 
 class DueumRules:
     def __init__(self):
-        # 두음법칙 매핑: 변환된 글자 → 원래 글자들
-        self.dueum_mappings = {
-            # ㄴ으로 시작 (원래 ㄹ)
-            '나': ['라'], '낙': ['락'], '난': ['란'], '날': ['랄'], '남': ['람'],
-            '납': ['랍'], '낭': ['랑'], '내': ['래'], '냉': ['랭'], '녹': ['록'],
-            '논': ['론'], '농': ['롱'], '뇌': ['뢰'], '누': ['루'], '능': ['릉'],
-            '님': ['림'], '닙': ['립'], '노': ['로'], '뇽': ['룡'],
-            
-            # ㅇ으로 시작 (원래 ㄹ/ㄴ)
-            '약': ['략'], '양': ['량'], '여': ['려', '녀'], '역': ['력', '녁'], 
-            '연': ['련', '년'], '열': ['렬'], '염': ['렴', '념'], '엽': ['렵', '녑'], 
-            '영': ['령', '녕'], '예': ['례'], '요': ['료', '뇨'], '용': ['룡'], 
-            '유': ['류', '뉴'], '육': ['륙', '뉵'], '윤': ['륜'], '율': ['률'], 
-            '융': ['륭'], '음': ['름'], '이': ['리', '니'], '인': ['린'], 
-            '임': ['림'], '입': ['립'], '일': ['릴'], '익': ['릭'],
-            
-            # 추가 두음법칙 패턴
-            '아': ['라'], '안': ['란'], '알': ['랄'], '암': ['람'], '압': ['랍'],
-            '앙': ['랑'], '애': ['래'], '액': ['랙'], '앤': ['랜'], '앨': ['랠'],
-            '앰': ['램'], '앱': ['랩'], '앵': ['랭'], '어': ['러'], '억': ['럭'],
-            '언': ['런'], '얼': ['럴'], '엄': ['럼'], '업': ['럽'], '엉': ['렁'],
-            '에': ['레'], '엑': ['렉'], '엔': ['렌'], '엘': ['렐'], '엠': ['렘'],
-            '엡': ['렙'], '엥': ['렝'], '오': ['로'], '옥': ['록'], '온': ['론'],
-            '올': ['롤'], '옴': ['롬'], '옵': ['롭'], '옹': ['롱'], '우': ['루'],
-            '욱': ['룩'], '운': ['룬'], '울': ['룰'], '움': ['룸'], '웁': ['룹'],
-            '웅': ['룽'], '워': ['뤄'], '원': ['뤈'], '월': ['뤌'], '위': ['뤼'],
-            '은': ['른'], '을': ['를'], '읍': ['릅'],
+        # 두음법칙 초성 규칙: (변환된 초성, 모음 분류) → 원래 초성들
+        self.dueum_mappings: Dict[Tuple[str, str], List[str]] = {
+            ('ㄴ', 'other'): ['ㄹ'],       # 락원 → 낙원, 로인 → 노인
+            ('ㅇ', 'y'): ['ㄹ', 'ㄴ'],     # 료리/뇨리 → 요리, 력사/녁사 → 역사
+            ('ㅇ', 'other'): ['ㄹ'],       # 름 → 음 (합성어 등에서 ㄹ 탈락)
         }
         
-        # 역방향 매핑: 원래 글자 → 변환된 글자
-        self.reverse_mappings = {}
-        for converted, originals in self.dueum_mappings.items():
+        # 역방향 매핑: (원래 초성, 모음 분류) → 변환된 초성들
+        self.reverse_mappings: Dict[Tuple[str, str], List[str]] = {}
+        for (converted, vowel_class), originals in self.dueum_mappings.items():
             for original in originals:
-                if original not in self.reverse_mappings:
-                    self.reverse_mappings[original] = []
-                self.reverse_mappings[original].append(converted)
+                if (original, vowel_class) not in self.reverse_mappings:
+                    self.reverse_mappings[(original, vowel_class)] = []
+                self.reverse_mappings[(original, vowel_class)].append(converted)
         
         # 두음법칙이 적용되는 초성들
         self.dueum_initials = {'ㄹ', 'ㄴ'}
@@ -75,6 +93,27 @@ class DueumRules:
             '누나': ['루나'],
             '능력': ['릉력'],
         }
+        
+        self._compile_tables()
+
+    def _compile_tables(self):
+        """전체 한글 음절의 대안/시작 가능 글자/표시 텍스트를 음절 인덱스 순 배열로 생성"""
+        alternatives: List[List[str]] = [_NO_ALTERNATIVES] * HANGUL_COUNT
+        possible_starts: List[FrozenSet[str]] = []
+        display_texts: List[str] = []
+        for index in range(HANGUL_COUNT):
+            char = chr(HANGUL_BASE + index)
+            rule_key = _decompose(index)
+            # 변환된 글자 → 원래 글자들, 원래 글자 → 변환된 글자들 순 (규칙 한 단계만)
+            initials = self.dueum_mappings.get(rule_key, []) + self.reverse_mappings.get(rule_key, [])
+            if initials:
+                alternatives[index] = [_replace_initial(index, other) for other in initials]
+            possible_starts.append(frozenset([char, *alternatives[index]]))
+            display_texts.append(f"{char}({alternatives[index][0]})" if initials else char)
+        
+        self._alternatives = alternatives
+        self._possible_starts = possible_starts
+        self._display_texts = display_texts
 
     def get_dueum_alternatives(self, char: str) -> List[str]:
         """
@@ -84,19 +123,12 @@ class DueumRules:
             char: 검사할 한글 글자
             
         Returns:
-            두음법칙 대안 글자들의 리스트
+            두음법칙 대안 글자들의 리스트 (공유 목록이므로 수정하지 말 것)
         """
-        alternatives = []
-        
-        # 변환된 글자 → 원래 글자들
-        if char in self.dueum_mappings:
-            alternatives.extend(self.dueum_mappings[char])
-            
-        # 원래 글자 → 변환된 글자들  
-        if char in self.reverse_mappings:
-            alternatives.extend(self.reverse_mappings[char])
-            
-        return list(set(alternatives))
+        index = _syllable_index(char)
+        if index < 0:
+            return _NO_ALTERNATIVES
+        return self._alternatives[index]
     
     def is_dueum_applicable(self, word: str) -> bool:
         """
@@ -111,8 +143,7 @@ class DueumRules:
         if not word or len(word) < 1:
             return False
             
-        first_char = word[0]
-        return first_char in self.dueum_mappings or first_char in self.reverse_mappings
+        return bool(self.get_dueum_alternatives(word[0]))
     
     def generate_dueum_variants(self, word: str) -> List[str]:
         """
@@ -158,24 +189,11 @@ class DueumRules:
         if first_char == target_char:
             return True, [target_char]
             
-        # 두음법칙 검사
-        target_alternatives = self.get_dueum_alternatives(target_char)
-        input_alternatives = self.get_dueum_alternatives(first_char)
-        
-        # 목표 글자의 대안 중에 입력 글자가 있는지
-        if first_char in target_alternatives:
-            return True, [target_char, first_char]
-            
-        # 입력 글자의 대안 중에 목표 글자가 있는지
-        if target_char in input_alternatives:
-            return True, [target_char, first_char]
-            
-        # 서로의 대안들이 겹치는지
-        common_alternatives = set(target_alternatives) & set(input_alternatives)
-        if common_alternatives:
-            return True, [target_char, first_char] + list(common_alternatives)
-            
-        return False, []
+        # 목표 글자와 입력 글자가 서로의 대안인지
+        index = _syllable_index(target_char)
+        if index < 0 or first_char not in self._possible_starts[index]:
+            return False, []
+        return True, [target_char, first_char]
     
     def get_display_text(self, char: str) -> str:
         """
@@ -187,11 +205,10 @@ class DueumRules:
         Returns:
             두음법칙 정보가 포함된 표시 텍스트
         """
-        alternatives = self.get_dueum_alternatives(char)
-        if alternatives:
-            main_alt = alternatives[0]  # 주요 대안
-            return f"{char}({main_alt})"
-        return char
+        index = _syllable_index(char)
+        if index < 0:
+            return char
+        return self._display_texts[index]
     
     def get_input_help_text(self, char: str) -> str:
         """
@@ -223,10 +240,7 @@ class DueumRules:
         if char1 == char2:
             return True
             
-        alternatives1 = self.get_dueum_alternatives(char1)
-        alternatives2 = self.get_dueum_alternatives(char2)
-        
-        return char2 in alternatives1 or char1 in alternatives2
+        return char2 in self.get_dueum_alternatives(char1)
     
     def normalize_for_comparison(self, word: str) -> List[str]:
         """
@@ -247,20 +261,20 @@ class DueumRules:
         
         return list(set(normalized))
     
-    def get_all_possible_starts(self, char: str) -> Set[str]:
+    def get_all_possible_starts(self, char: str) -> FrozenSet[str]:
         """
-        특정 글자로 시작할 수 있는 모든 두음법칙 글자들 반환
+        특정 글자로 시작할 수 있는 모든 두음법칙 글자들 반환 (check_dueum_word_validity가 허용하는 글자와 동일)
         
         Args:
             char: 기준 글자
             
         Returns:
-            가능한 시작 글자들의 집합
+            가능한 시작 글자들의 집합 (공유 집합)
         """
-        possible_starts = {char}
-        alternatives = self.get_dueum_alternatives(char)
-        possible_starts.update(alternatives)
-        return possible_starts
+        index = _syllable_index(char)
+        if index < 0:
+            return frozenset((char,))
+        return self._possible_starts[index]
 
 
 # 전역 인스턴스
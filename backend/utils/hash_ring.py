@@ -0,0 +1,75 @@
+"""
+일관된 해싱 링
+가상 노드 기반 키 분산, 노드 추가/제거 시 최소 재배치
+"""
+
+import hashlib
+from bisect import bisect, insort
+from typing import Dict, Iterable, List, Optional
+
+
+def _hash_key(key: str) -> int:
+    """프로세스 간 동일한 64비트 해시 (내장 hash()는 프로세스마다 다름)"""
+    return int.from_bytes(hashlib.md5(key.encode("utf-8")).digest()[:8], "big")
+
+
+class ConsistentHashRing:
+    """가상 노드를 사용하는 일관된 해싱 링"""
+
+    def __init__(self, nodes: Optional[Iterable[str]] = None, replicas: int = 100):
+        self.replicas = replicas
+        self._ring: Dict[int, str] = {}
+        self._sorted_hashes: List[int] = []
+        self._nodes = set()
+        for node in nodes or []:
+            self.add_node(node)
+
+    @property
+    def nodes(self) -> List[str]:
+        """링에 포함된 노드 목록"""
+        return sorted(self._nodes)
+
+    def add_node(self, node: str):
+        """노드 추가"""
+        if node in self._nodes:
+            return
+        self._nodes.add(node)
+        for i in range(self.replicas):
+            point = _hash_key(f"{node}#{i}")
+            self._ring[point] = node
+            insort(self._sorted_hashes, point)
+
+    def remove_node(self, node: str):
+        """노드 제거"""
+        if node not in self._nodes:
+            return
+        self._nodes.discard(node)
+        for i in range(self.replicas):
+            point = _hash_key(f"{node}#{i}")
+            if self._ring.get(point) == node:
+                del self._ring[point]
+        self._sorted_hashes = sorted(self._ring)
+
+    def set_nodes(self, nodes: Iterable[str]) -> bool:
+        """노드 집합 교체 (변경 여부 반환)"""
+        new_nodes = set(nodes)
+        if new_nodes == self._nodes:
+            return False
+        for node in self._nodes - new_nodes:
+            self.remove_node(node)
+        for node in new_nodes - self._nodes:
+            self.add_node(node)
+        return True
+
+    def get_node(self, key: str) -> Optional[str]:
+        """키를 담당하는 노드 조회"""
+        if not self._sorted_hashes:
+            return None
+        index = bisect(self._sorted_hashes, _hash_key(key)) % len(self._sorted_hashes)
+        return self._ring[self._sorted_hashes[index]]
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self, node: str) -> bool:
+        return node in self._nodes
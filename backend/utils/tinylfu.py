@@ -0,0 +1,288 @@
+"""
+W-TinyLFU 메모리 캐시
+윈도우 LRU + 세그먼트 LRU(probation/protected), TinyLFU 빈도 기반 입장 제어,
+항목당 슬롯 객체 하나, O(1) 조회/저장/퇴출, 조회 시점 TTL 만료,
+항목별 크기(가중치)와 총량 제한, 그룹별 항목 수/크기 집계
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+# 카운터 절반 감소용 변환 테이블 (bytearray.translate로 C 속도 처리)
+_HALVE_TABLE = bytes(i >> 1 for i in range(256))
+_MISSING = object()
+
+
+class FrequencySketch:
+    """4개 행 Count-Min 스케치 (카운터 최대 15, 주기적 절반 감소로 최신성 유지)"""
+
+    __slots__ = ("_table", "_mask", "_sample_size", "_additions")
+
+    def __init__(self, capacity: int):
+        width = 1
+        while width < max(capacity, 16):
+            width <<= 1
+        self._table = bytearray(width * 4)
+        self._mask = width - 1
+        self._sample_size = max(capacity, 16) * 10
+        self._additions = 0
+
+    def _indexes(self, key: Any) -> Tuple[int, int, int, int]:
+        h = hash(key)
+        mask = self._mask
+        width = mask + 1
+        return (
+            h & mask,
+            width + ((h >> 16 ^ h * 0x9E3779B1) & mask),
+            2 * width + ((h >> 32 ^ h * 0x85EBCA77) & mask),
+            3 * width + ((h >> 48 ^ h * 0xC2B2AE3D) & mask),
+        )
+
+    def increment(self, key: Any):
+        """접근 빈도 기록"""
+        table = self._table
+        added = False
+        for index in self._indexes(key):
+            if table[index] < 15:
+                table[index] += 1
+                added = True
+        if added:
+            self._additions += 1
+            if self._additions >= self._sample_size:
+                self._table = self._table.translate(_HALVE_TABLE)
+                self._additions //= 2
+
+    def frequency(self, key: Any) -> int:
+        """추정 접근 빈도"""
+        table = self._table
+        return min(table[index] for index in self._indexes(key))
+
+
+class CacheEntry:
+    """캐시 항목 (키당 슬롯 객체 하나)"""
+
+    __slots__ = ("key", "value", "expires_at", "segment", "weight", "group")
+
+    def __init__(self, key: str, value: Any, expires_at: Optional[float], segment: int,
+                 weight: int = 0, group: Optional[str] = None):
+        self.key = key
+        self.value = value
+        self.expires_at = expires_at
+        self.segment = segment
+        self.weight = weight
+        self.group = group
+
+
+class TinyLFUCache:
+    """W-TinyLFU 캐시"""
+
+    WINDOW = 0
+    PROBATION = 1
+    PROTECTED = 2
+
+    def __init__(self, max_size: int = 1000, window_ratio: float = 0.01, protected_ratio: float = 0.8,
+                 clock=time.monotonic, max_weight: Optional[int] = None,
+                 group_of: Optional[Callable[[str], str]] = None):
+        self.max_size = max(1, max_size)
+        self.window_capacity = max(1, int(self.max_size * window_ratio))
+        self.main_capacity = self.max_size - self.window_capacity
+        self.protected_capacity = int(self.main_capacity * protected_ratio)
+        self.clock = clock
+
+        self._data = {}
+        self._window: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._probation: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._protected: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._segments = (self._window, self._probation, self._protected)
+        self.sketch = FrequencySketch(self.max_size)
+
+        # 크기(가중치) 총량 제한 및 그룹별 [항목 수, 크기] 집계
+        self.max_weight = max_weight
+        self.weight = 0
+        self.group_of = group_of
+        self._groups: Dict[str, List[int]] = {}
+
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key, _MISSING, record=False) is not _MISSING
+
+    def keys(self) -> Iterator[str]:
+        """저장된 키 목록 (만료 여부 미확인)"""
+        return iter(list(self._data))
+
+    def get(self, key: str, default: Any = None, record: bool = True) -> Any:
+        """조회 (만료된 항목은 이 시점에 제거)"""
+        if record:
+            self.sketch.increment(key)
+
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+
+        if entry.expires_at is not None and self.clock() >= entry.expires_at:
+            self._remove(entry)
+            self.expirations += 1
+            return default
+
+        if record:
+            self._on_hit(entry)
+        return entry.value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None, weight: int = 0) -> int:
+        """저장 (weight는 항목 크기, 퇴출된 항목 수 반환)"""
+        if self.max_weight is not None and weight > self.max_weight:
+            # 총량보다 큰 항목은 저장하지 않음 (기존 값도 제거)
+            self.delete(key)
+            self.evictions += 1
+            return 1
+
+        expires_at = self.clock() + ttl if ttl else None
+        entry = self._data.get(key)
+        if entry is not None:
+            self._account(entry, -1)
+            entry.value = value
+            entry.expires_at = expires_at
+            entry.weight = weight
+            self._account(entry, 1)
+            self._on_hit(entry)
+            return self._evict_overweight(entry)
+
+        self.sketch.increment(key)
+        group = self.group_of(key) if self.group_of else None
+        entry = CacheEntry(key, value, expires_at, self.WINDOW, weight, group)
+        self._data[key] = entry
+        self._window[key] = entry
+        self._account(entry, 1)
+
+        evicted = 0
+        if len(self._window) > self.window_capacity:
+            evicted = self._evict_from_window()
+        return evicted + self._evict_overweight(entry)
+
+    def delete(self, key: str) -> bool:
+        """삭제"""
+        entry = self._data.get(key)
+        if entry is None:
+            return False
+        self._remove(entry)
+        return True
+
+    def clear(self):
+        """전체 삭제"""
+        self._data.clear()
+        for segment in self._segments:
+            segment.clear()
+        self.weight = 0
+        self._groups.clear()
+
+    def segment_sizes(self) -> dict:
+        """세그먼트별 항목 수"""
+        return {
+            "window": len(self._window),
+            "probation": len(self._probation),
+            "protected": len(self._protected)
+        }
+
+    def hottest_keys(self, limit: int) -> List[str]:
+        """자주 쓰는 순서의 키 목록 (protected → probation → window, 각각 최근 사용 순)"""
+        keys: List[str] = []
+        for segment in (self._protected, self._probation, self._window):
+            for key in reversed(segment):
+                if len(keys) >= limit:
+                    return keys
+                keys.append(key)
+        return keys
+
+    def group_stats(self) -> Dict[str, Dict[str, int]]:
+        """그룹별 항목 수/크기 (캐시 순회 없이 집계값 반환)"""
+        return {
+            group: {"entries": count, "weight": weight}
+            for group, (count, weight) in self._groups.items()
+        }
+
+    # === 내부 동작 ===
+
+    def _account(self, entry: CacheEntry, sign: int):
+        """총 크기 및 그룹 집계 반영"""
+        self.weight += sign * entry.weight
+        if entry.group is None:
+            return
+        totals = self._groups.get(entry.group)
+        if totals is None:
+            totals = self._groups[entry.group] = [0, 0]
+        totals[0] += sign
+        totals[1] += sign * entry.weight
+        if totals[0] == 0:
+            del self._groups[entry.group]
+
+    def _remove(self, entry: CacheEntry):
+        del self._data[entry.key]
+        del self._segments[entry.segment][entry.key]
+        self._account(entry, -1)
+
+    def _on_hit(self, entry: CacheEntry):
+        """접근 시 세그먼트 내 위치 갱신 및 승격"""
+        if entry.segment == self.PROBATION:
+            del self._probation[entry.key]
+            entry.segment = self.PROTECTED
+            self._protected[entry.key] = entry
+            if len(self._protected) > self.protected_capacity:
+                # protected가 넘치면 가장 오래된 항목을 probation으로 강등
+                _, demoted = self._protected.popitem(last=False)
+                demoted.segment = self.PROBATION
+                self._probation[demoted.key] = demoted
+        else:
+            self._segments[entry.segment].move_to_end(entry.key)
+
+    def _evict_from_window(self) -> int:
+        """윈도우에서 밀려난 후보를 빈도 비교로 메인 영역에 입장시키거나 퇴출"""
+        _, candidate = self._window.popitem(last=False)
+
+        if len(self._probation) + len(self._protected) < self.main_capacity:
+            candidate.segment = self.PROBATION
+            self._probation[candidate.key] = candidate
+            return 0
+
+        victim_segment = self._probation if self._probation else self._protected
+        if not victim_segment:
+            del self._data[candidate.key]
+            self._account(candidate, -1)
+            self.evictions += 1
+            return 1
+
+        victim_key = next(iter(victim_segment))
+        if self.sketch.frequency(candidate.key) > self.sketch.frequency(victim_key):
+            victim = victim_segment.pop(victim_key)
+            del self._data[victim_key]
+            self._account(victim, -1)
+            candidate.segment = self.PROBATION
+            self._probation[candidate.key] = candidate
+        else:
+            del self._data[candidate.key]
+            self._account(candidate, -1)
+        self.evictions += 1
+        return 1
+
+    def _evict_overweight(self, keep: CacheEntry) -> int:
+        """총 크기가 제한을 넘으면 probation → protected → window 순으로 오래된 항목 퇴출"""
+        if self.max_weight is None:
+            return 0
+
+        evicted = 0
+        while self.weight > self.max_weight:
+            for segment in self._segments[1:] + self._segments[:1]:
+                victim = next((entry for entry in segment.values() if entry is not keep), None)
+                if victim is not None:
+                    break
+            else:
+                break
+            self._remove(victim)
+            evicted += 1
+        self.evictions += evicted
+        return evicted
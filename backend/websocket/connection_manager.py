@@ -3,15 +3,18 @@ WebSocket 연결 관리자
 JWT 인증 통합, 사용자 연결 추적, 룸별 그룹화, 자동 정리
 """
 
+import json
 import asyncio
 import logging
-from typing import Dict, Set, Optional, Any, List
+import secrets
+from typing import Dict, Set, Optional, Any, List, Callable, Awaitable
 from fastapi import WebSocket, WebSocketDisconnect
 from collections import defaultdict
 from datetime import datetime, timezone
 from auth import AuthService, extract_token_from_websocket_headers, AuthenticationError
 from redis_models import RedisGameManager
 from database import get_redis
+from websocket.room_pubsub import RoomPubSubBridge
 
 logger = logging.getLogger(__name__)
 
@@ -69,6 +72,17 @@ class WebSocketManager:
         self.room_connections: Dict[str, Set[int]] = defaultdict(set)  # room_id -> user_ids
         self.user_rooms: Dict[int, str] = {}  # user_id -> room_id
         
+        # 워커 간 룸 브로드캐스트 브리지
+        self.pubsub_bridge = RoomPubSubBridge(self._deliver_to_local_room)
+        
+        # 다른 워커에 연결된 사용자에게 보내는 전송 함수 (룸 친화성 라우터가 설정)
+        self.remote_sender: Optional[Callable[[int, Dict[str, Any]], Awaitable[bool]]] = None
+        
+        # 배포 드레인 상태 및 재접속 토큰
+        self.draining = False
+        self.resume_prefix = "resume:"
+        self.resume_ttl = 120  # 2분
+        
         # 정리 작업
         self._cleanup_task = None
         self._start_cleanup_task()
@@ -105,6 +119,11 @@ class WebSocketManager:
     async def connect(self, websocket: WebSocket, headers: Dict[str, str]) -> Optional[WebSocketConnection]:
         """WebSocket 연결 및 인증"""
         try:
+            # 드레인 중인 노드는 새 연결을 받지 않음 (1012: 서비스 재시작)
+            if self.draining:
+                await websocket.close(code=1012, reason="서버 재시작 중입니다. 다시 연결해주세요")
+                return None
+            
             # JWT 토큰 추출 및 검증
             token = extract_token_from_websocket_headers(headers)
             if not token:
@@ -172,8 +191,16 @@ class WebSocketManager:
             if not connection:
                 return
             
+            if self.draining:
+                # 드레인 중에는 다른 노드로 재접속하므로 게임에서 내보내지 않고 로컬 정보만 정리
+                room_id = self.user_rooms.pop(user_id, None)
+                if room_id and user_id in self.room_connections.get(room_id, set()):
+                    self.room_connections[room_id].discard(user_id)
+                    self.pubsub_bridge.release_room(room_id)
+                    if not self.room_connections[room_id]:
+                        del self.room_connections[room_id]
             # 명시적인 "방 나가기" 버튼을 눌렀을 때만 즉시 룸에서 제거
-            if reason in ["명시적 방 나가기", "사용자 요청"]:
+            elif reason in ["명시적 방 나가기", "사용자 요청"]:
                 if user_id in self.user_rooms:
                     room_id = self.user_rooms[user_id]
                     await self._leave_room(user_id, room_id)
@@ -225,7 +252,9 @@ class WebSocketManager:
                 await self._silent_leave_room(user_id, old_room_id)
             
             # 새 룸 참가
-            self.room_connections[room_id].add(user_id)
+            if user_id not in self.room_connections[room_id]:
+                self.room_connections[room_id].add(user_id)
+                self.pubsub_bridge.acquire_room(room_id)
             self.user_rooms[user_id] = room_id
             connection.set_room(room_id)
             
@@ -285,6 +314,7 @@ class WebSocketManager:
             
             if user_id in self.room_connections[room_id]:
                 self.room_connections[room_id].remove(user_id)
+                self.pubsub_bridge.release_room(room_id)
                 
                 # 빈 룸 정리
                 if not self.room_connections[room_id]:
@@ -329,6 +359,7 @@ class WebSocketManager:
             
             if user_id in self.room_connections[room_id]:
                 self.room_connections[room_id].remove(user_id)
+                self.pubsub_bridge.release_room(room_id)
                 
                 # 빈 룸 정리
                 if not self.room_connections[room_id]:
@@ -406,6 +437,8 @@ class WebSocketManager:
         """특정 사용자에게 메시지 전송"""
         connection = self.active_connections.get(user_id)
         if not connection:
+            if self.remote_sender and await self.remote_sender(user_id, message):
+                return True
             logger.warning(f"존재하지 않는 사용자에게 메시지 전송 시도: user_id={user_id}")
             return False
         
@@ -417,9 +450,15 @@ class WebSocketManager:
         return success
     
     async def broadcast_to_room(self, room_id: str, message: Dict[str, Any], exclude_user: Optional[int] = None) -> int:
-        """룸의 모든 사용자에게 브로드캐스트"""
+        """룸의 모든 사용자에게 브로드캐스트 (로컬 전달 후 다른 워커로 발행)"""
+        successful_sends = await self._deliver_to_local_room(room_id, message, exclude_user)
+        await self.pubsub_bridge.publish(room_id, message, exclude_user)
+        return successful_sends
+    
+    async def _deliver_to_local_room(self, room_id: str, message: Dict[str, Any], exclude_user: Optional[int] = None) -> int:
+        """이 워커에 연결된 룸 사용자에게만 전달"""
         if room_id not in self.room_connections:
-            logger.warning(f"존재하지 않는 룸에 브로드캐스트 시도: room_id={room_id}")
+            logger.debug(f"로컬 연결이 없는 룸: room_id={room_id}")
             return 0
         
         user_ids = list(self.room_connections[room_id])
@@ -481,6 +520,7 @@ class WebSocketManager:
             "total_connections": len(self.active_connections),
             "total_rooms": len(self.room_connections),
             "users_in_rooms": len(self.user_rooms),
+            "pubsub": self.pubsub_bridge.get_stats(),
             "room_stats": {
                 room_id: len(user_ids) 
                 for room_id, user_ids in self.room_connections.items()
@@ -502,17 +542,65 @@ class WebSocketManager:
             await self._remove_connection(user_id, "핑 응답 실패")
             return False
     
-    async def close_all_connections(self):
-        """모든 연결 종료 (서버 종료시 사용)"""
+    async def issue_resume_token(self, connection: WebSocketConnection) -> str:
+        """다른 노드에서 세션을 이어가기 위한 재접속 토큰 발급"""
+        token = secrets.token_urlsafe(24)
+        data = {
+            "user_id": connection.user_id,
+            "nickname": connection.nickname,
+            "room_id": self.user_rooms.get(connection.user_id)
+        }
+        self.redis_manager.redis.setex(f"{self.resume_prefix}{token}", self.resume_ttl, json.dumps(data, ensure_ascii=False))
+        return token
+    
+    async def consume_resume_token(self, token: str, user_id: int) -> Optional[str]:
+        """재접속 토큰 확인 후 이어갈 룸 ID 반환 (일회용)"""
+        try:
+            key = f"{self.resume_prefix}{token}"
+            pipe = self.redis_manager.redis.pipeline()
+            pipe.get(key)
+            pipe.delete(key)
+            data, _ = pipe.execute()
+            if not data:
+                return None
+            
+            session = json.loads(data)
+            if session.get("user_id") != user_id:
+                logger.warning(f"다른 사용자의 재접속 토큰 사용 시도: user_id={user_id}")
+                return None
+            return session.get("room_id")
+        except Exception as e:
+            logger.error(f"재접속 토큰 확인 실패 (user_id={user_id}): {e}")
+            return None
+    
+    async def close_all_connections(self, resume: bool = False):
+        """모든 연결 종료 (서버 종료시 사용, resume이면 재접속 토큰 전달 후 종료)"""
         user_ids = list(self.active_connections.keys())
         
         for user_id in user_ids:
+            connection = self.active_connections.get(user_id)
+            if resume and connection:
+                try:
+                    token = await self.issue_resume_token(connection)
+                    await connection.send_json({
+                        "type": "server_draining",
+                        "data": {
+                            "resume_token": token,
+                            "room_id": self.user_rooms.get(user_id),
+                            "expires_in": self.resume_ttl,
+                            "message": "서버 업데이트 중입니다. 자동으로 다시 연결됩니다"
+                        }
+                    })
+                except Exception as e:
+                    logger.error(f"재접속 토큰 전달 실패 (user_id={user_id}): {e}")
             await self._remove_connection(user_id, "서버 종료")
         
         # 정리 작업 취소
         if self._cleanup_task and not self._cleanup_task.done():
             self._cleanup_task.cancel()
         
+        await self.pubsub_bridge.stop()
+        
         logger.info("모든 WebSocket 연결이 종료되었습니다")
 
 
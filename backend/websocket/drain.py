@@ -0,0 +1,128 @@
+"""
+배포 드레인 관리자
+신규 연결 차단, 진행 중인 게임 액션 완료 대기, 룸 담당 인계,
+재접속 토큰 전달 후 연결 종료
+"""
+
+import os
+import asyncio
+import logging
+from enum import Enum
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional
+from websocket.connection_manager import WebSocketManager
+
+logger = logging.getLogger(__name__)
+
+
+class DrainPhase(str, Enum):
+    """드레인 단계"""
+    IDLE = "idle"
+    REJECTING = "rejecting"        # 신규 연결 차단
+    TURN_BOUNDARY = "turn_boundary"  # 처리 중인 게임 액션 완료 대기
+    HANDOFF = "handoff"            # 타이머 해제 및 룸 담당 인계
+    NOTIFYING = "notifying"        # 재접속 토큰 전달 및 연결 종료
+    DRAINED = "drained"
+
+
+class DrainCoordinator:
+    """배포 드레인 관리자"""
+
+    def __init__(self, websocket_manager: WebSocketManager):
+        self.websocket_manager = websocket_manager
+        self.timeout = float(os.getenv("DRAIN_TIMEOUT", "20"))
+        self.phase = DrainPhase.IDLE
+        self.started_at: Optional[datetime] = None
+        self.finished_at: Optional[datetime] = None
+        self.progress = {
+            "connections_at_start": 0,
+            "inflight_actions": 0,
+            "timers_released": 0,
+            "connections_notified": 0
+        }
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> bool:
+        """드레인 시작 (이미 진행 중이면 False)"""
+        if self.phase != DrainPhase.IDLE:
+            return False
+        self.started_at = datetime.now(timezone.utc)
+        self._task = asyncio.create_task(self._run())
+        return True
+
+    async def wait(self):
+        """드레인 완료 대기"""
+        if self._task:
+            await self._task
+
+    def _get_inflight_actions(self) -> int:
+        """이 노드에서 처리 중인 게임 액션 수"""
+        from websocket.websocket_endpoint import websocket_protocol
+        router = websocket_protocol.message_router
+        return router.inflight_actions if router else 0
+
+    async def _run(self):
+        """드레인 단계 실행"""
+        from websocket.game_handler import get_game_handler
+        from websocket.room_affinity import get_room_affinity
+
+        manager = self.websocket_manager
+        affinity = get_room_affinity(manager)
+        deadline = asyncio.get_running_loop().time() + self.timeout
+
+        try:
+            # 1. 신규 연결 차단
+            self.phase = DrainPhase.REJECTING
+            manager.draining = True
+            self.progress["connections_at_start"] = len(manager.active_connections)
+            logger.info(f"드레인 시작: 연결 {self.progress['connections_at_start']}개")
+
+            # 2. 진행 중인 단어 제출/아이템 사용 등이 끝날 때까지 대기 (턴 경계)
+            self.phase = DrainPhase.TURN_BOUNDARY
+            while asyncio.get_running_loop().time() < deadline:
+                self.progress["inflight_actions"] = self._get_inflight_actions()
+                if self.progress["inflight_actions"] == 0:
+                    break
+                await asyncio.sleep(0.05)
+
+            # 3. 로컬 타이머를 내려놓고 링에서 빠져 다른 워커가 Redis 타이머를 인수
+            self.phase = DrainPhase.HANDOFF
+            game_handler = get_game_handler(manager)
+            self.progress["timers_released"] = await game_handler.release_turn_timers(lambda room_id: True)
+            await affinity.leave_ring()
+
+            # 4. 재접속 토큰 전달 후 연결 종료
+            self.phase = DrainPhase.NOTIFYING
+            self.progress["connections_notified"] = len(manager.active_connections)
+            await manager.close_all_connections(resume=True)
+            await affinity.stop()
+
+        except Exception as e:
+            logger.error(f"드레인 중 오류: {e}")
+        finally:
+            self.phase = DrainPhase.DRAINED
+            self.finished_at = datetime.now(timezone.utc)
+            logger.info(f"드레인 완료: {self.progress}")
+
+    def get_status(self) -> Dict[str, Any]:
+        """드레인 진행 상황"""
+        return {
+            "phase": self.phase.value,
+            "draining": self.phase != DrainPhase.IDLE,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "connections_remaining": len(self.websocket_manager.active_connections),
+            **self.progress
+        }
+
+
+# 전역 드레인 관리자 인스턴스
+drain_coordinator: Optional[DrainCoordinator] = None
+
+
+def get_drain_coordinator(websocket_manager: WebSocketManager) -> DrainCoordinator:
+    """드레인 관리자 의존성"""
+    global drain_coordinator
+    if drain_coordinator is None:
+        drain_coordinator = DrainCoordinator(websocket_manager)
+    return drain_coordinator
@@ -3,9 +3,11 @@
 게임 로직 처리, 단어 검증, 아이템 사용, 점수 계산
 """
 
+import time
+import uuid
 import asyncio
 import logging
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Dict, Any, Optional, List, Tuple, Callable
 from datetime import datetime, timezone, timedelta
 from sqlalchemy import select
 from database import get_db
@@ -14,12 +16,14 @@ from models.user_models import UserItem
 from redis_models import RedisGameManager, GameState
 from database import get_redis
 from websocket.connection_manager import WebSocketManager
-from services.game_engine import get_game_engine
+from services.game_engine import get_game_engine, GameEndReason
 from services.word_validator import get_word_validator
 from services.timer_service import get_timer_service
 from services.score_calculator import get_score_calculator
 from services.item_service import get_item_service
 from services.game_mode_service import get_game_mode_service
+from services.audit_log_writer import get_audit_log_writer
+from services.game_finalizer import get_game_finalizer
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +53,12 @@ class GameEventHandler:
         self.score_calculator = get_score_calculator()
         self.item_service = get_item_service()
         self.game_mode_service = get_game_mode_service()
+        self.audit_log = get_audit_log_writer()
+        self.finalizer = get_game_finalizer()
+        self.finalizer.on_items_dropped = self._notify_item_drops
+        
+        # 룸별 턴 시작 시각 (단어 제출 응답 시간 측정용)
+        self.turn_started_at: Dict[str, float] = {}
         
         # 룸별 활성 타이머 태스크 추적
         self.active_timer_tasks: Dict[str, asyncio.Task] = {}
@@ -279,6 +289,7 @@ class GameEventHandler:
             from redis_models import GameStatus
             game_state.status = GameStatus.PLAYING.value
             game_state.started_at = datetime.now(timezone.utc).isoformat()
+            game_state.session_id = str(uuid.uuid4())
             game_state.current_turn = 0  # 첫 번째 플레이어부터 시작
             
             # 게임 상태 저장
@@ -305,7 +316,7 @@ class GameEventHandler:
             
             # 게임 엔진을 통한 단어 제출
             success, message, word_info, score_breakdown = await self.game_engine.submit_word(
-                room_id, user_id, word
+                room_id, user_id, word, response_time_ms=self._get_response_time_ms(room_id)
             )
             
             # 응답 시간 계산
@@ -405,6 +416,16 @@ class GameEventHandler:
                 if updated_game_state:
                     await self._broadcast_game_state(room_id, updated_game_state)
                 
+                self.audit_log.record_event(
+                    game_state.session_id, user_id, "item_use",
+                    {
+                        "item_id": item_id,
+                        "target_user_id": target_user_id,
+                        "effect_type": use_result.effect.effect_type if use_result.effect else None
+                    },
+                    round_number=game_state.current_round
+                )
+                
                 logger.info(f"아이템 사용 성공: user_id={user_id}, item_id={item_id}, effect={use_result.effect.effect_type if use_result.effect else None}")
             else:
                 # 아이템 사용 실패 알림
@@ -552,6 +573,8 @@ class GameEventHandler:
             await self.timer_service.cleanup_room_timers(room_id)
             if room_id in self.active_timers:
                 del self.active_timers[room_id]
+            self.turn_started_at.pop(room_id, None)
+            await self.item_service.clear_room_effects(room_id)
         except Exception as e:
             logger.error(f"룸 타이머 정리 중 오류: {e}")
     
@@ -589,51 +612,22 @@ class GameEventHandler:
             # 모든 타이머 정리
             await self.cleanup_room_timers(room_id)
             
-            # 게임 엔진을 통한 게임 종료
-            success, message, final_results = await self.game_engine.end_game(room_id, reason)
+            # 게임 엔진을 통한 게임 종료 (기록과 아이템 드롭은 백그라운드에서 처리 후 개별 알림)
+            game_state = await self.game_engine.get_game_state(room_id)
+            success = await self.game_engine.end_game(room_id, GameEndReason.ADMIN_END, reason)
             
             if success:
-                # 플레이어들에게 아이템 드롭
-                item_drops = {}
-                if final_results and "players" in final_results:
-                    for player_result in final_results["players"]:
-                        user_id = player_result.get("user_id")
-                        if user_id:
-                            # 게임 성과 기반 아이템 드롭
-                            performance = {
-                                "score": player_result.get("score", 0),
-                                "rank": player_result.get("rank", len(final_results["players"])),
-                                "max_combo": player_result.get("max_combo", 0),
-                                "accuracy": player_result.get("accuracy", 0.0),
-                                "words_submitted": player_result.get("words_submitted", 0)
-                            }
-                            
-                            dropped_item = await self.item_service.drop_random_item(user_id, performance)
-                            if dropped_item:
-                                item_drops[user_id] = dropped_item.to_dict()
-                
-                # 게임 종료 알림 (아이템 드롭 정보 포함)
+                final_results = game_state.get_final_rankings() if game_state else []
                 await self.websocket_manager.broadcast_to_room(room_id, {
                     "type": "game_ended",
                     "data": {
                         "reason": reason,
-                        "message": message,
-                        "final_results": final_results,
-                        "item_drops": item_drops
+                        "message": reason,
+                        "final_results": final_results
                     }
                 })
                 
-                # 개별 아이템 드롭 알림
-                for user_id, item_info in item_drops.items():
-                    await self.websocket_manager.send_to_user(user_id, {
-                        "type": "item_dropped",
-                        "data": {
-                            "item": item_info,
-                            "message": f"새로운 아이템을 획득했습니다: {item_info['name']}"
-                        }
-                    })
-                
-                logger.info(f"게임 종료 완료: room_id={room_id}, reason={reason}, drops={len(item_drops)}")
+                logger.info(f"게임 종료 완료: room_id={room_id}, reason={reason}")
             
             return success
             
@@ -641,6 +635,19 @@ class GameEventHandler:
             logger.error(f"게임 종료 처리 중 오류: {e}")
             return False
     
+    async def _notify_item_drops(self, room_id: str, drops: Dict[int, Item]):
+        """게임 기록이 커밋된 뒤 드롭된 아이템 개별 알림"""
+        for user_id, item in drops.items():
+            item_info = item.to_dict()
+            await self.websocket_manager.send_to_user(user_id, {
+                "type": "item_dropped",
+                "data": {
+                    "room_id": room_id,
+                    "item": item_info,
+                    "message": f"새로운 아이템을 획득했습니다: {item_info['name']}"
+                }
+            })
+    
     async def handle_get_game_stats(self, room_id: str, user_id: int) -> Dict[str, Any]:
         """게임 통계 요청 처리"""
         try:
@@ -903,20 +910,28 @@ class GameEventHandler:
     
     async def get_item_multipliers(self, room_id: str, user_id: int) -> float:
         """사용자의 활성 아이템 점수 배수 조회"""
+        multipliers = await self.get_room_item_multipliers(room_id)
+        return multipliers.get(user_id, 1.0)
+    
+    async def get_room_item_multipliers(self, room_id: str) -> Dict[int, float]:
+        """룸 전체 사용자의 활성 아이템 점수 배수를 한 번에 조회 (효과가 없는 사용자는 생략)"""
         try:
-            active_effects = await self.item_service.get_active_effects(room_id, user_id)
-            total_multiplier = 1.0
+            room_effects = await self.item_service.get_room_effects(room_id)
+            multipliers = {}
             
-            for effect in active_effects:
-                if effect.effect.effect_type == "score_multiply":
-                    multiplier = effect.effect.value.get("multiplier", 1.0)
-                    total_multiplier *= multiplier
+            for user_id, active_effects in room_effects.items():
+                total_multiplier = 1.0
+                for effect in active_effects:
+                    if effect.effect.effect_type == "score_multiply":
+                        multiplier = effect.effect.value.get("multiplier", 1.0)
+                        total_multiplier *= multiplier
+                multipliers[user_id] = min(total_multiplier, 5.0)  # 최대 5배 제한
             
-            return min(total_multiplier, 5.0)  # 최대 5배 제한
+            return multipliers
             
         except Exception as e:
             logger.error(f"아이템 배수 조회 중 오류: {e}")
-            return 1.0
+            return {}
     
     async def handle_word_submission(self, room_id: str, user_id: int, word: str) -> bool:
         """단어 제출 처리"""
@@ -963,7 +978,7 @@ class GameEventHandler:
             
             # 게임 엔진의 완전한 단어 검증 사용
             success, message, word_info, score_breakdown = await self.game_engine.submit_word(
-                room_id, user_id, word
+                room_id, user_id, word, response_time_ms=self._get_response_time_ms(room_id)
             )
             
             if not success:
@@ -1021,6 +1036,13 @@ class GameEventHandler:
             })
             return False
     
+    def _get_response_time_ms(self, room_id: str) -> Optional[int]:
+        """현재 턴 시작 후 경과 시간 (밀리초, 이 프로세스에서 시작한 턴이 아니면 None)"""
+        started_at = self.turn_started_at.get(room_id)
+        if started_at is None:
+            return None
+        return int((time.monotonic() - started_at) * 1000)
+    
     async def _start_turn_timer(self, room_id: str, user_id: int):
         """턴 타이머 시작 (전체 게임 턴 시간 시스템 사용)"""
         try:
@@ -1047,6 +1069,9 @@ class GameEventHandler:
                 logger.error(f"플레이어 없음: user_id={user_id}")
                 return
             
+            # 플레이어가 생각하는 동안 다음 단어 후보를 미리 적재
+            self.word_validator.prefetch_candidates(game_state.word_chain.current_char)
+            
             # 현재 턴의 시간 제한 사용 (턴마다 5초씩 감소)
             turn_time_ms = game_state.get_current_turn_time_ms()
             turn_time_seconds = game_state.get_current_turn_time_seconds()
@@ -1074,6 +1099,7 @@ class GameEventHandler:
             )
             
             await self.redis_manager.save_timer(room_id, timer)
+            self.turn_started_at[room_id] = time.monotonic()
             
             # 타이머 시작 브로드캐스트
             await self.websocket_manager.broadcast_to_room(room_id, {
@@ -1229,6 +1255,11 @@ class GameEventHandler:
                 }
             })
             
+            # 게임 기록/통계/드롭/리더보드는 백그라운드에서 한 트랜잭션으로 반영 (초기화 전에 내용 확보)
+            self.finalizer.submit(self.finalizer.build_payload(
+                room_id, game_state, final_rankings, GameEndReason.COMPLETED.value
+            ))
+            
             # 완전한 게임 상태 초기화 (새 게임 준비)
             game_state.reset_game_state_for_new_game()
             await self.redis_manager.save_game_state(game_state)
@@ -1359,10 +1390,9 @@ class GameEventHandler:
                 del self.active_timer_tasks[task_key]
                 logger.info(f"asyncio 타이머 태스크 취소: {task_key}")
             
-            # Redis에서 타이머 삭제
-            timer_key = f"timer:{room_id}"
-            deleted_count = await self.redis_manager.redis.delete(timer_key)
-            logger.info(f"Redis 타이머 삭제: {timer_key}, 삭제된 키: {deleted_count}개")
+            # Redis에서 타이머 및 만료 인덱스 삭제
+            deleted_count = await self.redis_manager.delete_timers([room_id])
+            logger.info(f"Redis 타이머 삭제: room_id={room_id}, 삭제된 키: {deleted_count}개")
             
             # 타이머 서비스에서 방 타이머 모두 정리
             await self.timer_service.cancel_room_timers(room_id)
@@ -1372,6 +1402,75 @@ class GameEventHandler:
         except Exception as e:
             logger.error(f"턴 타이머 취소 중 오류: {e}")
     
+    async def recover_turn_timers(self, batch_size: int = 500, max_concurrency: int = 50,
+                                  room_filter: Optional[Callable[[str], bool]] = None) -> Dict[str, int]:
+        """서버 재시작 후 Redis 만료 인덱스에서 턴 타이머 복구 (room_filter로 담당 룸만 선택)"""
+        stats = {"resumed": 0, "expired": 0, "stale": 0}
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def expire_turn(room_id: str, user_id: int):
+            # 이미 만료된 턴은 동시 처리 수를 제한하여 순차 정리
+            async with semaphore:
+                await self._handle_turn_timeout(room_id, user_id)
+        
+        cursor = 0
+        while True:
+            cursor, entries = await self.redis_manager.scan_timer_index(cursor, batch_size)
+            deadlines = {
+                room_id: deadline for room_id, deadline in entries
+                if room_filter is None or room_filter(room_id)
+            }
+            now_ms = int(datetime.now(timezone.utc).timestamp() * 1000)
+            stale_rooms = []
+            
+            for room_id, timer, game_state in await self.redis_manager.get_timers_with_states(list(deadlines)):
+                current_player = game_state.get_current_player() if game_state else None
+                if not game_state or game_state.status != "playing" or not current_player:
+                    stale_rooms.append(room_id)
+                    continue
+                
+                # 타이머 본문이 TTL로 사라졌어도 인덱스의 만료 시각으로 복구
+                user_id = timer.current_player_id if timer else current_player.user_id
+                if user_id != current_player.user_id:
+                    stale_rooms.append(room_id)
+                    continue
+                
+                task_key = f"timer_task_{room_id}"
+                if task_key in self.active_timer_tasks and not self.active_timer_tasks[task_key].done():
+                    continue
+                
+                remaining_seconds = (deadlines[room_id] - now_ms) / 1000
+                if remaining_seconds > 0:
+                    task = asyncio.create_task(self._turn_timer_task(room_id, user_id, remaining_seconds))
+                    stats["resumed"] += 1
+                else:
+                    task = asyncio.create_task(expire_turn(room_id, user_id))
+                    stats["expired"] += 1
+                self.active_timer_tasks[task_key] = task
+            
+            if stale_rooms:
+                await self.redis_manager.delete_timers(stale_rooms)
+                stats["stale"] += len(stale_rooms)
+            
+            if cursor == 0:
+                break
+        
+        logger.info(f"턴 타이머 복구 완료: 재개={stats['resumed']}, 만료 처리={stats['expired']}, 정리={stats['stale']}")
+        return stats
+    
+    async def release_turn_timers(self, room_filter: Callable[[str], bool]) -> int:
+        """담당하지 않게 된 룸의 로컬 타이머 태스크 정리 (Redis 타이머는 새 담당 워커가 복구)"""
+        released = 0
+        for task_key, task in list(self.active_timer_tasks.items()):
+            room_id = task_key[len("timer_task_"):]
+            if not room_filter(room_id):
+                continue
+            if not task.done():
+                task.cancel()
+            del self.active_timer_tasks[task_key]
+            released += 1
+        return released
+    
     async def handle_advanced_leave_room(self, room_id: str, user_id: int, nickname: str) -> tuple[bool, str]:
         """고도화된 방 나가기 처리"""
         try:
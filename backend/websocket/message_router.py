@@ -9,6 +9,7 @@ from typing import Dict, Any, Callable, Optional, List
 from enum import Enum
 from pydantic import BaseModel, ValidationError
 from websocket.connection_manager import WebSocketManager, WebSocketConnection
+from websocket.room_affinity import get_room_affinity
 from auth import AuthService
 
 logger = logging.getLogger(__name__)
@@ -67,6 +68,13 @@ class MessageRouter:
             MessageType.START_GAME,
             MessageType.CHAT_MESSAGE
         }
+        
+        # 처리 중인 게임 액션 수 (드레인 시 턴 경계 대기용)
+        self.inflight_actions = 0
+        
+        # 룸 담당 워커로 게임 액션 전달
+        self.room_affinity = get_room_affinity(websocket_manager)
+        self.room_affinity.set_action_handler(self.handle_forwarded_action)
     
     def _register_handlers(self):
         """핸들러 등록"""
@@ -90,6 +98,10 @@ class MessageRouter:
     async def route_message(self, connection: WebSocketConnection, raw_message: Dict[str, Any]) -> bool:
         """메시지 라우팅"""
         try:
+            # 다른 워커(엔진)가 담당하는 룸의 게임 액션은 파싱 없이 원본 프레임 그대로 전달
+            if connection.room_id and await self.room_affinity.forward_if_remote(connection, raw_message):
+                return True
+            
             # 메시지 검증
             message = BaseMessage(**raw_message)
             
@@ -105,8 +117,16 @@ class MessageRouter:
                     await self._send_error(connection, "권한이 없습니다")
                     return False
             
-            # 핸들러 실행
-            result = await handler(connection, message)
+            # 핸들러 실행 (게임 액션은 전달된 액션과 같은 룸 잠금 안에서 처리)
+            self.inflight_actions += 1
+            try:
+                if connection.room_id and message.type.value in self.room_affinity.forwarded_actions:
+                    async with self.room_affinity.room_lock(connection.room_id):
+                        result = await handler(connection, message)
+                else:
+                    result = await handler(connection, message)
+            finally:
+                self.inflight_actions -= 1
             
             # 성공 응답 (요청 ID가 있는 경우)
             if result and message.request_id:
@@ -127,6 +147,38 @@ class MessageRouter:
             await self._send_error(connection, "메시지 처리 중 오류가 발생했습니다")
             return False
     
+    async def handle_forwarded_action(self, connection, raw_message: Dict[str, Any]) -> bool:
+        """다른 워커에서 전달된 게임 액션 처리 (이 워커가 룸 담당)"""
+        try:
+            message = BaseMessage(**raw_message)
+        except ValidationError as e:
+            logger.warning(f"전달된 메시지 검증 실패 (user_id={connection.user_id}): {e}")
+            await self._send_error(connection, "올바르지 않은 메시지 형식입니다")
+            return False
+        
+        handler = self.handlers.get(message.type)
+        if not handler:
+            await self._send_error(connection, f"지원하지 않는 메시지 타입: {message.type}")
+            return False
+        
+        if message.type in self.auth_required_actions:
+            if not await self._check_permissions(connection, message.type):
+                await self._send_error(connection, "권한이 없습니다")
+                return False
+        
+        self.inflight_actions += 1
+        try:
+            result = await handler(connection, message)
+        finally:
+            self.inflight_actions -= 1
+        if result and message.request_id:
+            await connection.send_json({
+                "type": MessageType.SUCCESS,
+                "data": {"message": "처리 완료"},
+                "request_id": message.request_id
+            })
+        return result
+    
     async def _check_permissions(self, connection: WebSocketConnection, action: MessageType) -> bool:
         """권한 확인"""
         try:
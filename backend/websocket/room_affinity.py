@@ -0,0 +1,364 @@
+"""
+룸 친화성 라우팅
+일관된 해싱으로 룸별 담당 워커 지정, Redis 하트비트 기반 워커 목록 관리,
+담당 워커로 게임 액션 전달, 워커 변경 시 타이머 인계
+"""
+
+import os
+import json
+import time
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from typing import Dict, Optional, Any, Callable, Awaitable, Tuple
+from database import get_redis, get_async_redis
+from utils.hash_ring import ConsistentHashRing
+
+logger = logging.getLogger(__name__)
+
+
+ActionHandler = Callable[[Any, Dict[str, Any]], Awaitable[bool]]
+
+
+class RemoteConnection:
+    """다른 워커에 연결된 사용자를 대신하는 프록시 연결"""
+
+    def __init__(self, affinity: 'RoomAffinityRouter', origin_node: str, user_id: int,
+                 nickname: str, room_id: Optional[str]):
+        self.affinity = affinity
+        self.origin_node = origin_node
+        self.user_id = user_id
+        self.nickname = nickname
+        self.room_id = room_id
+        self.is_active = True
+
+    async def send_json(self, data: Dict[str, Any]) -> bool:
+        """원래 워커를 거쳐 사용자에게 전송"""
+        return await self.affinity.send_to_node(self.origin_node, self.user_id, data)
+
+    def update_ping(self):
+        """원격 연결은 핑을 원래 워커가 관리"""
+        pass
+
+
+class RoomAffinityRouter:
+    """룸 담당 워커 라우터"""
+
+    def __init__(self, websocket_manager):
+        self.websocket_manager = websocket_manager
+        bridge = websocket_manager.pubsub_bridge
+        self.node_id = bridge.node_id
+        self.enabled = (
+            os.getenv("ROOM_AFFINITY_ENABLED", "true").lower() == "true" and bridge.enabled
+        )
+        # all: 연결+게임 처리, gateway: WebSocket 종단만 (링 미참여), engine: 게임 처리만
+        self.role = os.getenv("KKUA_ROLE", "all").lower()
+
+        self.ring = ConsistentHashRing()
+        self.heartbeat_key = "workers:heartbeat"  # node_id -> 마지막 하트비트(epoch ms)
+        self.channel_prefix = "ws:worker:"
+        self.user_broadcast_channel = "ws:workers:user"  # 연결 워커를 모르는 사용자 메시지
+        self.heartbeat_interval = 2.0
+        self.heartbeat_ttl_ms = 6000
+
+        # 담당 워커에서만 처리해야 하는 게임 상태 변경 액션
+        self.forwarded_actions = {"submit_word", "use_item", "ready_game", "start_game"}
+
+        self.remote_users: Dict[int, Tuple[str, float]] = {}  # user_id -> (연결된 워커, 마지막 액션 시각)
+        self.remote_user_ttl = float(os.getenv("ROOM_AFFINITY_REMOTE_USER_TTL", "600"))
+        self._room_locks: Dict[str, asyncio.Lock] = {}
+        self._room_pending: Dict[str, int] = {}
+        self._action_handler: Optional[ActionHandler] = None
+        self._pubsub = None
+        self._heartbeat_task: Optional[asyncio.Task] = None
+        self._listener_task: Optional[asyncio.Task] = None
+        self.stats = {
+            "forwarded": 0, "received": 0, "replies": 0, "fanout_replies": 0,
+            "ring_changes": 0, "evicted": 0, "errors": 0
+        }
+
+        # 담당 워커에서 보내는 개인 메시지를 원래 워커로 전달
+        websocket_manager.remote_sender = self.send_to_remote_user
+
+    def set_action_handler(self, handler: ActionHandler):
+        """전달받은 액션을 처리할 핸들러 등록"""
+        self._action_handler = handler
+
+    def _channel(self, node_id: str) -> str:
+        """워커 채널 이름"""
+        return f"{self.channel_prefix}{node_id}"
+
+    # === 워커 목록 및 담당 판정 ===
+
+    @property
+    def is_gateway(self) -> bool:
+        """게이트웨이 역할 여부"""
+        return self.role == "gateway"
+
+    def get_owner(self, room_id: str) -> Optional[str]:
+        """룸 담당 워커 조회"""
+        if not self.enabled or not room_id:
+            return None
+        return self.ring.get_node(room_id)
+
+    def is_owner(self, room_id: str) -> bool:
+        """이 워커가 룸을 담당하는지 확인 (링이 비어 있으면 로컬 처리)"""
+        owner = self.get_owner(room_id)
+        return owner is None or owner == self.node_id
+
+    async def _refresh_membership(self) -> bool:
+        """하트비트 기록 및 살아있는 워커 목록 갱신"""
+        now_ms = int(datetime.now(timezone.utc).timestamp() * 1000)
+        pipe = get_redis().pipeline()
+        if not self.is_gateway:
+            pipe.zadd(self.heartbeat_key, {self.node_id: now_ms})
+        pipe.zremrangebyscore(self.heartbeat_key, 0, now_ms - self.heartbeat_ttl_ms)
+        pipe.zrange(self.heartbeat_key, 0, -1)
+        nodes = pipe.execute()[-1]
+        return self.ring.set_nodes(nodes)
+
+    async def _heartbeat_loop(self):
+        """주기적 하트비트 및 워커 변경 감지"""
+        while True:
+            try:
+                await asyncio.sleep(self.heartbeat_interval)
+                if await self._refresh_membership():
+                    await self._handle_ring_change()
+                self._prune_remote_users()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.error(f"워커 하트비트 중 오류: {e}")
+
+    async def _handle_ring_change(self):
+        """워커 변경 시 룸 담당 인계"""
+        self.stats["ring_changes"] += 1
+        logger.info(f"워커 링 변경: nodes={self.ring.nodes}")
+
+        from websocket.game_handler import get_game_handler
+        game_handler = get_game_handler(self.websocket_manager)
+
+        if self.is_gateway:
+            return
+
+        # 더 이상 담당하지 않는 룸의 타이머는 내려놓고, 새로 맡은 룸은 Redis에서 복구
+        released = await game_handler.release_turn_timers(lambda room_id: not self.is_owner(room_id))
+        stats = await game_handler.recover_turn_timers(room_filter=self.is_owner)
+        logger.info(f"룸 인계 완료: 해제={released}, 인수={stats['resumed'] + stats['expired']}")
+
+    # === 액션 전달 ===
+
+    async def forward_if_remote(self, connection, message: Dict[str, Any]) -> bool:
+        """담당 워커가 다른 노드면 액션을 전달하고 True 반환 (받은 워커가 없으면 담당을 다시 정함)"""
+        if not self.enabled or message.get("type") not in self.forwarded_actions:
+            return False
+
+        owner = self.get_owner(connection.room_id)
+        try:
+            envelope = json.dumps({
+                "k": "action",
+                "o": self.node_id,
+                "u": connection.user_id,
+                "n": connection.nickname,
+                "r": connection.room_id,
+                "m": message
+            }, ensure_ascii=False, default=str)
+            while owner is not None and owner != self.node_id:
+                if get_redis().publish(self._channel(owner), envelope) > 0:
+                    self.stats["forwarded"] += 1
+                    return True
+                # 하트비트가 만료되기 전에 죽은 워커 (수신자 없음): 링에서 빼고 새 담당 워커로
+                await self._evict_node(owner)
+                owner = self.get_owner(connection.room_id)
+            return False
+        except Exception as e:
+            # 전달 실패 시 로컬에서 처리
+            self.stats["errors"] += 1
+            logger.error(f"액션 전달 실패 (room_id={connection.room_id}, owner={owner}): {e}")
+            return False
+
+    async def _evict_node(self, node_id: str):
+        """채널을 구독하지 않는 워커를 링과 하트비트 목록에서 제거한 뒤 룸 담당 인계"""
+        self.stats["evicted"] += 1
+        logger.warning(f"수신자 없는 워커를 링에서 제거: node_id={node_id}")
+        try:
+            get_redis().zrem(self.heartbeat_key, node_id)
+        except Exception as e:
+            logger.error(f"워커 하트비트 제거 실패: {e}")
+        if node_id in self.ring:
+            self.ring.remove_node(node_id)
+            await self._handle_ring_change()
+
+    async def send_to_node(self, node_id: str, user_id: int, message: Dict[str, Any]) -> bool:
+        """다른 워커에 연결된 사용자에게 메시지 전송"""
+        try:
+            envelope = json.dumps({"k": "user", "u": user_id, "m": message}, ensure_ascii=False, default=str)
+            get_redis().publish(self._channel(node_id), envelope)
+            self.stats["replies"] += 1
+            return True
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.error(f"원격 사용자 메시지 전송 실패 (user_id={user_id}): {e}")
+            return False
+
+    async def send_to_remote_user(self, user_id: int, message: Dict[str, Any]) -> bool:
+        """최근 액션을 전달한 워커를 통해 사용자에게 전송 (모르면 모든 워커에 발행해 연결된 워커가 전달)"""
+        if not self.enabled:
+            return False
+        entry = self.remote_users.get(user_id)
+        if entry:
+            return await self.send_to_node(entry[0], user_id, message)
+        try:
+            envelope = json.dumps({"k": "user", "u": user_id, "m": message}, ensure_ascii=False, default=str)
+            get_redis().publish(self.user_broadcast_channel, envelope)
+            self.stats["fanout_replies"] += 1
+            return True
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.error(f"원격 사용자 메시지 발행 실패 (user_id={user_id}): {e}")
+            return False
+
+    def _prune_remote_users(self):
+        """한동안 액션을 전달하지 않은 원격 사용자 정리"""
+        cutoff = time.monotonic() - self.remote_user_ttl
+        expired = [user_id for user_id, (_, seen_at) in self.remote_users.items() if seen_at < cutoff]
+        for user_id in expired:
+            del self.remote_users[user_id]
+
+    async def _listen(self):
+        """이 워커 채널 수신 루프"""
+        while True:
+            try:
+                raw = await self._pubsub.get_message(timeout=1.0)
+                if raw and raw.get("type") == "message":
+                    await self._dispatch(json.loads(raw["data"]))
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.error(f"워커 채널 수신 중 오류: {e}")
+                await asyncio.sleep(1)
+
+    async def _dispatch(self, envelope: Dict[str, Any]):
+        """수신한 전달 메시지 처리"""
+        if envelope.get("k") == "user":
+            user_id = envelope["u"]
+            if user_id in self.websocket_manager.active_connections:
+                await self.websocket_manager.send_to_user(user_id, envelope["m"])
+            return
+
+        if envelope.get("k") == "action" and self._action_handler:
+            self.stats["received"] += 1
+            self.remote_users[envelope["u"]] = (envelope["o"], time.monotonic())
+            connection = RemoteConnection(self, envelope["o"], envelope["u"], envelope["n"], envelope["r"])
+            asyncio.create_task(self._run_action(connection, envelope["m"]))
+
+    @asynccontextmanager
+    async def room_lock(self, room_id: str):
+        """룸 단위 단일 처리 구간 (로컬/전달 액션 모두 같은 잠금을 거쳐 순서대로 처리)"""
+        lock = self._room_locks.setdefault(room_id, asyncio.Lock())
+        self._room_pending[room_id] = self._room_pending.get(room_id, 0) + 1
+        try:
+            async with lock:
+                yield
+        finally:
+            self._room_pending[room_id] -= 1
+            if self._room_pending[room_id] == 0:
+                del self._room_pending[room_id]
+                del self._room_locks[room_id]
+
+    async def _run_action(self, connection: RemoteConnection, message: Dict[str, Any]):
+        """룸 단위 순서를 보장하며 액션 처리"""
+        room_id = connection.room_id
+        try:
+            async with self.room_lock(room_id):
+                await self._action_handler(connection, message)
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.error(f"전달된 액션 처리 중 오류 (room_id={room_id}): {e}")
+
+    # === 생명주기 ===
+
+    async def start(self):
+        """하트비트 및 워커 채널 수신 시작"""
+        if not self.enabled or self._listener_task:
+            return
+        try:
+            await self._refresh_membership()
+            self._pubsub = get_async_redis().pubsub(ignore_subscribe_messages=True)
+            await self._pubsub.subscribe(self._channel(self.node_id), self.user_broadcast_channel)
+            self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
+            self._listener_task = asyncio.create_task(self._listen())
+            logger.info(f"룸 친화성 라우팅 시작: node_id={self.node_id}, role={self.role}, nodes={self.ring.nodes}")
+        except Exception as e:
+            # Redis를 쓸 수 없으면 모든 룸을 로컬에서 처리
+            self.enabled = False
+            logger.error(f"룸 친화성 라우팅 시작 실패, 로컬 처리로 전환: {e}")
+
+    async def leave_ring(self):
+        """하트비트 중단 및 워커 목록에서 제거 (수신은 유지, 이후 액션은 새 담당 워커로 전달)"""
+        if self._heartbeat_task and not self._heartbeat_task.done():
+            self._heartbeat_task.cancel()
+            try:
+                await self._heartbeat_task
+            except asyncio.CancelledError:
+                pass
+        self._heartbeat_task = None
+
+        if self.enabled and not self.is_gateway:
+            try:
+                pipe = get_redis().pipeline()
+                pipe.zrem(self.heartbeat_key, self.node_id)
+                pipe.zrange(self.heartbeat_key, 0, -1)
+                _, nodes = pipe.execute()
+                self.ring.set_nodes(nodes)
+                logger.info(f"워커 링에서 제거: node_id={self.node_id}, 남은 워커={self.ring.nodes}")
+            except Exception as e:
+                logger.error(f"워커 하트비트 제거 실패: {e}")
+
+    async def stop(self):
+        """하트비트 및 수신 중단 (다른 워커가 즉시 인수)"""
+        await self.leave_ring()
+        if self._listener_task and not self._listener_task.done():
+            self._listener_task.cancel()
+            try:
+                await self._listener_task
+            except asyncio.CancelledError:
+                pass
+        self._listener_task = None
+
+        if self._pubsub is not None:
+            try:
+                await self._pubsub.aclose()
+            except Exception:
+                pass
+            self._pubsub = None
+
+    def get_inflight_actions(self) -> int:
+        """처리 중인 전달 액션 수"""
+        return sum(self._room_pending.values())
+
+    def get_stats(self) -> Dict[str, Any]:
+        """라우팅 통계"""
+        return {
+            "enabled": self.enabled,
+            "node_id": self.node_id,
+            "role": self.role,
+            "nodes": self.ring.nodes,
+            "remote_users": len(self.remote_users),
+            **self.stats
+        }
+
+
+# 전역 룸 친화성 라우터 인스턴스
+room_affinity: Optional[RoomAffinityRouter] = None
+
+
+def get_room_affinity(websocket_manager) -> RoomAffinityRouter:
+    """룸 친화성 라우터 의존성"""
+    global room_affinity
+    if room_affinity is None:
+        room_affinity = RoomAffinityRouter(websocket_manager)
+    return room_affinity
@@ -0,0 +1,172 @@
+"""
+룸 브로드캐스트 Pub/Sub 브리지
+여러 워커 간 룸 메시지 전달, 룸별 참조 카운트 구독, 구독/수신 배치 처리
+"""
+
+import os
+import json
+import uuid
+import asyncio
+import logging
+from typing import Dict, Set, Optional, Any, Callable, Awaitable
+from database import get_redis, get_async_redis
+
+logger = logging.getLogger(__name__)
+
+
+LocalDeliver = Callable[[str, Dict[str, Any], Optional[int]], Awaitable[int]]
+
+
+class RoomPubSubBridge:
+    """Redis Pub/Sub 기반 룸 메시지 브리지"""
+
+    def __init__(self, deliver_local: LocalDeliver):
+        self.deliver_local = deliver_local
+        self.enabled = os.getenv("WS_PUBSUB_ENABLED", "true").lower() == "true"
+        self.node_id = os.getenv("NODE_ID") or uuid.uuid4().hex[:12]
+        self.channel_prefix = "ws:room:"
+        self.flush_interval = 0.05  # 구독 변경 및 수신 배치 주기 (초)
+        self.max_batch = 256
+
+        # 룸별 로컬 구독 참조 카운트
+        self.room_refs: Dict[str, int] = {}
+        self._pending_subscribe: Set[str] = set()
+        self._pending_unsubscribe: Set[str] = set()
+
+        self._pubsub = None
+        self._listener_task: Optional[asyncio.Task] = None
+        self.stats = {"published": 0, "received": 0, "delivered": 0, "batches": 0, "errors": 0}
+
+    def _channel(self, room_id: str) -> str:
+        """룸 채널 이름"""
+        return f"{self.channel_prefix}{room_id}"
+
+    def _ensure_listener(self):
+        """수신 태스크 시작"""
+        if not self.enabled:
+            return
+        if self._listener_task is None or self._listener_task.done():
+            self._pubsub = get_async_redis().pubsub(ignore_subscribe_messages=True)
+            self._listener_task = asyncio.create_task(self._listen())
+
+    def acquire_room(self, room_id: str):
+        """로컬 룸 참가자 추가 시 구독 참조 증가"""
+        count = self.room_refs.get(room_id, 0)
+        self.room_refs[room_id] = count + 1
+        if count == 0 and self.enabled:
+            self._pending_unsubscribe.discard(room_id)
+            self._pending_subscribe.add(room_id)
+            self._ensure_listener()
+
+    def release_room(self, room_id: str):
+        """로컬 룸 참가자 제거 시 구독 참조 감소"""
+        count = self.room_refs.get(room_id, 0)
+        if count <= 1:
+            self.room_refs.pop(room_id, None)
+            if count == 1 and self.enabled:
+                self._pending_subscribe.discard(room_id)
+                self._pending_unsubscribe.add(room_id)
+        else:
+            self.room_refs[room_id] = count - 1
+
+    async def publish(self, room_id: str, message: Dict[str, Any], exclude_user: Optional[int] = None) -> bool:
+        """다른 노드로 룸 메시지 발행 (로컬 전달은 호출자가 직접 수행)"""
+        if not self.enabled:
+            return False
+        try:
+            envelope = json.dumps(
+                {"o": self.node_id, "x": exclude_user, "m": message},
+                ensure_ascii=False, default=str
+            )
+            get_redis().publish(self._channel(room_id), envelope)
+            self.stats["published"] += 1
+            return True
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.error(f"룸 메시지 발행 실패 (room_id={room_id}): {e}")
+            return False
+
+    async def _flush_subscriptions(self):
+        """대기 중인 구독/해제 요청을 한 번의 명령으로 반영"""
+        if self._pending_subscribe:
+            channels = [self._channel(room_id) for room_id in self._pending_subscribe]
+            self._pending_subscribe.clear()
+            await self._pubsub.subscribe(*channels)
+            logger.debug(f"룸 채널 구독: {len(channels)}개")
+
+        if self._pending_unsubscribe:
+            channels = [self._channel(room_id) for room_id in self._pending_unsubscribe]
+            self._pending_unsubscribe.clear()
+            if self._pubsub.subscribed:
+                await self._pubsub.unsubscribe(*channels)
+            logger.debug(f"룸 채널 구독 해제: {len(channels)}개")
+
+    async def _listen(self):
+        """수신 루프 (메시지를 배치로 모아 로컬 소켓에 전달)"""
+        while True:
+            try:
+                await self._flush_subscriptions()
+                if not self._pubsub.subscribed:
+                    await asyncio.sleep(self.flush_interval)
+                    continue
+
+                batch = []
+                message = await self._pubsub.get_message(timeout=self.flush_interval)
+                while message is not None and len(batch) < self.max_batch:
+                    batch.append(message)
+                    message = await self._pubsub.get_message(timeout=0)
+                if message is not None:
+                    batch.append(message)
+
+                if batch:
+                    self.stats["batches"] += 1
+                    for raw in batch:
+                        await self._dispatch(raw)
+
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.error(f"룸 Pub/Sub 수신 중 오류: {e}")
+                await asyncio.sleep(1)
+
+    async def _dispatch(self, raw: Dict[str, Any]):
+        """수신 메시지를 로컬 룸 참가자에게 전달"""
+        if raw.get("type") != "message":
+            return
+
+        envelope = json.loads(raw["data"])
+        if envelope.get("o") == self.node_id:
+            return  # 자기 노드에서 발행한 메시지는 이미 로컬 전달됨
+
+        room_id = raw["channel"][len(self.channel_prefix):]
+        self.stats["received"] += 1
+        if room_id not in self.room_refs:
+            return
+
+        self.stats["delivered"] += await self.deliver_local(room_id, envelope["m"], envelope.get("x"))
+
+    async def stop(self):
+        """수신 태스크 및 구독 정리"""
+        if self._listener_task and not self._listener_task.done():
+            self._listener_task.cancel()
+            try:
+                await self._listener_task
+            except asyncio.CancelledError:
+                pass
+        if self._pubsub is not None:
+            try:
+                await self._pubsub.aclose()
+            except Exception:
+                pass
+            self._pubsub = None
+        self.room_refs.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """브리지 통계"""
+        return {
+            "enabled": self.enabled,
+            "node_id": self.node_id,
+            "subscribed_rooms": len(self.room_refs),
+            **self.stats
+        }
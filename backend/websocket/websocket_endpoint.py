@@ -3,15 +3,18 @@ WebSocket 엔드포인트
 FastAPI WebSocket 엔드포인트와 전체 메시지 프로토콜 통합
 """
 
+import os
+import hmac
 import asyncio
 import json
 import logging
-from typing import Dict, Any
-from fastapi import WebSocket, WebSocketDisconnect, Depends
+from typing import Dict, Any, Optional
+from fastapi import WebSocket, WebSocketDisconnect, Depends, Header, HTTPException
 from fastapi.routing import APIRouter
 from websocket.connection_manager import WebSocketManager, get_websocket_manager, WebSocketConnection
 from websocket.message_router import MessageRouter
 from websocket.game_handler import GameEventHandler, get_game_handler
+from websocket.drain import get_drain_coordinator
 
 logger = logging.getLogger(__name__)
 
@@ -43,7 +46,8 @@ class WebSocketProtocol:
         # Phase 3에서 더 세밀한 통합 예정
         pass
     
-    async def handle_websocket_connection(self, websocket: WebSocket, room_id: str = None, token: str = None):
+    async def handle_websocket_connection(self, websocket: WebSocket, room_id: str = None, token: str = None,
+                                          resume_token: str = None):
         """WebSocket 연결 처리"""
         connection = None
         try:
@@ -59,6 +63,14 @@ class WebSocketProtocol:
             if not connection:
                 return  # 인증 실패로 연결이 종료됨
             
+            # 드레인된 노드에서 넘어온 세션 이어가기
+            if resume_token and not room_id:
+                room_id = await self.websocket_manager.consume_resume_token(resume_token, connection.user_id)
+                if room_id:
+                    await self._resume_session(connection, room_id)
+                    await self._message_loop(connection)
+                    return
+            
             # 룸 참가 (선택적)
             if room_id:
                 join_success = await self.websocket_manager.join_room(connection.user_id, room_id)
@@ -78,6 +90,23 @@ class WebSocketProtocol:
             if connection:
                 await self._cleanup_connection(connection, room_id)
     
+    async def _resume_session(self, connection: WebSocketConnection, room_id: str):
+        """재접속 토큰으로 기존 룸 세션 복원 (입장 알림 없이 현재 상태만 전송)"""
+        await self.websocket_manager.join_room(connection.user_id, room_id)
+        
+        game_state = await self.game_handler.redis_manager.get_game_state(room_id)
+        await connection.send_json({
+            "type": "session_resumed",
+            "data": {
+                "room_id": room_id,
+                "status": game_state.status if game_state else None
+            }
+        })
+        if game_state:
+            await self.game_handler._broadcast_redis_game_state(room_id, game_state)
+        
+        logger.info(f"세션 복원: user_id={connection.user_id}, room_id={room_id}")
+    
     async def _message_loop(self, connection: WebSocketConnection):
         """메시지 수신 및 처리 루프"""
         try:
@@ -150,6 +179,7 @@ websocket_protocol = WebSocketProtocol()
 async def websocket_endpoint(
     websocket: WebSocket,
     token: str = None,
+    resume_token: str = None,
     websocket_manager: WebSocketManager = Depends(get_websocket_manager)
 ):
     """기본 WebSocket 엔드포인트"""
@@ -157,7 +187,7 @@ async def websocket_endpoint(
     if websocket_protocol.websocket_manager is None:
         websocket_protocol.initialize(websocket_manager)
     
-    await websocket_protocol.handle_websocket_connection(websocket, token=token)
+    await websocket_protocol.handle_websocket_connection(websocket, token=token, resume_token=resume_token)
 
 
 @websocket_router.websocket("/ws/rooms/{room_id}")
@@ -186,10 +216,13 @@ async def websocket_stats(websocket_manager: WebSocketManager = Depends(get_webs
         else:
             handler_stats = {}
         
+        from websocket.room_affinity import get_room_affinity
+        
         return {
             "status": "active",
             "connections": connection_stats,
             "handlers": handler_stats,
+            "affinity": get_room_affinity(websocket_manager).get_stats(),
             "protocol_initialized": websocket_protocol.websocket_manager is not None
         }
         
@@ -235,6 +268,27 @@ async def broadcast_to_room(
         return {"status": "error", "message": str(e)}
 
 
+@websocket_router.post("/ws/drain")
+async def start_drain(
+    x_drain_token: Optional[str] = Header(default=None),
+    websocket_manager: WebSocketManager = Depends(get_websocket_manager)
+):
+    """배포 드레인 시작 (관리자용, DRAIN_TOKEN과 같은 X-Drain-Token 헤더 필요, 토큰 미설정 시 거부)"""
+    expected_token = os.getenv("DRAIN_TOKEN")
+    if not expected_token:
+        raise HTTPException(status_code=403, detail="드레인 토큰이 설정되지 않았습니다")
+    if not x_drain_token or not hmac.compare_digest(x_drain_token.encode(), expected_token.encode()):
+        raise HTTPException(status_code=403, detail="드레인 권한이 없습니다")
+    
+    coordinator = get_drain_coordinator(websocket_manager)
+    started = coordinator.start()
+    return {
+        "status": "success",
+        "message": "드레인 시작" if started else "이미 드레인 중입니다",
+        "drain": coordinator.get_status()
+    }
+
+
 # WebSocket 라우터 export
 def get_websocket_router():
     """WebSocket 라우터 반환"""
@@ -0,0 +1,30 @@
+-- 끝말잇기 조회 최적화: 커버링 인덱스와 글자별 통계 구체화 뷰
+
+-- 첫 글자별 빈도순 힌트 조회 (정렬 없이 인덱스만으로 처리)
+CREATE INDEX IF NOT EXISTS idx_korean_dictionary_first_char_freq
+    ON korean_dictionary (first_char, frequency_score DESC) INCLUDE (word);
+
+-- 글자별 시작/끝 단어 수 (사전 변경 시 REFRESH MATERIALIZED VIEW CONCURRENTLY syllable_stats)
+CREATE MATERIALIZED VIEW IF NOT EXISTS syllable_stats AS
+WITH starts AS (
+    SELECT first_char AS syllable, COUNT(*) AS start_count
+    FROM korean_dictionary
+    GROUP BY first_char
+),
+ends AS (
+    SELECT last_char AS syllable, COUNT(*) AS end_count
+    FROM korean_dictionary
+    GROUP BY last_char
+)
+SELECT
+    COALESCE(s.syllable, e.syllable) AS syllable,
+    COALESCE(s.start_count, 0) AS start_count,
+    COALESCE(e.end_count, 0) AS end_count,
+    COALESCE(s.start_count, 0) = 0 AS dead_end  -- 이 글자로 끝나는 단어는 있지만 시작하는 단어는 없음 (두음법칙 미반영)
+FROM starts s
+FULL OUTER JOIN ends e ON s.syllable = e.syllable;
+
+-- CONCURRENTLY 갱신에 필요한 고유 인덱스
+CREATE UNIQUE INDEX IF NOT EXISTS idx_syllable_stats_syllable ON syllable_stats (syllable);
+
+ANALYZE korean_dictionary;